@@ -0,0 +1,234 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+"""
+Performance benchmarks for pycmx.
+
+Each benchmark is run on synthetic EDLs from :mod:`synthetic` and the
+results are written as JSON, so runs from different releases can be
+compared::
+
+    python benchmarks/run.py -n 10000 -n 100000 -o results.json
+    python benchmarks/run.py --compare old.json results.json
+"""
+
+import argparse
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+from typing import Callable, Dict, List, Tuple
+
+import pycmx
+from pycmx.edit_list import EditList
+from pycmx.parse_cmx_statements import parse_cmx3600_statements
+
+from synthetic import SOURCE_FIELD_SIZES, synthetic_edl_lines
+
+
+_SCENE_LIST_SCRIPT = os.path.join(os.path.dirname(__file__), os.pardir,
+                                  "bin", "edl2scenelist.py")
+
+
+def _time_best(setup: Callable[[], object], run: Callable[[object], object],
+               repeat: int) -> List[float]:
+    # setup() runs outside the timed section before each run, so cached
+    # results never carry over from one run to the next.
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def _bench_parse_statements(text: str, repeat: int):
+    return _time_best(lambda: io.StringIO(text),
+                      parse_cmx3600_statements, repeat)
+
+
+def _bench_group_events(text: str, repeat: int):
+    statements = parse_cmx3600_statements(io.StringIO(text))
+    return _time_best(lambda: EditList(list(statements)),
+                      lambda edl: edl.events, repeat)
+
+
+def _bench_event_edits(text: str, repeat: int):
+    statements = parse_cmx3600_statements(io.StringIO(text))
+
+    def setup():
+        return EditList(list(statements)).events
+
+    def run(events):
+        for event in events:
+            event.edits
+
+    return _time_best(setup, run, repeat)
+
+
+def _bench_channels(text: str, repeat: int):
+    def setup():
+        edl = pycmx.parse_cmx3600(io.StringIO(text))
+        for event in edl.events:
+            event.edits
+        return edl
+
+    return _time_best(setup, lambda edl: edl.channels, repeat)
+
+
+def _bench_scene_list(text: str, repeat: int):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "synthetic.edl")
+        with open(path, "w") as f:
+            f.write(text)
+
+        env = dict(os.environ)
+        package_dir = os.path.dirname(os.path.dirname(pycmx.__file__))
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (package_dir, env.get("PYTHONPATH")) if p)
+
+        command = [sys.executable, _SCENE_LIST_SCRIPT, "-f", "cols",
+                   "-o", os.devnull, path]
+        return _time_best(lambda: None,
+                          lambda _: subprocess.run(command, env=env,
+                                                   check=True), repeat)
+
+
+# Each benchmark, and whether its throughput is counted in lines or events.
+BENCHMARKS: Dict[str, Tuple[Callable[[str, int], List[float]], str]] = {
+    "parse_statements": (_bench_parse_statements, "lines"),
+    "group_events": (_bench_group_events, "events"),
+    "event_edits": (_bench_event_edits, "events"),
+    "edit_list_channels": (_bench_channels, "events"),
+    "edl2scenelist": (_bench_scene_list, "lines"),
+}
+
+
+def run_benchmarks(event_counts: List[int], forms: List[str],
+                   names: List[str], repeat: int = 5, seed: int = 0) -> dict:
+    """
+    Run the named benchmarks for each event count and form, and return the
+    results as a JSON-serializable dict.
+    """
+    results = []
+    for form in forms:
+        for events in event_counts:
+            text = "".join(synthetic_edl_lines(events, form, seed))
+            lines = text.count("\n")
+            for name in names:
+                (bench, unit) = BENCHMARKS[name]
+                times = bench(text, repeat)
+                count = lines if unit == "lines" else events
+                results.append({
+                    "benchmark": name,
+                    "form": form,
+                    "events": events,
+                    "lines": lines,
+                    "times": times,
+                    "best": min(times),
+                    "unit": unit,
+                    "per_second": count / min(times),
+                })
+                print(f"{name:<20} {form:<8} {events:>8} events  "
+                      f"{min(times) * 1000:10.2f} ms  "
+                      f"{count / min(times):14,.0f} {unit}/s",
+                      file=sys.stderr)
+
+    return {
+        "pycmx_version": _pycmx_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(old: dict, new: dict) -> List[dict]:
+    """
+    Compare the best times of two result sets, returning the ratio of new to
+    old time for each benchmark present in both.
+    """
+    def key(r):
+        return (r["benchmark"], r["form"], r["events"])
+
+    old_results = {key(r): r for r in old["results"]}
+    comparisons = []
+    for r in new["results"]:
+        o = old_results.get(key(r), None)
+        if o is not None:
+            comparisons.append({"benchmark": r["benchmark"],
+                                "form": r["form"],
+                                "events": r["events"],
+                                "old": o["best"],
+                                "new": r["best"],
+                                "ratio": r["best"] / o["best"]})
+
+    return comparisons
+
+
+def _pycmx_version() -> str:
+    try:
+        return version("pycmx")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def benchmark_cli(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Run pycmx benchmarks on synthetic EDLs and write the '
+        'results as JSON.')
+    parser.add_argument('-n', '--events', action='append', type=int,
+                        help='Number of events in each list, may be given '
+                        'more than once. Default is 10000.')
+    parser.add_argument('-f', '--form', action='append',
+                        choices=sorted(SOURCE_FIELD_SIZES),
+                        help='Source field width, may be given more than '
+                        'once. Default is all three.')
+    parser.add_argument('-b', '--benchmark', action='append',
+                        choices=sorted(BENCHMARKS),
+                        help='Benchmark to run, may be given more than once. '
+                        'Default is all of them.')
+    parser.add_argument('-r', '--repeat', default=5, type=int,
+                        help='Runs of each benchmark, the best is reported. '
+                        'Default is 5.')
+    parser.add_argument('-s', '--seed', default=0, type=int,
+                        help='Random seed for the synthetic lists.')
+    parser.add_argument('-o', '--outfile', default=sys.stdout,
+                        type=argparse.FileType('w'),
+                        help='Output file. Default is stdout.')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='Compare two result files instead of running '
+                        'benchmarks.')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        output = {"comparisons": compare_results(old, new)}
+    else:
+        output = run_benchmarks(args.events or [10000],
+                                args.form or sorted(SOURCE_FIELD_SIZES),
+                                args.benchmark or list(BENCHMARKS),
+                                args.repeat, args.seed)
+
+    json.dump(output, args.outfile, indent=2)
+    args.outfile.write("\n")
+
+
+if __name__ == '__main__':
+    benchmark_cli()
@@ -0,0 +1,132 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+"""
+A deterministic generator of large synthetic CMX 3600 EDLs for benchmarks.
+
+The same arguments always produce the same text. Lists are a mix of video
+cuts, audio cuts with "AUD" lines, and dissolves with "FROM" and "TO" clip
+names, and some events carry ASC CDL and FRMC remarks.
+"""
+
+import argparse
+import random
+import sys
+from typing import Generator, TextIO
+
+from pycmx.timecode import Timecode
+
+
+SOURCE_FIELD_SIZES = {"3600": 8, "File32": 32, "File128": 128}
+
+_RATE = 24
+
+
+def synthetic_edl_lines(events: int, form: str = "3600",
+                        seed: int = 0) -> Generator[str, None, None]:
+    """
+    A generator for each line of a synthetic EDL, with line endings.
+
+    :param events: The number of events in the list.
+    :param form: The width of the source field: "3600", "File32" or
+        "File128".
+    :param seed: The seed for the random choices in the list.
+    """
+    if form not in SOURCE_FIELD_SIZES:
+        raise ValueError(f"Invalid EDL form \"{form}\"")
+
+    rng = random.Random(seed)
+    source_width = SOURCE_FIELD_SIZES[form]
+    event_width = max(3, len(str(events)))
+    record = Timecode.parse("01:00:00:00", _RATE)
+
+    def event_line(number, source, channels, trans, trans_op, source_in,
+                   duration, record_in):
+        return (f"{number:0{event_width}d}  {source:<{source_width}} "
+                f"{channels:<4}  {trans:<4} {trans_op:>3} {source_in} "
+                f"{source_in + duration} {record_in} "
+                f"{record_in + duration}\n")
+
+    def source_name():
+        roll = rng.randrange(400)
+        if form == "3600":
+            return f"A{roll:03d}C{rng.randrange(100):03d}"[0:8]
+        return f"A{roll:03d}C{rng.randrange(100):03d}_" \
+            f"{rng.randrange(10 ** 6):06d}"[0:source_width]
+
+    def source_in():
+        return Timecode(rng.randrange(10 * 3600 * _RATE, 20 * 3600 * _RATE),
+                        _RATE)
+
+    yield f"TITLE: SYNTHETIC {form} {events} EVENTS\n"
+    yield "FCM: NON-DROP FRAME\n"
+
+    for number in range(1, events + 1):
+        kind = rng.random()
+        duration = rng.randrange(12, 240)
+        source = source_name()
+
+        if kind < 0.15:
+            # A dissolve, a zero-length "from" edit followed by the "to" edit.
+            length = rng.choice((12, 24, 30, 48))
+            to_source = source_name()
+            yield event_line(number, source, "V", "C", "", source_in(), 0,
+                             record)
+            yield event_line(number, to_source, "V", "D", f"{length:03d}",
+                             source_in(), duration, record)
+            yield f"* FROM CLIP NAME:  {source} SC{number % 90 + 1}\n"
+            yield f"* TO CLIP NAME:  {to_source} SC{number % 90 + 1}\n"
+
+        elif kind < 0.35:
+            channels = rng.choice(("A", "A2", "AA", "A4", "A12"))
+            yield event_line(number, source, channels, "C", "", source_in(),
+                             duration, record)
+            if rng.random() < 0.3:
+                yield "AUD  3    4\n"
+            yield f"* FROM CLIP NAME:  {source}.WAV\n"
+
+        else:
+            yield event_line(number, source, "V", "C", "", source_in(),
+                             duration, record)
+            yield f"* FROM CLIP NAME:  {source} SC{number % 90 + 1}\n"
+            if rng.random() < 0.1:
+                yield "* ASC_SOP (1.0120 0.9980 1.0000)(0.0010 -0.0020 " \
+                    "0.0000)(1.0000 1.0000 0.9900)\n"
+                yield "* ASC_SAT 0.9500\n"
+            if rng.random() < 0.05:
+                yield f"* FRMC START: 1001 FRMC END: {1000 + duration} " \
+                    f"FRMC DURATION: {duration}\n"
+            yield f"* SOURCE FILE: {source}.MOV\n"
+
+        record = record + duration
+
+
+def write_synthetic_edl(f: TextIO, events: int, form: str = "3600",
+                        seed: int = 0):
+    """
+    Write a synthetic EDL to `f`. The arguments are the same as
+    :func:`synthetic_edl_lines`.
+    """
+    f.writelines(synthetic_edl_lines(events, form, seed))
+
+
+def synthetic_cli(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Write a deterministic synthetic CMX 3600 EDL.')
+    parser.add_argument('-n', '--events', default=10000, type=int,
+                        help='Number of events. Default is 10000.')
+    parser.add_argument('-f', '--form', default='3600',
+                        choices=sorted(SOURCE_FIELD_SIZES),
+                        help='Source field width. Default is 3600.')
+    parser.add_argument('-s', '--seed', default=0, type=int,
+                        help='Random seed. Default is 0.')
+    parser.add_argument('-o', '--outfile', default=sys.stdout,
+                        type=argparse.FileType('w'),
+                        help='Output file. Default is stdout.')
+    args = parser.parse_args(argv)
+
+    write_synthetic_edl(args.outfile, args.events, args.form, args.seed)
+
+
+if __name__ == '__main__':
+    synthetic_cli()
@@ -7,9 +7,13 @@ copy and reuse this software, refer to the LICENSE file included with the
 distribution.
 """
 
-from .parse_cmx_events import parse_cmx3600
+from .parse_cmx_events import parse_cmx3600, parse_cmx3600_bytes
 from .transition import Transition
 from .event import Event
 from .edit import Edit
+from .timecode import Timecode
+from .change_list import diff
+from .merge import merge
 
-__all__ = ("parse_cmx3600", "Transition", "Event", "Edit")
+__all__ = ("parse_cmx3600", "parse_cmx3600_bytes", "Transition", "Event",
+           "Edit", "Timecode", "diff", "merge")
@@ -0,0 +1,132 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from typing import (TYPE_CHECKING, Any, Dict, Generator, List, NamedTuple,
+                    Optional)
+
+if TYPE_CHECKING:
+    from .edit import Edit
+    from .edit_list import EditList
+
+
+class EditArrays(NamedTuple):
+    """
+    The edits of an edit list as columns in a NumPy structured array, as
+    returned by :meth:`~pycmx.edit_list.EditList.to_arrays()`.
+
+    `edits` has one row per :class:`~pycmx.edit.Edit`, and these fields:
+
+    * `event`: the event number.
+    * `source_in`, `source_out`, `record_in`, `record_out`: timecodes as
+      integer frame counts.
+    * `channels`: the :attr:`~pycmx.channel_map.ChannelMap.bitmask` of the
+      edit's channels. This is an unsigned 64-bit integer, so it holds
+      video and audio channels up to A63.
+    * `transition`: the transition :attr:`~pycmx.transition.Transition.kind`,
+      or an empty string.
+    * `effect_duration`: the transition duration in frames, or 0 for a cut.
+    * `line_number`: the line number of the edit.
+    * `source_index`: the index of the edit's source name in `sources`.
+    """
+
+    edits: Any  # : A NumPy structured array with one row per edit
+    sources: List[str]  # : Every source name, in order of first appearance
+
+
+_EDIT_ARRAY_FIELDS = [
+    ('event', 'i8'),
+    ('source_in', 'i8'),
+    ('source_out', 'i8'),
+    ('record_in', 'i8'),
+    ('record_out', 'i8'),
+    ('channels', 'u8'),
+    ('transition', 'U2'),
+    ('effect_duration', 'i8'),
+    ('line_number', 'i8'),
+    ('source_index', 'i4'),
+]
+
+
+def edit_list_arrays(edit_list: "EditList", rate: int) -> EditArrays:
+    """
+    Create an :class:`EditArrays` for `edit_list`, reading timecodes at
+    `rate` nominal frames per second.
+
+    This function requires NumPy, which is installed with the "numpy" extra.
+
+    :raises ValueError: if any edit has an invalid timecode, or is on an
+        audio channel above A63.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("EditList.to_arrays() requires numpy. Install "
+                          "pycmx with the \"numpy\" extra.") from e
+
+    columns: Dict[str, List[Any]] = {name: [] for (name, _) in
+                                     _EDIT_ARRAY_FIELDS}
+    source_indexes: Dict[str, int] = {}
+
+    for row in _iter_edit_rows(edit_list, rate):
+        columns['event'].append(row.event)
+        columns['source_in'].append(row.source_in)
+        columns['source_out'].append(row.source_out)
+        columns['record_in'].append(row.record_in)
+        columns['record_out'].append(row.record_out)
+        columns['channels'].append(row.channels)
+        columns['transition'].append(row.transition or '')
+        columns['effect_duration'].append(row.effect_duration)
+        columns['line_number'].append(row.edit.line_number)
+        columns['source_index'].append(
+            source_indexes.setdefault(row.edit.source, len(source_indexes)))
+
+    edits = np.empty(len(columns['event']), dtype=_EDIT_ARRAY_FIELDS)
+    for (name, _) in _EDIT_ARRAY_FIELDS:
+        edits[name] = columns[name]
+
+    return EditArrays(edits=edits, sources=list(source_indexes))
+
+
+class _EditRow(NamedTuple):
+    # The fields of an edit shared by the NumPy and Arrow exports.
+    event: int
+    edit: "Edit"
+    source_in: int
+    source_out: int
+    record_in: int
+    record_out: int
+    channels: int
+    transition: Optional[str]
+    effect_duration: int
+
+
+def _iter_edit_rows(edit_list: "EditList", rate: int
+                    ) -> Generator[_EditRow, None, None]:
+    for event in edit_list.events:
+        if len(event._edit_statements()) == 0:
+            continue
+
+        number = event.number
+        for edit in event.edits:
+            transition = edit.transition
+            operand = transition.operand
+            yield _EditRow(
+                event=number,
+                edit=edit,
+                source_in=edit.source_in_timecode(rate).frames,
+                source_out=edit.source_out_timecode(rate).frames,
+                record_in=edit.record_in_timecode(rate).frames,
+                record_out=edit.record_out_timecode(rate).frames,
+                channels=_channel_field(edit),
+                transition=transition.kind,
+                effect_duration=int(operand) if operand.isdigit() else 0)
+
+
+def _channel_field(edit) -> int:
+    mask = edit.channel_mask
+    if mask >> 64:
+        raise ValueError(f"The edit on line {edit.line_number} is on audio "
+                         f"channel A{mask.bit_length() - 1}, channels above "
+                         "A63 don't fit in a 64-bit channel mask")
+
+    return mask
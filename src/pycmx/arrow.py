@@ -0,0 +1,251 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from typing import (TYPE_CHECKING, Any, Dict, Generator, Iterable, List,
+                    Optional)
+
+from .arrays import _EditRow, _iter_edit_rows
+
+if TYPE_CHECKING:
+    from .edit_list import EditList
+
+
+#: The default number of rows in each record batch.
+DEFAULT_BATCH_SIZE = 65536
+
+# The columns of an exported edit, with the name of their Arrow type.
+# "dictionary" columns are dictionary-encoded strings.
+_ARROW_COLUMNS = [
+    ('list_index', 'int32'),
+    ('title', 'dictionary'),
+    ('event', 'int32'),
+    ('line_number', 'int64'),
+    ('source', 'dictionary'),
+    ('source_file', 'dictionary'),
+    ('clip_name', 'dictionary'),
+    ('channels', 'uint64'),
+    ('transition', 'dictionary'),
+    ('effect_duration', 'int32'),
+    ('drop_frame', 'bool_'),
+    ('source_in', 'int64'),
+    ('source_out', 'int64'),
+    ('record_in', 'int64'),
+    ('record_out', 'int64'),
+    ('sop_slope_red', 'float64'),
+    ('sop_slope_green', 'float64'),
+    ('sop_slope_blue', 'float64'),
+    ('sop_offset_red', 'float64'),
+    ('sop_offset_green', 'float64'),
+    ('sop_offset_blue', 'float64'),
+    ('sop_power_red', 'float64'),
+    ('sop_power_green', 'float64'),
+    ('sop_power_blue', 'float64'),
+    ('sat', 'float64'),
+    ('frmc_start', 'int64'),
+    ('frmc_end', 'int64'),
+    ('frmc_duration', 'int64'),
+]
+
+_SOP_COLUMNS = [name for (name, _) in _ARROW_COLUMNS
+                if name.startswith('sop_')]
+
+
+def arrow_schema() -> Any:
+    """
+    Get the `pyarrow.Schema` of the record batches created by
+    :func:`iter_record_batches()`. There is one row per
+    :class:`~pycmx.edit.Edit`, with these fields:
+
+    * `list_index`: the index of the edit's list in the lists exported.
+    * `title`: the title of the edit's list.
+    * `event`: the event number.
+    * `line_number`: the line number of the edit.
+    * `source`, `source_file`, `clip_name`: the edit's source name, source
+      file and clip name. The source file and clip name are null if the
+      edit doesn't have one.
+    * `channels`: the :attr:`~pycmx.edit.Edit.channel_mask` of the edit.
+      This is an unsigned 64-bit integer, so it holds video and audio
+      channels up to A63.
+    * `transition`: the transition :attr:`~pycmx.transition.Transition.kind`,
+      or null.
+    * `effect_duration`: the transition duration in frames, or 0 for a cut.
+    * `drop_frame`: `True` if the edit's timecodes are drop frame.
+    * `source_in`, `source_out`, `record_in`, `record_out`: timecodes as
+      integer frame counts.
+    * `sop_slope_red` through `sop_power_blue`: the components of the
+      edit's :attr:`~pycmx.edit.Edit.asc_sop`, or null.
+    * `sat`: the edit's :attr:`~pycmx.edit.Edit.asc_sat`, or null.
+    * `frmc_start`, `frmc_end`, `frmc_duration`: the edit's
+      :attr:`~pycmx.edit.Edit.framecounts`, or null.
+
+    Strings are dictionary-encoded.
+
+    This function requires pyarrow, which is installed with the "arrow"
+    extra.
+    """
+    pa = _import_pyarrow()
+    return pa.schema([(name, _arrow_type(pa, type_name))
+                      for (name, type_name) in _ARROW_COLUMNS])
+
+
+def iter_record_batches(edit_lists: Iterable["EditList"], rate: int,
+                        batch_size: int = DEFAULT_BATCH_SIZE
+                        ) -> Generator[Any, None, None]:
+    """
+    A generator for `pyarrow.RecordBatch` es of the edits of many edit lists,
+    with the schema given by :func:`arrow_schema()`. Batches are created as
+    the lists are read and hold at most `batch_size` rows, and may hold the
+    edits of more than one list.
+
+    This function requires pyarrow, which is installed with the "arrow"
+    extra.
+
+    :param edit_lists: The lists to export. These may be streaming lists,
+        which are read once.
+    :param rate: The nominal frame rate to read timecodes at.
+    :param batch_size: The most rows in a batch.
+    :raises ValueError: if any edit has an invalid timecode, or is on an
+        audio channel above A63.
+    """
+    pa = _import_pyarrow()
+    schema = arrow_schema()
+
+    columns = _new_columns()
+    rows = 0
+    for (list_index, edit_list) in enumerate(edit_lists):
+        title = edit_list.title
+        for row in _iter_edit_rows(edit_list, rate):
+            _append_row(columns, row)
+            columns['list_index'].append(list_index)
+            columns['title'].append(title)
+            rows += 1
+
+            if rows == batch_size:
+                yield _record_batch(pa, schema, columns)
+                columns = _new_columns()
+                rows = 0
+
+    if rows > 0:
+        yield _record_batch(pa, schema, columns)
+
+
+def to_arrow_table(edit_lists: Iterable["EditList"], rate: int) -> Any:
+    """
+    Get the edits of many edit lists as a `pyarrow.Table`, with the schema
+    given by :func:`arrow_schema()`.
+
+    This function requires pyarrow, which is installed with the "arrow"
+    extra.
+
+    :raises ValueError: if any edit has an invalid timecode, or is on an
+        audio channel above A63.
+    """
+    pa = _import_pyarrow()
+    return pa.Table.from_batches(list(iter_record_batches(edit_lists, rate)),
+                                 schema=arrow_schema())
+
+
+def write_parquet(edit_lists: Iterable["EditList"], where: Any, rate: int,
+                  batch_size: int = DEFAULT_BATCH_SIZE,
+                  compression: Optional[str] = 'snappy') -> int:
+    """
+    Write the edits of many edit lists to a Parquet file, with the schema
+    given by :func:`arrow_schema()`. Each record batch is written as it is
+    created, so at most `batch_size` edits are held in memory, and a
+    generator of streaming lists can be written without reading them all
+    first.
+
+    This function requires pyarrow, which is installed with the "arrow"
+    extra.
+
+    :param where: A path or writable binary file.
+    :param compression: The Parquet compression codec, or `None`.
+    :returns: The number of edits written.
+    :raises ValueError: if any edit has an invalid timecode, or is on an
+        audio channel above A63.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    rows = 0
+    with pq.ParquetWriter(where, arrow_schema(),
+                          compression=compression) as writer:
+        for batch in iter_record_batches(edit_lists, rate, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+
+    return rows
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Arrow export requires pyarrow. Install pycmx "
+                          "with the \"arrow\" extra.") from e
+
+    return pyarrow
+
+
+def _arrow_type(pa, type_name: str):
+    if type_name == 'dictionary':
+        return pa.dictionary(pa.int32(), pa.string())
+
+    return getattr(pa, type_name)()
+
+
+def _new_columns() -> Dict[str, List[Any]]:
+    return {name: [] for (name, _) in _ARROW_COLUMNS}
+
+
+def _append_row(columns: Dict[str, List[Any]], row: _EditRow):
+    edit = row.edit
+
+    columns['event'].append(row.event)
+    columns['line_number'].append(edit.line_number)
+    columns['source'].append(edit.source)
+    columns['source_file'].append(edit.source_file)
+    columns['clip_name'].append(edit.clip_name)
+    columns['channels'].append(row.channels)
+    columns['transition'].append(row.transition)
+    columns['effect_duration'].append(row.effect_duration)
+    columns['drop_frame'].append(edit.drop_frame)
+    columns['source_in'].append(row.source_in)
+    columns['source_out'].append(row.source_out)
+    columns['record_in'].append(row.record_in)
+    columns['record_out'].append(row.record_out)
+
+    sop = edit.asc_sop
+    if sop is None:
+        for name in _SOP_COLUMNS:
+            columns[name].append(None)
+    else:
+        for (prefix, rgb) in (('sop_slope_', sop.slope),
+                              ('sop_offset_', sop.offset),
+                              ('sop_power_', sop.power)):
+            columns[prefix + 'red'].append(rgb.red)
+            columns[prefix + 'green'].append(rgb.green)
+            columns[prefix + 'blue'].append(rgb.blue)
+
+    columns['sat'].append(edit.asc_sat)
+
+    framecounts = edit.framecounts
+    columns['frmc_start'].append(
+        framecounts.start if framecounts is not None else None)
+    columns['frmc_end'].append(
+        framecounts.end if framecounts is not None else None)
+    columns['frmc_duration'].append(
+        framecounts.duration if framecounts is not None else None)
+
+
+def _record_batch(pa, schema, columns: Dict[str, List[Any]]):
+    arrays = []
+    for field in schema:
+        values = columns[field.name]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, type=pa.string())
+                          .dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
@@ -0,0 +1,166 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Generator, Iterable, List, NamedTuple, Optional
+
+from .edit_list import EditList
+from .parse_cmx_events import parse_cmx3600
+
+
+class EditListSummary(NamedTuple):
+    """
+    A short description of an edit list, returned by :func:`parse_many()`
+    when `summaries` is `True`.
+    """
+
+    title: str  # : The title of the list
+    format: str  # : The :attr:`~pycmx.edit_list.EditList.format` of the list
+    event_count: int  # : The number of events
+    edit_count: int  # : The number of edits
+    channels: int  # : The union of every edit's channels, as a bitmask
+    unrecognized_count: int  # : Unrecognized statements and corrupt remarks
+
+
+class BatchResult(NamedTuple):
+    """
+    The result of parsing one file with :func:`parse_many()`.
+    """
+
+    path: str  # : The path that was parsed
+
+    #: The parsed list, or `None` if the file failed to parse or summaries
+    #: were requested.
+    edit_list: Optional[EditList]
+
+    #: A summary of the parsed list, or `None` if the file failed to parse or
+    #: summaries were not requested.
+    summary: Optional[EditListSummary]
+
+    #: The exception raised while reading or parsing the file, or `None`.
+    error: Optional[BaseException]
+
+
+def summarize(edit_list: EditList) -> EditListSummary:
+    """
+    Create an :class:`EditListSummary` of `edit_list`.
+    """
+    edit_count = 0
+    channels = 0
+    for event in edit_list.events:
+        for edit in event.edits:
+            edit_count += 1
+            channels |= edit.channel_mask
+
+    return EditListSummary(
+        title=edit_list.title,
+        format=edit_list.format,
+        event_count=len(edit_list.events),
+        edit_count=edit_count,
+        channels=channels,
+        unrecognized_count=len(list(edit_list.unrecognized_statements)))
+
+
+def parse_many(paths: Iterable[str], workers: Optional[int] = None,
+               tolerant: bool = False, summaries: bool = False,
+               encoding: Optional[str] = None,
+               compact: bool = False) -> Generator[BatchResult, None, None]:
+    """
+    Parse many EDL files in a pool of processes. Results are yielded as each
+    file finishes parsing, so they will usually not be in the same order as
+    `paths`. An error reading or parsing a file is returned in its result and
+    does not stop the batch.
+
+    :param paths: Paths of the EDL files to parse.
+    :param workers: The number of processes to use. The default is the number
+        of processors on the system. If this is 1, files are parsed in the
+        calling process.
+    :param tolerant: Passed to :func:`~pycmx.parse_cmx_events.parse_cmx3600`.
+    :param summaries: If `True`, each result will have an
+        :class:`EditListSummary` instead of an
+        :class:`~pycmx.edit_list.EditList`. Summaries are much faster to send
+        back from the worker processes.
+    :param encoding: The text encoding of the files. The default is the
+        platform default, as with :func:`open`.
+    :param compact: Passed to :func:`~pycmx.parse_cmx_events.parse_cmx3600`.
+    """
+    if workers == 1:
+        for path in paths:
+            yield _parse_path(path, tolerant, summaries, encoding, compact)
+
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_parse_path, path, tolerant, summaries,
+                                   encoding, compact): path
+                   for path in paths}
+
+        for future in as_completed(futures):
+            # A worker that dies, or a result that can't be sent back from
+            # the worker, fails only its own file.
+            try:
+                result = future.result()
+            except Exception as e:
+                result = BatchResult(path=futures[future], edit_list=None,
+                                     summary=None, error=e)
+
+            yield result
+
+
+def _parse_path(path: str, tolerant: bool, summaries: bool,
+                encoding: Optional[str], compact: bool) -> BatchResult:
+    try:
+        with open(path, 'r', encoding=encoding) as f:
+            edit_list = parse_cmx3600(f, tolerant=tolerant, compact=compact)
+
+        if summaries:
+            return BatchResult(path=path, edit_list=None,
+                               summary=summarize(edit_list), error=None)
+        else:
+            return BatchResult(path=path, edit_list=edit_list, summary=None,
+                               error=None)
+
+    except Exception as e:
+        return BatchResult(path=path, edit_list=None, summary=None, error=e)
+
+
+def batch_cli(argv: Optional[List[str]] = None) -> int:
+    """
+    Parse EDL files given on the command line in parallel and print a JSON
+    summary of each on its own line.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pycmx.batch",
+        description='Parse many CMX EDLs in parallel and print a JSON summary '
+        'of each one, one per line, in the order they finish.')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of parallel processes. Default is the '
+                        'number of processors.')
+    parser.add_argument('-t', '--tolerant', action='store_true',
+                        help='Use tolerant event line parsing.')
+    parser.add_argument('-e', '--encoding', default=None,
+                        help='Text encoding of the input files.')
+    parser.add_argument('input_edl', nargs='+', help='Input files.')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for result in parse_many(args.input_edl, workers=args.jobs,
+                             tolerant=args.tolerant, summaries=True,
+                             encoding=args.encoding):
+        record = {'path': result.path}
+        if result.summary is not None:
+            record.update(result.summary._asdict())
+        else:
+            failed = True
+            record['error'] = repr(result.error)
+
+        print(json.dumps(record), flush=True)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(batch_cli())
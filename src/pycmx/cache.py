@@ -0,0 +1,180 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import zlib
+from functools import lru_cache
+from io import StringIO
+from typing import List, Optional, TextIO
+
+from . import cdl as _cdl
+from . import parse_cmx_statements as _parse_cmx_statements
+from . import statements as _statements
+from . import util as _util
+from .edit_list import EditList
+from .event_table import EventTable
+from .parse_cmx_statements import parse_cmx3600_statements
+
+# Increment this when the statement classes change in a way that makes old
+# cache entries unreadable.
+_CACHE_FORMAT = 1
+
+_ENTRY_SUFFIX = ".pycmx"
+
+
+def _library_version() -> str:
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            return version("pycmx")
+        except PackageNotFoundError:
+            return "unknown"
+    except ImportError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def _definitions_hash() -> str:
+    # The source of the modules that define the cached statements and how
+    # they are parsed, so entries aren't reused across code changes in a
+    # checkout where the version doesn't change.
+    digest = hashlib.sha256()
+    for module in (_statements, _cdl, _parse_cmx_statements, _util):
+        try:
+            digest.update(inspect.getsource(module).encode('utf-8'))
+        except (OSError, TypeError):
+            digest.update(module.__name__.encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    A cache of parsed EDLs, stored in a directory on disk. Entries are keyed
+    by a hash of the EDL text, the `tolerant` flag, the pycmx version and
+    the source of the statement parser, so an EDL that has been parsed
+    before is read back without parsing it again, and entries written by
+    other versions of the parser are not used.
+
+    When the total size of the entries exceeds `max_bytes`, the least
+    recently used entries are deleted. Several processes can use the same
+    directory at once: entries are written to a temporary file and then
+    renamed into place, and entries that disappear while in use are treated
+    as missing.
+
+    Entries are stored with :mod:`pickle`, so a cache directory should only
+    be writable by users you trust.
+
+    :param directory: The directory to store entries in. It will be created
+        if it doesn't exist.
+    :param max_bytes: The maximum total size of the entries.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._version = f"{_library_version()}:{_definitions_hash()}"
+
+    def parse_cmx3600(self, f: TextIO, tolerant: bool = False,
+                      compact: bool = False) -> EditList:
+        """
+        Parse a CMX 3600 EDL, or read it from the cache if it has been parsed
+        before. The arguments are the same as
+        :func:`~pycmx.parse_cmx_events.parse_cmx3600`.
+        """
+        text = f.read()
+        path = self._entry_path(text, tolerant)
+        statements = self._load(path)
+        if statements is None:
+            statements = parse_cmx3600_statements(StringIO(text), tolerant)
+            self._store(path, statements)
+
+        if compact:
+            return EditList(list(EventTable().compact(statements)))
+
+        return EditList(statements)
+
+    def clear(self):
+        """
+        Delete every entry in the cache.
+        """
+        for entry in self._entries():
+            _remove(entry.path)
+
+    def _entry_path(self, text: str, tolerant: bool) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{_CACHE_FORMAT}:{self._version}:{tolerant}:"
+                      .encode('utf-8'))
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return os.path.join(self.directory,
+                            digest.hexdigest() + _ENTRY_SUFFIX)
+
+    def _load(self, path: str) -> Optional[List[object]]:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+
+            os.utime(path)
+            return pickle.loads(zlib.decompress(data))
+
+        except FileNotFoundError:
+            return None
+
+        except Exception:
+            # A damaged entry, or one written by a version of pycmx whose
+            # classes have changed, is treated as missing.
+            _remove(path)
+            return None
+
+    def _store(self, path: str, statements: List[object]):
+        data = zlib.compress(
+            pickle.dumps(statements, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+        (fd, temp_path) = tempfile.mkstemp(dir=self.directory,
+                                           suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+
+            os.replace(temp_path, path)
+        except BaseException:
+            _remove(temp_path)
+            raise
+
+        self._evict()
+
+    def _entries(self) -> List[os.DirEntry]:
+        with os.scandir(self.directory) as it:
+            return [e for e in it if e.name.endswith(_ENTRY_SUFFIX)]
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        entries.sort()
+        for (_, size, path) in entries:
+            if total <= self.max_bytes:
+                break
+
+            _remove(path)
+            total -= size
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,304 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from bisect import bisect_left
+from typing import (Dict, Hashable, List, NamedTuple, Optional, Set,
+                    Tuple)
+
+from .edit import Edit
+from .edit_list import EditList
+from .timecode import Timecode
+
+
+class EditChange(NamedTuple):
+    """
+    A difference between an edit in one version of an edit list and an edit
+    in another, as found by :func:`diff()`.
+    """
+
+    #: The kind of change:
+    #:
+    #: * "insert": `new` is not in the old list.
+    #: * "delete": `old` is not in the new list.
+    #: * "trim": `old` and `new` use the same source and channels at the same
+    #:   place in the cut, with different source ins or outs.
+    #: * "move": `old` and `new` are the same source range and channels, at
+    #:   a different place in the order of the cut.
+    #: * "shift": `old` and `new` are the same source range and channels at
+    #:   the same place in the cut, with different record timecodes.
+    kind: str
+
+    old: Optional[Edit]  # : The edit in the old list, if any
+    new: Optional[Edit]  # : The edit in the new list, if any
+
+    #: The change in record in and record out, in frames, from `old` to
+    #: `new`. Both are 0 for an insert or delete.
+    record_in_delta: int
+    record_out_delta: int
+
+    #: The change in source in and source out, in frames, from `old` to
+    #: `new`. Both are 0 for an insert or delete.
+    source_in_delta: int
+    source_out_delta: int
+
+
+def diff(old: EditList, new: EditList, rate: int) -> List[EditChange]:
+    """
+    Compare two versions of an edit list and return a list of changes, in
+    the order of the new list with deleted edits at their old positions.
+
+    Edits are aligned by source, source in, source out and channels with a
+    patience diff, edits that fall out of the alignment but appear in both
+    lists are reported as moves, and unmatched edits between aligned edits
+    with the same source and channels and overlapping source ranges are
+    reported as trims. Edits that are aligned and have the same record
+    timecodes are not reported.
+
+    :param old: The earlier version of the list.
+    :param new: The later version of the list.
+    :param rate: The nominal frame rate to read timecodes at.
+    :raises ValueError: if an edit has an invalid timecode.
+    """
+    old_edits = _edit_frames(old, rate)
+    new_edits = _edit_frames(new, rate)
+
+    key_ids: Dict[Hashable, int] = {}
+    old_keys = [key_ids.setdefault(e[1], len(key_ids)) for e in old_edits]
+    new_keys = [key_ids.setdefault(e[1], len(key_ids)) for e in new_edits]
+
+    matches = _patience_matches(old_keys, new_keys)
+
+    # Each gap between aligned edits is searched for trims, everything left
+    # over is a candidate for a move.
+    trims: Dict[int, int] = {}
+    trimmed_old: Set[int] = set()
+    unmatched_old: List[int] = []
+    unmatched_new: List[int] = []
+    (i, j) = (0, 0)
+    for (next_i, next_j) in matches + [(len(old_keys), len(new_keys))]:
+        gap_trims = _match_trims(old_edits, new_edits, range(i, next_i),
+                                 range(j, next_j))
+        trims.update(gap_trims)
+        trimmed_old.update(gap_trims.values())
+        unmatched_old.extend(k for k in range(i, next_i)
+                             if k not in trimmed_old)
+        unmatched_new.extend(k for k in range(j, next_j)
+                             if k not in gap_trims)
+        (i, j) = (next_i + 1, next_j + 1)
+
+    moves: Dict[int, int] = {}
+    old_by_key: Dict[int, List[int]] = {}
+    for k in reversed(unmatched_old):
+        old_by_key.setdefault(old_keys[k], []).append(k)
+
+    for k in unmatched_new:
+        candidates = old_by_key.get(new_keys[k], None)
+        if candidates:
+            moves[k] = candidates.pop()
+
+    moved_old = set(moves.values())
+
+    # Changes are reported gap by gap through the alignment, deletions
+    # first, then the new edits in the gap, then the aligned edit after it.
+    changes: List[EditChange] = []
+    (i, j) = (0, 0)
+    for (next_i, next_j) in matches + [(len(old_keys), len(new_keys))]:
+        changes.extend(_change("delete", old_edits[k], None)
+                       for k in range(i, next_i)
+                       if k not in moved_old and k not in trimmed_old)
+
+        for k in range(j, next_j):
+            if k in trims:
+                changes.append(_change("trim", old_edits[trims[k]],
+                                       new_edits[k]))
+            elif k in moves:
+                changes.append(_change("move", old_edits[moves[k]],
+                                       new_edits[k]))
+            else:
+                changes.append(_change("insert", None, new_edits[k]))
+
+        if next_j < len(new_keys):
+            change = _change("shift", old_edits[next_i], new_edits[next_j])
+            if change.record_in_delta != 0 or change.record_out_delta != 0:
+                changes.append(change)
+
+        (i, j) = (next_i + 1, next_j + 1)
+
+    return changes
+
+
+# An edit, its alignment key and its source in, source out, record in and
+# record out in frames.
+_EditFrames = Tuple[Edit, Tuple, Tuple[int, int, int, int]]
+
+
+def _edit_frames(edit_list: EditList, rate: int) -> List[_EditFrames]:
+    # Most timecodes appear more than once in a list, a record out is usually
+    # the next record in, so each label is only parsed once.
+    parsed: Dict[Tuple[str, bool], int] = {}
+
+    def frames_of(text: str, drop: bool) -> int:
+        frames = parsed.get((text, drop), None)
+        if frames is None:
+            frames = Timecode.parse(text, rate, drop).frames
+            parsed[(text, drop)] = frames
+
+        return frames
+
+    retval: List[_EditFrames] = []
+    for event in edit_list.events:
+        for edit in event.edits:
+            drop = edit.drop_frame
+            frames = (frames_of(edit.source_in, drop),
+                      frames_of(edit.source_out, drop),
+                      frames_of(edit.record_in, drop),
+                      frames_of(edit.record_out, drop))
+            key = (edit.source, edit.channel_mask, frames[0], frames[1])
+            retval.append((edit, key, frames))
+
+    return retval
+
+
+def _change(kind: str, old: Optional[_EditFrames],
+            new: Optional[_EditFrames]) -> EditChange:
+    if old is None or new is None:
+        return EditChange(kind=kind,
+                          old=old[0] if old is not None else None,
+                          new=new[0] if new is not None else None,
+                          record_in_delta=0, record_out_delta=0,
+                          source_in_delta=0, source_out_delta=0)
+
+    return EditChange(kind=kind, old=old[0], new=new[0],
+                      record_in_delta=new[2][2] - old[2][2],
+                      record_out_delta=new[2][3] - old[2][3],
+                      source_in_delta=new[2][0] - old[2][0],
+                      source_out_delta=new[2][1] - old[2][1])
+
+
+def _match_trims(old_edits: List[_EditFrames], new_edits: List[_EditFrames],
+                 old_range: range, new_range: range) -> Dict[int, int]:
+    # Pairs edits in order, each new edit with the first old edit after the
+    # last pair that has the same source and channels and overlaps it.
+    candidates_by_source: Dict[Tuple, List[int]] = {}
+    for i in old_range:
+        candidates_by_source.setdefault(old_edits[i][1][0:2], []).append(i)
+
+    trims: Dict[int, int] = {}
+    start = old_range.start
+    for j in new_range:
+        (_, new_key, new_frames) = new_edits[j]
+        candidates = candidates_by_source.get(new_key[0:2], [])
+        for n in range(bisect_left(candidates, start), len(candidates)):
+            old_frames = old_edits[candidates[n]][2]
+            if old_frames[0] < new_frames[1] and \
+                    new_frames[0] < old_frames[1]:
+                trims[j] = candidates[n]
+                start = candidates[n] + 1
+                break
+
+    return trims
+
+
+def _patience_matches(a: List[int], b: List[int]) -> List[Tuple[int, int]]:
+    """
+    Align the sequences `a` and `b` with a patience diff, returning the
+    pairs of indexes of equal elements in the alignment.
+    """
+    matches: List[Tuple[int, int]] = []
+    ranges = [(0, len(a), 0, len(b))]
+
+    while len(ranges) > 0:
+        (a_lo, a_hi, b_lo, b_hi) = ranges.pop()
+
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            matches.append((a_lo, b_lo))
+            a_lo += 1
+            b_lo += 1
+
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+            matches.append((a_hi, b_hi))
+
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        anchors = _unique_anchors(a, b, a_lo, a_hi, b_lo, b_hi)
+        if len(anchors) == 0:
+            matches.extend(_greedy_matches(a, b, a_lo, a_hi, b_lo, b_hi))
+            continue
+
+        (i, j) = (a_lo, b_lo)
+        for (next_i, next_j) in anchors:
+            matches.append((next_i, next_j))
+            ranges.append((i, next_i, j, next_j))
+            (i, j) = (next_i + 1, next_j + 1)
+
+        ranges.append((i, a_hi, j, b_hi))
+
+    matches.sort()
+    return matches
+
+
+def _unique_anchors(a: List[int], b: List[int], a_lo: int, a_hi: int,
+                    b_lo: int, b_hi: int) -> List[Tuple[int, int]]:
+    # The longest increasing sequence of elements that appear exactly once
+    # in both ranges, found by patience sorting.
+    counts: Dict[int, List[int]] = {}
+    for i in range(a_lo, a_hi):
+        entry = counts.setdefault(a[i], [0, 0, i])
+        entry[0] += 1
+
+    for j in range(b_lo, b_hi):
+        entry = counts.get(b[j], None)
+        if entry is not None:
+            entry[1] += 1
+            entry.append(j)
+
+    pairs = sorted((entry[2], entry[3]) for entry in counts.values()
+                   if entry[0] == 1 and entry[1] == 1)
+
+    tops: List[int] = []
+    top_pairs: List[int] = []
+    previous: List[int] = []
+    for (n, (_, j)) in enumerate(pairs):
+        pile = bisect_left(tops, j)
+        if pile == len(tops):
+            tops.append(j)
+            top_pairs.append(n)
+        else:
+            tops[pile] = j
+            top_pairs[pile] = n
+
+        previous.append(top_pairs[pile - 1] if pile > 0 else -1)
+
+    anchors: List[Tuple[int, int]] = []
+    n = top_pairs[-1] if len(top_pairs) > 0 else -1
+    while n >= 0:
+        anchors.append(pairs[n])
+        n = previous[n]
+
+    anchors.reverse()
+    return anchors
+
+
+def _greedy_matches(a: List[int], b: List[int], a_lo: int, a_hi: int,
+                    b_lo: int, b_hi: int) -> List[Tuple[int, int]]:
+    # With no unique elements to anchor on, equal elements are paired in
+    # order.
+    positions: Dict[int, List[int]] = {}
+    for j in range(b_hi - 1, b_lo - 1, -1):
+        positions.setdefault(b[j], []).append(j)
+
+    matches: List[Tuple[int, int]] = []
+    last_j = b_lo - 1
+    for i in range(a_lo, a_hi):
+        candidates = positions.get(a[i], None)
+        while candidates and candidates[-1] <= last_j:
+            candidates.pop()
+
+        if candidates:
+            last_j = candidates.pop()
+            matches.append((i, last_j))
+
+    return matches
@@ -1,7 +1,8 @@
 # pycmx
 # (c) 2018-2025 Jamie Hardt
 
-from re import (compile, match)
+from functools import lru_cache
+from re import compile
 from typing import Dict, Tuple, Generator
 
 
@@ -20,7 +21,14 @@ class ChannelMap:
         "A2/V": (True,   False,   True)
     }
 
-    def __init__(self, v=False, audio_channels=set()):
+    _alt_channel_re = compile(r'^A(\d+)')
+
+    __slots__ = ("_audio_channel_set", "v")
+
+    def __init__(self, v=False, audio_channels=None):
+        if audio_channels is None:
+            audio_channels = set()
+
         self._audio_channel_set = audio_channels
         self.v = v
 
@@ -76,6 +84,34 @@ class ChannelMap:
     def a4(self, val: bool):
         self.set_audio_channel(4, val)
 
+    @property
+    def bitmask(self) -> int:
+        """
+        The channels as an integer bitmask. Bit 0 is set if video is included,
+        and bit `n` is set if audio channel `n` is included.
+        """
+        mask = 1 if self.v else 0
+        for c in self._audio_channel_set:
+            mask |= 1 << c
+
+        return mask
+
+    @classmethod
+    def from_bitmask(cls, mask: int) -> "ChannelMap":
+        """
+        Create a channel map from a :attr:`bitmask`.
+        """
+        audio_channels = set()
+        c = 1
+        mask_audio = mask >> 1
+        while mask_audio:
+            if mask_audio & 1:
+                audio_channels.add(c)
+            mask_audio >>= 1
+            c += 1
+
+        return cls(v=bool(mask & 1), audio_channels=audio_channels)
+
     def get_audio_channel(self, chan_num) -> bool:
         """True if chan_num is included"""
         return (chan_num in self._audio_channel_set)
@@ -88,14 +124,13 @@ class ChannelMap:
             self._audio_channel_set.remove(chan_num)
 
     def _append_event(self, event_str):
-        alt_channel_re = compile(r'^A(\d+)')
         if event_str in self._chan_map:
             channels = self._chan_map[event_str]
             self.v = channels[0]
             self.a1 = channels[1]
             self.a2 = channels[2]
         else:
-            matchresult = match(alt_channel_re, event_str)
+            matchresult = self._alt_channel_re.match(event_str)
             if matchresult:
                 self.set_audio_channel(int(matchresult.group(1)), True)
 
@@ -111,3 +146,25 @@ class ChannelMap:
         out_a = self._audio_channel_set | other._audio_channel_set
 
         return ChannelMap(v=out_v, audio_channels=out_a)
+
+
+@lru_cache(maxsize=None)
+def _event_channel_mask(event_str: str) -> int:
+    # The bitmask of an event statement's channels field. There are only a
+    # handful of distinct channels fields in a list, so each is only decoded
+    # once.
+    channel_map = ChannelMap()
+    channel_map._append_event(event_str)
+    return channel_map.bitmask
+
+
+def _audio_ext_channel_mask(mask: int, audio_ext) -> int:
+    # Applies an "AUD" statement to a bitmask the same way
+    # ChannelMap._append_ext() does.
+    for (c, enabled) in ((3, audio_ext.audio3), (4, audio_ext.audio4)):
+        if enabled:
+            mask |= 1 << c
+        else:
+            mask &= ~(1 << c)
+
+    return mask
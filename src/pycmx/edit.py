@@ -12,10 +12,13 @@ from .statements import (
     StmtSourceFile,
     StmtEffectsName,
 )
+from .event_table import EventRow, LazyStmtEvent
 from .transition import Transition
-from .channel_map import ChannelMap
+from .channel_map import (ChannelMap, _audio_ext_channel_mask,
+                          _event_channel_mask)
+from .timecode import Timecode
 
-from typing import Optional
+from typing import Optional, Union
 
 
 class Edit:
@@ -24,9 +27,22 @@ class Edit:
     recorder timecode in and out, a transition and channels.
     """
 
+    __slots__ = (
+        "_edit_statement",
+        "_audio_ext",
+        "_clip_name_statement",
+        "_source_file_statement",
+        "_trans_name_statement",
+        "_asc_sop_statement",
+        "_asc_sat_statement",
+        "_frmc_statement",
+        "_drop_frame",
+        "_channel_mask",
+    )
+
     def __init__(
         self,
-        edit_statement: StmtEvent,
+        edit_statement: Union[StmtEvent, EventRow, LazyStmtEvent],
         audio_ext_statement: Optional[StmtAudioExt],
         clip_name_statement: Optional[StmtClipName],
         source_file_statement: Optional[StmtSourceFile],
@@ -34,8 +50,10 @@ class Edit:
         asc_sop_statement: Optional[StmtCdlSop] = None,
         asc_sat_statement: Optional[StmtCdlSat] = None,
         frmc_statement: Optional[StmtFrmc] = None,
+        drop_frame: bool = False,
     ) -> None:
-        self._edit_statement: StmtEvent = edit_statement
+        self._edit_statement: Union[StmtEvent, EventRow, LazyStmtEvent] = \
+            edit_statement
         self._audio_ext: Optional[StmtAudioExt] = audio_ext_statement
         self._clip_name_statement: Optional[StmtClipName] = clip_name_statement
         self._source_file_statement: Optional[StmtSourceFile] = \
@@ -45,6 +63,13 @@ class Edit:
         self._asc_sop_statement: Optional[StmtCdlSop] = asc_sop_statement
         self._asc_sat_statement: Optional[StmtCdlSat] = asc_sat_statement
         self._frmc_statement: Optional[StmtFrmc] = frmc_statement
+        self._drop_frame: bool = drop_frame
+
+        channel_mask = _event_channel_mask(edit_statement.channels)
+        if audio_ext_statement is not None:
+            channel_mask = _audio_ext_channel_mask(channel_mask,
+                                                   audio_ext_statement)
+        self._channel_mask: int = channel_mask
 
     @property
     def line_number(self) -> int:
@@ -60,11 +85,17 @@ class Edit:
         """
         Get the :obj:`ChannelMap` object associated with this Edit.
         """
-        cm = ChannelMap()
-        cm._append_event(self._edit_statement.channels)
-        if self._audio_ext is not None:
-            cm._append_ext(self._audio_ext)
-        return cm
+        return ChannelMap.from_bitmask(self._channel_mask)
+
+    @property
+    def channel_mask(self) -> int:
+        """
+        Get the channels of this edit as an integer bitmask, the same as the
+        :attr:`~pycmx.channel_map.ChannelMap.bitmask` of :attr:`channels`.
+        Bit 0 is set if video is included, and bit `n` is set if audio
+        channel `n` is included.
+        """
+        return self._channel_mask
 
     @property
     def transition(self) -> Transition:
@@ -113,6 +144,54 @@ class Edit:
 
         return self._edit_statement.record_out
 
+    @property
+    def drop_frame(self) -> bool:
+        """
+        `True` if the "FCM:" statement in effect for this edit was "DROP
+        FRAME". This determines how the timecode methods read this edit's
+        timecodes.
+        """
+        return self._drop_frame
+
+    def source_in_timecode(self, rate: int) -> Timecode:
+        """
+        Get the source in as a :class:`~pycmx.timecode.Timecode` at `rate`
+        nominal frames per second.
+
+        :raises ValueError: if the source in is not a valid timecode.
+        """
+        return self._timecode(self._edit_statement.source_in, rate)
+
+    def source_out_timecode(self, rate: int) -> Timecode:
+        """
+        Get the source out as a :class:`~pycmx.timecode.Timecode` at `rate`
+        nominal frames per second.
+
+        :raises ValueError: if the source out is not a valid timecode.
+        """
+        return self._timecode(self._edit_statement.source_out, rate)
+
+    def record_in_timecode(self, rate: int) -> Timecode:
+        """
+        Get the record in as a :class:`~pycmx.timecode.Timecode` at `rate`
+        nominal frames per second.
+
+        :raises ValueError: if the record in is not a valid timecode.
+        """
+        return self._timecode(self._edit_statement.record_in, rate)
+
+    def record_out_timecode(self, rate: int) -> Timecode:
+        """
+        Get the record out as a :class:`~pycmx.timecode.Timecode` at `rate`
+        nominal frames per second.
+
+        :raises ValueError: if the record out is not a valid timecode.
+        """
+        return self._timecode(self._edit_statement.record_out, rate)
+
+    def _timecode(self, text: str, rate: int) -> Timecode:
+        return Timecode.parse(text, rate, self._drop_frame)
+
     @property
     def source(self) -> str:
         """
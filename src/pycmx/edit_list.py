@@ -1,23 +1,78 @@
 # pycmx
 # (c) 2018-2025 Jamie Hardt
 
-from .statements import (StmtCorruptRemark, StmtTitle, StmtEvent,
+from .statements import (StmtCorruptRemark, StmtTitle, StmtFCM,
                          StmtUnrecognized, StmtSourceUMID)
 from .event import Event
+from .event_table import _EVENT_STATEMENT_TYPES
 from .channel_map import ChannelMap
+from .arrays import EditArrays, edit_list_arrays
+from .arrow import to_arrow_table
+from .edit import Edit
+from .record_index import RecordIndex
+from .source_index import SourceEntry, build_source_index
+from .timecode import Timecode
+from .timeline import Timeline
 
-from typing import Any, Generator
+from collections.abc import Sequence
+from itertools import chain
+from typing import (Any, Dict, Generator, Iterable, List, Optional, Tuple,
+                    Union)
+
+
+# EDL formats by the width of their event source field.
+_FORMATS = {8: '3600', 32: 'File32', 128: 'File128'}
 
 
 class EditList:
     """
     Represents an entire edit decision list as returned by
     :func:`~pycmx.parse_cmx_events.parse_cmx3600()`.
+
+    If `statements` is a sequence, like a list or tuple, the edit list can
+    be read any number of times. Any other iterable, like the generator
+    returned by :func:`~pycmx.parse_cmx_statements.iter_cmx3600_statements()`,
+    creates a *streaming* edit list: statements are consumed as the list is
+    read, and the list can only be read once.
     """
 
-    def __init__(self, statements: list):
-        self.title_statement: StmtTitle = statements[0]
-        self.event_statements = statements[1:]
+    def __init__(self, statements: Iterable):
+        if isinstance(statements, Sequence):
+            if len(statements) == 0:
+                raise ValueError("An edit list needs a title statement")
+
+            self.title_statement: StmtTitle = statements[0]
+            self.event_statements: Iterable = statements[1:]
+            if not isinstance(self.event_statements, list):
+                # streaming is False only when event_statements is a list.
+                self.event_statements = list(self.event_statements)
+        else:
+            statement_iter = iter(statements)
+            title_statement = next(statement_iter, None)
+            if title_statement is None:
+                raise ValueError("An edit list needs a title statement")
+
+            self.title_statement = title_statement
+            self.event_statements = statement_iter
+
+        # Set when the events of a streaming list have been read, and the
+        # format of a streaming list once it has been peeked.
+        self._stream_read = False
+        self._format: Optional[str] = None
+        self._events: Optional[Tuple[Event, ...]] = None
+        self._events_by_number: Optional[Dict[int, Event]] = None
+        self._record_indexes: Dict[int, RecordIndex] = {}
+        self._timelines: Dict[int, Timeline] = {}
+        self._source_indexes: Dict[Tuple[int, int, str],
+                                   Dict[str, SourceEntry]] = {}
+
+    @property
+    def streaming(self) -> bool:
+        """
+        `True` if this edit list reads its statements from a stream. A
+        streaming edit list can only be read once.
+        """
+        return not isinstance(self.event_statements, list)
 
     @property
     def format(self) -> str:
@@ -26,34 +81,54 @@ class EditList:
         "File128", and "unknown".
 
         Adobe EDLs with more than 999 events will be reported as "3600".
+
+        On a streaming list, this reads statements up to the first event,
+        and they are kept to be read again with the events. It is not
+        available after the events of a streaming list have been read.
         """
-        first_event = next(
-            (s for s in self.event_statements if type(s) is StmtEvent), None)
+        if not self.streaming:
+            return _format_of(next((s for s in self.event_statements
+                                    if type(s) in _EVENT_STATEMENT_TYPES),
+                                   None))
 
-        if first_event:
-            if first_event.source_field_size == 8:
-                return '3600'
-            elif first_event.source_field_size == 32:
-                return 'File32'
-            elif first_event.source_field_size == 128:
-                return 'File128'
-            else:
-                return 'unknown'
-        else:
-            return 'unknown'
+        if self._format is None:
+            self._format = _format_of(self._peek_first_event())
+
+        return self._format
+
+    def _peek_first_event(self) -> Any:
+        self._check_stream_unread("format")
+        peeked: List[Any] = []
+        first_event = None
+        for stmt in self.event_statements:
+            peeked.append(stmt)
+            if type(stmt) in _EVENT_STATEMENT_TYPES:
+                first_event = stmt
+                break
+
+        self.event_statements = chain(peeked, self.event_statements)
+        return first_event
 
     @property
     def channels(self) -> ChannelMap:
         """
         Return the union of every channel channel.
         """
+        return ChannelMap.from_bitmask(self.channel_mask)
 
-        retval = ChannelMap()
-        for event in self.events:
-            for edit in event.edits:
-                retval = retval | edit.channels
+    @property
+    def channel_mask(self) -> int:
+        """
+        The union of the channels of every edit in the list, as an integer
+        bitmask like :attr:`~pycmx.edit.Edit.channel_mask`.
 
-        return retval
+        This property is not available on a streaming list.
+        """
+        mask = 0
+        for event in self._event_table("channel_mask"):
+            mask |= event.channel_mask
+
+        return mask
 
     @property
     def title(self) -> str:
@@ -68,42 +143,280 @@ class EditList:
         A generator for all the unrecognized statements and
         corrupt remarks in the list.
 
+        This property is not available on a streaming list.
+
         :yields: either a :class:`StmtUnrecognized` or
             :class:`StmtCorruptRemark`
         """
-        for s in self.event_statements:
-            if type(s) is StmtUnrecognized or type(s) in StmtCorruptRemark:
-                yield s
+        return (s for s in self._statement_list("unrecognized_statements")
+                if type(s) is StmtUnrecognized or
+                type(s) is StmtCorruptRemark)
 
     @property
-    def events(self) -> Generator[Event, None, None]:
-        'A generator for all the events in the edit list'
-        current_event_num = None
-        event_statements = []
-        for stmt in self.event_statements:
-            if type(stmt) is StmtEvent:
+    def events(self) -> Union[Tuple[Event, ...], Generator[Event, None, None]]:
+        """
+        A tuple of all the events in the edit list, in the order they appear.
+        Events are grouped the first time this property is read, and later
+        reads return the same tuple.
+
+        If the list is streaming, this is instead a generator, and each event
+        is yielded as soon as the statement that begins the next event has
+        been read, and the events can only be read once.
+
+        :raises TypeError: if the events of a streaming list have already
+            been read.
+        """
+        if self.streaming:
+            self._check_stream_unread("events")
+            self._stream_read = True
+            return _group_events(self.event_statements)
+
+        if self._events is None:
+            self._events = tuple(_group_events(self.event_statements))
+
+        return self._events
+
+    def event(self, number: int) -> Optional[Event]:
+        """
+        Get the event with event number `number`, or `None` if there is no
+        such event. If more than one event has the same number, the first is
+        returned.
+
+        This method is not available on a streaming list.
+        """
+        if self._events_by_number is None:
+            by_number: Dict[int, Event] = {}
+            for e in self._event_table("event()"):
+                if len(e._edit_statements()) > 0:
+                    by_number.setdefault(e.number, e)
+
+            self._events_by_number = by_number
+
+        return self._events_by_number.get(number, None)
+
+    def record_index(self, rate: int) -> RecordIndex:
+        """
+        Get a :class:`~pycmx.record_index.RecordIndex` of every edit in the
+        list, reading record timecodes at `rate` nominal frames per second.
+        The index is created the first time it is requested for a rate.
+
+        This method is not available on a streaming list.
+
+        :raises ValueError: if any edit has an invalid record timecode.
+        """
+        if rate not in self._record_indexes:
+            self._record_indexes[rate] = RecordIndex(
+                (edit for event in self._event_table("record_index()")
+                 for edit in event.edits), rate)
+
+        return self._record_indexes[rate]
+
+    def timeline(self, rate: int) -> Timeline:
+        """
+        Get a :class:`~pycmx.timeline.Timeline` of the list, flattened into
+        one track per channel, reading record timecodes at `rate` nominal
+        frames per second. The timeline is created the first time it is
+        requested for a rate.
+
+        This method is not available on a streaming list.
+
+        :raises ValueError: if any edit has an invalid record timecode.
+        """
+        if rate not in self._timelines:
+            self._timelines[rate] = Timeline(
+                (edit for event in self._event_table("timeline()")
+                 for edit in event.edits), rate)
+
+        return self._timelines[rate]
+
+    def edits_at(self, tc: Timecode,
+                 channels: Optional[Union[ChannelMap, int]] = None
+                 ) -> List[Edit]:
+        """
+        Get the edits playing at record time `tc`, in order of record in.
+        An edit plays from its record in up to, but not including, its
+        record out. The record times of the edits are read at the rate of
+        `tc`.
+
+        :param channels: If given, only edits on at least one of these
+            channels are returned. May be a
+            :class:`~pycmx.channel_map.ChannelMap` or a channel bitmask.
+        """
+        return self.record_index(tc.rate).edits_at(tc, channels)
+
+    def edits_between(self, start: Timecode, end: Timecode,
+                      channels: Optional[Union[ChannelMap, int]] = None
+                      ) -> List[Edit]:
+        """
+        Get the edits that play at any time from record time `start` up to
+        `end`, in order of record in. The record times of the edits are read
+        at the rate of `start`.
+
+        :param channels: If given, only edits on at least one of these
+            channels are returned. May be a
+            :class:`~pycmx.channel_map.ChannelMap` or a channel bitmask.
+        """
+        return self.record_index(start.rate).edits_between(start, end,
+                                                           channels)
+
+    def source_index(self, rate: int, handles: int = 0,
+                     key: str = "source") -> Dict[str, SourceEntry]:
+        """
+        Get every edit in the list grouped by source, for pull lists and reel
+        reports. Each :class:`~pycmx.source_index.SourceEntry` holds the
+        source's edits and the merged source timecode ranges they use. The
+        index is created the first time it is requested with a set of
+        arguments.
+
+        This method is not available on a streaming list.
+
+        :param rate: The nominal frame rate to read source timecodes at.
+        :param handles: A number of frames to add to the start and end of
+            each source range before ranges are merged.
+        :param key: The :class:`~pycmx.edit.Edit` property to group by, one of
+            "source", "source_file" or "clip_name".
+        :raises ValueError: if `key` is not valid or an edit has an invalid
+            source timecode.
+        """
+        index_key = (rate, handles, key)
+        if index_key not in self._source_indexes:
+            self._source_indexes[index_key] = build_source_index(
+                (edit for event in self._event_table("source_index()")
+                 for edit in event.edits), rate, handles, key)
+
+        return self._source_indexes[index_key]
+
+    def _check_stream_unread(self, caller: str):
+        if self._stream_read:
+            raise TypeError(f"{caller} is not available after a streaming "
+                            "EditList has been read")
+
+    def _statement_list(self, caller: str) -> List[Any]:
+        if self.streaming:
+            raise TypeError(f"{caller} is not available on a streaming "
+                            "EditList")
+
+        return self.event_statements
+
+    def _event_table(self, caller: str) -> Tuple[Event, ...]:
+        if self.streaming:
+            raise TypeError(f"{caller} is not available on a streaming "
+                            "EditList")
+
+        return self.events
+
+    def to_arrays(self, rate: int) -> EditArrays:
+        """
+        Get every edit in the list as a row in a NumPy structured array, for
+        vectorized analysis. Timecodes are read as frame counts at `rate`
+        nominal frames per second. See :class:`~pycmx.arrays.EditArrays` for
+        the fields.
+
+        This method requires NumPy, which is installed with the "numpy"
+        extra.
+
+        :raises ValueError: if any edit has an invalid timecode, or is on an
+            audio channel above A63.
+        """
+        return edit_list_arrays(self, rate)
+
+    def to_arrow(self, rate: int) -> Any:
+        """
+        Get every edit in the list as a row in a `pyarrow.Table`, for
+        analytics. Timecodes are read as frame counts at `rate` nominal frames
+        per second. See :func:`~pycmx.arrow.arrow_schema()` for the fields,
+        and :func:`~pycmx.arrow.write_parquet()` to export many lists.
+
+        This method requires pyarrow, which is installed with the "arrow"
+        extra.
+
+        :raises ValueError: if any edit has an invalid timecode, or is on an
+            audio channel above A63.
+        """
+        return to_arrow_table([self], rate)
+
+    @property
+    def sources(self) -> Generator[StmtSourceUMID, None, None]:
+        """
+        A generator for all of the sources in the list.
+
+        This property is not available on a streaming list.
+        """
+        return (s for s in self._statement_list("sources")
+                if type(s) is StmtSourceUMID)
+
+
+def _format_of(first_event: Any) -> str:
+    if first_event is None:
+        return 'unknown'
+
+    return _FORMATS.get(first_event.source_field_size, 'unknown')
+
+
+def _group_events(statements: Iterable,
+                  drop_frame: bool = False) -> Generator[Event, None, None]:
+    grouper = _EventGrouper(drop_frame)
+    yield from grouper.feed(statements)
+    yield grouper.finish()
+
+
+class _EventGrouper:
+    # Groups statements into events as they are fed in, so statements that
+    # arrive in batches, like from a network stream, can be grouped without
+    # holding the whole list.
+
+    __slots__ = ("drop_frame", "event_drop_frame", "current_event_num",
+                 "event_statements")
+
+    def __init__(self, drop_frame: bool = False):
+        # The FCM statement most recently read, and the one in effect for
+        # the current event.
+        self.drop_frame = drop_frame
+        self.event_drop_frame = drop_frame
+
+        self.current_event_num = None
+        self.event_statements: List[Any] = []
+
+    def feed(self, statements: Iterable) -> Generator[Event, None, None]:
+        """
+        Add statements, yielding each event they complete.
+        """
+        drop_frame = self.drop_frame
+        event_drop_frame = self.event_drop_frame
+        current_event_num = self.current_event_num
+        event_statements = self.event_statements
+
+        for stmt in statements:
+            if type(stmt) in _EVENT_STATEMENT_TYPES:
                 if current_event_num is None:
                     current_event_num = stmt.event
+                    event_drop_frame = drop_frame
                     event_statements.append(stmt)
                 else:
                     if current_event_num != stmt.event:
-                        yield Event(statements=event_statements)
+                        yield Event(statements=event_statements,
+                                    drop_frame=event_drop_frame)
                         event_statements = [stmt]
                         current_event_num = stmt.event
+                        event_drop_frame = drop_frame
                     else:
                         event_statements.append(stmt)
 
             else:
+                if type(stmt) is StmtFCM:
+                    drop_frame = stmt.drop
+
                 event_statements.append(stmt)
 
-        yield Event(statements=event_statements)
+        self.drop_frame = drop_frame
+        self.event_drop_frame = event_drop_frame
+        self.current_event_num = current_event_num
+        self.event_statements = event_statements
 
-    @property
-    def sources(self) -> Generator[StmtSourceUMID, None, None]:
+    def finish(self) -> Event:
         """
-        A generator for all of the sources in the list
+        The last event, with every statement fed since the last event
+        completed.
         """
-
-        for stmt in self.event_statements:
-            if type(stmt) is StmtSourceUMID:
-                yield stmt
+        return Event(statements=self.event_statements,
+                     drop_frame=self.event_drop_frame)
@@ -5,8 +5,9 @@ from .statements import (StmtFrmc, StmtEvent, StmtClipName, StmtSourceFile,
                          StmtAudioExt, StmtUnrecognized, StmtEffectsName,
                          StmtCdlSop, StmtCdlSat)
 from .edit import Edit
+from .event_table import _EVENT_STATEMENT_TYPES
 
-from typing import List, Generator, Optional, Tuple, Any
+from typing import Dict, List, Generator, Optional, Tuple, Any
 
 
 class Event:
@@ -14,15 +15,28 @@ class Event:
     Represents a collection of :class:`~pycmx.edit.Edit` s, all with the same
     event number. """
 
-    def __init__(self, statements):
+    __slots__ = ("statements", "drop_frame", "_edits", "_statements_by_type")
+
+    def __init__(self, statements, drop_frame: bool = False):
         self.statements = statements
 
+        #: `True` if the most recent "FCM:" statement before this event was
+        #: "DROP FRAME".
+        self.drop_frame: bool = drop_frame
+
+        self._edits: Optional[List[Edit]] = None
+        self._statements_by_type: Optional[Dict[type, List[Any]]] = None
+
     @property
     def number(self) -> int:
         """
         Return the event number.
         """
-        return int(self._edit_statements()[0].event)
+        for s in self.statements:
+            if type(s) in _EVENT_STATEMENT_TYPES:
+                return int(s.event)
+
+        raise IndexError("Event has no event statements")
 
     @property
     def edits(self) -> List[Edit]:
@@ -30,8 +44,32 @@ class Event:
         Returns the edits. Most events will have a single edit, a single event
         will have multiple edits when a dissolve, wipe or key transition needs
         to be performed.
+
+        The edits are created the first time this property is read, later
+        reads return the same list.
         """
+        if self._edits is None:
+            self._edits = self._make_edits()
 
+            # The statements sorted by type aren't needed once the edits are
+            # made, they're released to save memory.
+            self._statements_by_type = None
+
+        return self._edits
+
+    @property
+    def channel_mask(self) -> int:
+        """
+        The union of the channels of every edit in the event, as an integer
+        bitmask like :attr:`~pycmx.edit.Edit.channel_mask`.
+        """
+        mask = 0
+        for edit in self.edits:
+            mask |= edit.channel_mask
+
+        return mask
+
+    def _make_edits(self) -> List[Edit]:
         # FTR this is a totall bonkers way of doing this, I wrote this when
         # I was still learning Python and I'm sure there's easier ways to do
         # it. The job is complicated because multiple edits can occur in one
@@ -89,14 +127,19 @@ class Event:
         except IndexError:
             the_zip.append([None] * len(edits_audio))
 
+        asc_sop_statement = self._asc_sop_statement()
+        asc_sat_statement = self._asc_sat_statement()
+        frmc_statement = self._frmc_statement()
+
         return [Edit(edit_statement=e1[0],
                      audio_ext_statement=e1[1],
                      clip_name_statement=n1,
                      source_file_statement=s1,
                      trans_name_statement=u1,
-                     asc_sop_statement=self._asc_sop_statement(),
-                     asc_sat_statement=self._asc_sat_statement(),
-                     frmc_statement=self._frmc_statement())
+                     asc_sop_statement=asc_sop_statement,
+                     asc_sat_statement=asc_sat_statement,
+                     frmc_statement=frmc_statement,
+                     drop_frame=self.drop_frame)
                 for (e1, n1, s1, u1) in zip(*the_zip)]
 
     @property
@@ -105,42 +148,61 @@ class Event:
         """
         A generator for all the unrecognized statements in the event.
         """
-        for s in self.statements:
-            if type(s) is StmtUnrecognized:
-                yield s
+        for s in self._statements_of_type(StmtUnrecognized):
+            yield s
+
+    def _statements_of_type(self, stmt_type: type) -> List[Any]:
+        # All the statements are sorted into lists by type in one pass, the
+        # first time any of them are needed.
+        if self._statements_by_type is None:
+            by_type: Dict[type, List[Any]] = {}
+            for s in self.statements:
+                by_type.setdefault(_STATEMENT_KINDS.get(type(s), type(s)),
+                                   []).append(s)
+
+            self._statements_by_type = by_type
+
+        return self._statements_by_type.get(stmt_type, [])
 
     def _trans_name_statements(self) -> List[StmtEffectsName]:
-        return [s for s in self.statements if type(s) is StmtEffectsName]
+        return self._statements_of_type(StmtEffectsName)
 
     def _edit_statements(self) -> List[StmtEvent]:
-        return [s for s in self.statements if type(s) is StmtEvent]
+        return self._statements_of_type(StmtEvent)
 
     def _clip_name_statements(self) -> List[StmtClipName]:
-        return [s for s in self.statements if type(s) is StmtClipName]
+        return self._statements_of_type(StmtClipName)
 
     def _source_file_statements(self) -> List[StmtSourceFile]:
-        return [s for s in self.statements if type(s) is StmtSourceFile]
+        return self._statements_of_type(StmtSourceFile)
 
     def _statements_with_audio_ext(self) -> Generator[
             Tuple[StmtEvent, Optional[StmtAudioExt]], None, None]:
 
-        if len(self.statements) == 1 and type(self.statements[0]) is StmtEvent:
-            yield (self.statements[0], None)
+        # Each event statement is paired with the statement after it, the
+        # last statement is paired with None.
+        following = list(self.statements[1:]) + [None]
+        for (s1, s2) in zip(self.statements, following):
+            if type(s1) in _EVENT_STATEMENT_TYPES and \
+                    type(s2) is StmtAudioExt:
+                yield (s1, s2)
+            elif type(s1) in _EVENT_STATEMENT_TYPES:
+                yield (s1, None)
 
-        else:
-            for (s1, s2) in zip(self.statements, self.statements[1:]):
-                if type(s1) is StmtEvent and type(s2) is StmtAudioExt:
-                    yield (s1, s2)
-                elif type(s1) is StmtEvent:
-                    yield (s1, None)
+    def _first_statement_of_type(self, stmt_type: type) -> Optional[Any]:
+        statements = self._statements_of_type(stmt_type)
+        return statements[0] if len(statements) > 0 else None
 
     def _asc_sop_statement(self) -> Optional[StmtCdlSop]:
-        return next((s for s in self.statements if type(s) is StmtCdlSop),
-                    None)
+        return self._first_statement_of_type(StmtCdlSop)
 
     def _asc_sat_statement(self) -> Optional[StmtCdlSat]:
-        return next((s for s in self.statements if type(s) is StmtCdlSat),
-                    None)
+        return self._first_statement_of_type(StmtCdlSat)
 
     def _frmc_statement(self) -> Optional[StmtFrmc]:
-        return next((s for s in self.statements if type(s) is StmtFrmc), None)
+        return self._first_statement_of_type(StmtFrmc)
+
+
+# Statement classes that are sorted with another statement class.
+_STATEMENT_KINDS: Dict[type, type] = {t: StmtEvent for t in
+                                      _EVENT_STATEMENT_TYPES}
@@ -0,0 +1,238 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+import re
+from array import array
+from typing import Dict, Generator, Iterable, List, Tuple
+
+from .statements import StmtEvent
+from .util import SlicePlan
+
+
+_TIMECODE_RE = re.compile(r'^[0-9]{2}:[0-9]{2}:[0-9]{2}:[0-9]{2}$')
+
+
+class EventTable:
+    """
+    Columnar storage for event statements. Event numbers, timecodes and
+    line numbers are stored as integers in arrays, and sources, channels
+    and transitions as indexes into tables of interned strings.
+
+    Each statement stored in the table is represented by an
+    :class:`EventRow`, which reads its fields from the table.
+    """
+
+    def __init__(self):
+        self._strings: List[str] = []
+        self._string_indexes: Dict[str, int] = {}
+
+        self.event_numbers = array('q')
+        self.event_widths = array('H')
+        self.sources = array('l')
+        self.channels = array('l')
+        self.transitions = array('l')
+        self.transition_operands = array('l')
+
+        #: Source in, source out, record in and record out for each row, as
+        #: HHMMSSFF decimal integers.
+        self.timecodes = array('q')
+
+        self.source_field_sizes = array('l')
+        self.line_numbers = array('q')
+
+    def __len__(self) -> int:
+        return len(self.line_numbers)
+
+    def string(self, index: int) -> str:
+        """
+        Get an interned string from the table by index.
+        """
+        return self._strings[index]
+
+    def compact(self, statements: Iterable) -> Generator[object, None, None]:
+        """
+        Store every :class:`~pycmx.statements.StmtEvent` in `statements` in
+        the table, yielding an :class:`EventRow` in its place. Every other
+        statement, and any event statement with a field that cannot be
+        stored, is yielded unchanged.
+        """
+        for stmt in statements:
+            if type(stmt) is StmtEvent and _can_store(stmt):
+                yield self._append(stmt)
+            else:
+                yield stmt
+
+    def _append(self, stmt: StmtEvent) -> "EventRow":
+        self.event_numbers.append(int(stmt.event))
+        self.event_widths.append(len(stmt.event))
+        self.sources.append(self._intern(stmt.source))
+        self.channels.append(self._intern(stmt.channels))
+        self.transitions.append(self._intern(stmt.trans))
+        self.transition_operands.append(self._intern(stmt.trans_op))
+        self.timecodes.extend((_pack_timecode(stmt.source_in),
+                               _pack_timecode(stmt.source_out),
+                               _pack_timecode(stmt.record_in),
+                               _pack_timecode(stmt.record_out)))
+        self.source_field_sizes.append(stmt.source_field_size)
+        self.line_numbers.append(stmt.line_number)
+        return EventRow(self, len(self.line_numbers) - 1)
+
+    def _intern(self, string: str) -> int:
+        index = self._string_indexes.get(string, None)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(string)
+            self._string_indexes[string] = index
+
+        return index
+
+
+class EventRow:
+    """
+    An event statement stored in an :class:`EventTable`. An `EventRow` has
+    the same fields as a :class:`~pycmx.statements.StmtEvent`.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: EventTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def event(self) -> str:
+        width = self._table.event_widths[self._row]
+        return f"{self._table.event_numbers[self._row]:0{width}d}"
+
+    @property
+    def source(self) -> str:
+        return self._table.string(self._table.sources[self._row])
+
+    @property
+    def channels(self) -> str:
+        return self._table.string(self._table.channels[self._row])
+
+    @property
+    def trans(self) -> str:
+        return self._table.string(self._table.transitions[self._row])
+
+    @property
+    def trans_op(self) -> str:
+        return self._table.string(self._table.transition_operands[self._row])
+
+    @property
+    def source_in(self) -> str:
+        return self._timecode(0)
+
+    @property
+    def source_out(self) -> str:
+        return self._timecode(1)
+
+    @property
+    def record_in(self) -> str:
+        return self._timecode(2)
+
+    @property
+    def record_out(self) -> str:
+        return self._timecode(3)
+
+    @property
+    def source_field_size(self) -> int:
+        return self._table.source_field_sizes[self._row]
+
+    @property
+    def line_number(self) -> int:
+        return self._table.line_numbers[self._row]
+
+    def _timecode(self, column: int) -> str:
+        return _unpack_timecode(self._table.timecodes[self._row * 4 + column])
+
+    def __repr__(self) -> str:
+        return (f"EventRow(event={self.event!r}, source={self.source!r}, "
+                f"line_number={self.line_number})")
+
+
+class LazyStmtEvent:
+    """
+    An event statement that keeps its line and column layout, and decodes
+    each field from the line when it is read. A `LazyStmtEvent` has the same
+    fields as a :class:`~pycmx.statements.StmtEvent`, and is created by
+    parsing with `lazy=True`.
+    """
+
+    __slots__ = ("_line", "_plan", "line_number")
+
+    def __init__(self, line: str, plan: SlicePlan, line_number: int):
+        self._line = line
+        self._plan = plan
+        self.line_number = line_number
+
+    @property
+    def event(self) -> str:
+        return self._line[self._plan.slices[0]]
+
+    @property
+    def source(self) -> str:
+        return self._line[self._plan.slices[2]].strip()
+
+    @property
+    def channels(self) -> str:
+        return self._line[self._plan.slices[4]].strip()
+
+    @property
+    def trans(self) -> str:
+        return self._line[self._plan.slices[6]].strip()
+
+    @property
+    def trans_op(self) -> str:
+        return self._line[self._plan.slices[8]].strip()
+
+    @property
+    def source_in(self) -> str:
+        return self._line[self._plan.slices[10]].strip()
+
+    @property
+    def source_out(self) -> str:
+        return self._line[self._plan.slices[12]].strip()
+
+    @property
+    def record_in(self) -> str:
+        return self._line[self._plan.slices[14]].strip()
+
+    @property
+    def record_out(self) -> str:
+        return self._line[self._plan.slices[16]].strip()
+
+    @property
+    def source_field_size(self) -> int:
+        source = self._plan.slices[2]
+        return source.stop - source.start
+
+    def __repr__(self) -> str:
+        return (f"LazyStmtEvent(line={self._line!r}, "
+                f"line_number={self.line_number})")
+
+
+# Statement classes that stand in for StmtEvent.
+_EVENT_STATEMENT_TYPES: Tuple[type, ...] = (StmtEvent, EventRow,
+                                            LazyStmtEvent)
+
+
+def _can_store(stmt: StmtEvent) -> bool:
+    # Event numbers of up to 18 digits fit in a signed 64-bit integer.
+    return isinstance(stmt.event, str) and stmt.event.isdigit() and \
+        stmt.event.isascii() and len(stmt.event) <= 18 and \
+        all(_TIMECODE_RE.match(tc) is not None for tc in
+            (stmt.source_in, stmt.source_out, stmt.record_in,
+             stmt.record_out))
+
+
+def _pack_timecode(tc: str) -> int:
+    return int(tc[0:2] + tc[3:5] + tc[6:8] + tc[9:11])
+
+
+def _unpack_timecode(packed: int) -> str:
+    hhmm, ssff = divmod(packed, 10000)
+    hh, mm = divmod(hhmm, 100)
+    ss, ff = divmod(ssff, 100)
+    return f"{hh:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
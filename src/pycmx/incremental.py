@@ -0,0 +1,203 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from io import StringIO
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .edit_list import EditList, _group_events
+from .event import Event
+from .parse_cmx_statements import _parse_cmx3600_line
+from .statements import StmtFCM
+
+
+class IncrementalParser:
+    """
+    Parses successive versions of the same EDL, like a file that is
+    re-exported with small changes. Each version is compared line-by-line
+    with the one before, and only the lines between the first and last
+    changed lines are parsed again.
+
+    Events made entirely of unchanged statements are kept from the previous
+    :class:`~pycmx.edit_list.EditList`, along with their edits. If lines were
+    added or removed, the statements after the change have new line numbers,
+    so their events are regrouped, but their lines are not parsed again.
+    If the first line, which is read as the title, changes, every event is
+    regrouped.
+
+    :param bool tolerant: Passed to
+        :func:`~pycmx.parse_cmx_events.parse_cmx3600`.
+    """
+
+    def __init__(self, tolerant: bool = False):
+        self.tolerant = tolerant
+
+        #: The edit list from the most recent call to :meth:`update()`.
+        self.edit_list: Optional[EditList] = None
+
+        #: The number of lines parsed by the most recent call to
+        #: :meth:`update()`.
+        self.lines_parsed: int = 0
+
+        self._lines: List[str] = []
+        self._statements: List[object] = []
+
+    def update(self, text: str) -> EditList:
+        """
+        Parse a new version of the EDL.
+
+        :param text: The complete text of the EDL.
+        :returns: An :class:`~pycmx.edit_list.EditList` of the new version.
+        """
+        lines = StringIO(text).readlines()
+        old_lines = self._lines
+
+        shortest = min(len(lines), len(old_lines))
+        prefix = 0
+        while prefix < shortest and lines[prefix] == old_lines[prefix]:
+            prefix += 1
+
+        suffix = 0
+        while suffix < shortest - prefix and \
+                lines[-1 - suffix] == old_lines[-1 - suffix]:
+            suffix += 1
+
+        changed_end = len(lines) - suffix
+        changed = [_parse_cmx3600_line(lines[i].strip(), i, self.tolerant)
+                   for i in range(prefix, changed_end)]
+
+        unchanged_suffix = self._statements[len(old_lines) - suffix:]
+        offset = len(lines) - len(old_lines)
+        if offset != 0:
+            unchanged_suffix = [_renumber(s, offset)
+                                for s in unchanged_suffix]
+
+        statements = self._statements[:prefix] + changed + unchanged_suffix
+
+        edit_list = EditList(statements)
+        # The first statement is always read as the title, so the old events
+        # are only reused if the first line is unchanged. Otherwise the
+        # events are grouped from scratch when they are read.
+        if prefix > 0 and self.edit_list is not None and \
+                self.edit_list._events is not None:
+            edit_list._events = _regroup_events(
+                statements, self.edit_list._events, prefix,
+                len(old_lines) - suffix, offset)
+
+        self._lines = lines
+        self._statements = statements
+        self.lines_parsed = len(changed)
+        self.edit_list = edit_list
+        return edit_list
+
+
+def _renumber(stmt, offset: int):
+    if stmt is None:
+        return None
+
+    # line_number is the last field of every statement, rebuilding the tuple
+    # directly is more than twice as fast as _replace().
+    return stmt._make(stmt[:-1] + (stmt[-1] + offset,))
+
+
+def _regroup_events(statements: List[object], old_events: Tuple[Event, ...],
+                    changed_start: int, old_changed_end: int,
+                    offset: int) -> Tuple[Event, ...]:
+    # Leading events are kept if the event after them begins before the
+    # first changed statement. Events begin after the title, which is the
+    # first statement of both lists.
+    kept = 0
+    start = 1
+    for event in old_events:
+        end = start + len(event.statements)
+        if end >= changed_start:
+            break
+
+        kept += 1
+        start = end
+
+    drop_frame = False
+    if kept > 0:
+        drop_frame = _drop_frame_after(old_events[kept - 1].drop_frame,
+                                       old_events[kept - 1].statements)
+
+    # Trailing events are kept if they begin after the last changed
+    # statement. They begin at tail_start in the old list.
+    tail = len(old_events)
+    tail_start = 1 + sum(len(e.statements) for e in old_events)
+    while tail - 1 > kept and \
+            tail_start - len(old_events[tail - 1].statements) >= \
+            old_changed_end:
+        tail -= 1
+        tail_start -= len(old_events[tail].statements)
+
+    middle_statements = statements[start:tail_start + offset]
+    middle: List[Event] = []
+    if len(middle_statements) > 0:
+        middle = list(_group_events(middle_statements, drop_frame))
+
+    if tail < len(old_events) and \
+            _can_keep_tail(middle, drop_frame, middle_statements,
+                           old_events[tail]):
+        if offset == 0:
+            tail_events = old_events[tail:]
+        else:
+            tail_list = []
+            position = tail_start + offset
+            for event in old_events[tail:]:
+                count = len(event.statements)
+                tail_list.append(Event(
+                    statements=statements[position:position + count],
+                    drop_frame=event.drop_frame))
+                position += count
+
+            tail_events = tuple(tail_list)
+
+        return old_events[:kept] + \
+            _reuse_events(middle, old_events[kept:tail]) + tail_events
+
+    return old_events[:kept] + \
+        _reuse_events(_group_events(statements[start:], drop_frame),
+                      old_events[kept:])
+
+
+def _can_keep_tail(middle: List[Event], drop_frame: bool,
+                   middle_statements: List[object], first_tail: Event) -> bool:
+    # The first kept trailing event must not continue the last regrouped
+    # event, and the FCM state going into it must not have changed.
+    if len(middle) > 0:
+        last_edits = middle[-1]._edit_statements()
+        if len(last_edits) == 0 or \
+                last_edits[0].event == first_tail.statements[0].event:
+            return False
+
+    return _drop_frame_after(drop_frame, middle_statements) == \
+        first_tail.drop_frame
+
+
+def _drop_frame_after(drop_frame: bool, statements: List[object]) -> bool:
+    for stmt in statements:
+        if type(stmt) is StmtFCM:
+            drop_frame = stmt.drop
+
+    return drop_frame
+
+
+def _reuse_events(events: Iterable[Event],
+                  old_events: Tuple[Event, ...]) -> Tuple[Event, ...]:
+    old_by_first: Dict[int, Event] = {id(e.statements[0]): e
+                                      for e in old_events
+                                      if len(e.statements) > 0}
+    retval = []
+    for event in events:
+        old = old_by_first.get(id(event.statements[0]), None) \
+            if len(event.statements) > 0 else None
+
+        if old is not None and old.drop_frame == event.drop_frame and \
+                len(old.statements) == len(event.statements) and \
+                all(a is b for (a, b) in zip(old.statements,
+                                             event.statements)):
+            retval.append(old)
+        else:
+            retval.append(event)
+
+    return tuple(retval)
@@ -0,0 +1,167 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from itertools import repeat
+from typing import Generator, Iterable, List, Optional, Tuple, Union
+
+from .edit_list import EditList
+from .event_table import _EVENT_STATEMENT_TYPES
+from .statements import StmtEvent, StmtFCM, StmtTitle
+from .timecode import Timecode
+
+
+def merge(edit_lists: Iterable[EditList], rate: int,
+          offsets: Optional[Iterable[Union[Timecode, int]]] = None,
+          title: Optional[str] = None, streaming: bool = False) -> EditList:
+    """
+    Merge the edit lists of many reels into one list. The reels are
+    concatenated in the order of their earliest record in, after their
+    offsets are applied, and reels that start at the same time keep the
+    order they are given in. Events are renumbered from 1 and every
+    statement is given a new line number. ">>> SOURCE" lines, which aren't
+    parsed into statements, are left out of the merged list.
+
+    :param edit_lists: The lists to merge. These may not be streaming lists.
+    :param rate: The nominal frame rate to read record timecodes at.
+    :param offsets: If given, an offset for each list in `edit_lists`, as a
+        :class:`~pycmx.timecode.Timecode` at `rate` or a frame count. Each
+        offset is added to the record in and record out of every event in
+        its list.
+    :param title: The title of the merged list. The default is the title of
+        the first reel.
+    :param streaming: If `True`, return a streaming
+        :class:`~pycmx.edit_list.EditList` that merges the reels as it is
+        read. The reels are still ordered before the list is returned.
+    :raises ValueError: if an event has an invalid record timecode, an
+        offset moves a record timecode before 00:00:00:00, or the number of
+        offsets is not the number of lists.
+    :raises TypeError: if one of `edit_lists` is a streaming list.
+    """
+    statements = iter_merged_statements(edit_lists, rate, offsets, title)
+    if streaming:
+        return EditList(statements)
+    else:
+        return EditList(list(statements))
+
+
+def iter_merged_statements(
+        edit_lists: Iterable[EditList], rate: int,
+        offsets: Optional[Iterable[Union[Timecode, int]]] = None,
+        title: Optional[str] = None) -> Generator[object, None, None]:
+    """
+    A generator for each statement of the lists of many reels merged into
+    one, starting with the title, which can be given to
+    :func:`~pycmx.write_cmx_statements.write_cmx3600` to write the merged
+    list without holding it in memory. The arguments are the same as
+    :func:`merge()`.
+    """
+    edit_lists = list(edit_lists)
+    if offsets is None:
+        offsets = repeat(0, len(edit_lists))
+    else:
+        offsets = list(offsets)
+        if len(offsets) != len(edit_lists):
+            raise ValueError(f"{len(offsets)} offsets were given for "
+                             f"{len(edit_lists)} edit lists")
+
+    reels: List[Tuple[int, int, EditList]] = []
+    for (edit_list, offset) in zip(edit_lists, offsets):
+        if edit_list.streaming:
+            raise TypeError("A streaming EditList can't be merged")
+
+        offset_frames = _offset_frames(offset, rate)
+        start = _reel_start(edit_list, rate)
+        reels.append((start + offset_frames if start is not None else 0,
+                      offset_frames, edit_list))
+
+    reels.sort(key=lambda reel: reel[0])
+
+    if title is None:
+        title = reels[0][2].title if reels else ""
+    yield StmtTitle(title, 0)
+
+    line_number = 1
+    event_number = 0
+    merged_drop = False
+    for (_, offset_frames, edit_list) in reels:
+        reel_drop = False
+        reel_event = None
+        for stmt in edit_list.event_statements:
+            if type(stmt) is StmtFCM:
+                reel_drop = merged_drop = stmt.drop
+            elif type(stmt) in _EVENT_STATEMENT_TYPES:
+                if reel_drop != merged_drop:
+                    # The reel's events would be read with the frame count
+                    # mode of the reel before it.
+                    yield StmtFCM(reel_drop, line_number)
+                    line_number += 1
+                    merged_drop = reel_drop
+
+                if stmt.event != reel_event:
+                    reel_event = stmt.event
+                    event_number += 1
+
+                stmt = StmtEvent(
+                    event=f"{event_number:03d}",
+                    source=stmt.source,
+                    channels=stmt.channels,
+                    trans=stmt.trans,
+                    trans_op=stmt.trans_op,
+                    source_in=stmt.source_in,
+                    source_out=stmt.source_out,
+                    record_in=_shift(stmt.record_in, offset_frames, rate,
+                                     reel_drop),
+                    record_out=_shift(stmt.record_out, offset_frames, rate,
+                                      reel_drop),
+                    source_field_size=stmt.source_field_size,
+                    line_number=line_number)
+                line_number += 1
+                yield stmt
+                continue
+            elif stmt is None:
+                # ">>> SOURCE" lines are parsed to None, which keeps nothing
+                # of the line to write, so they aren't kept.
+                continue
+
+            # line_number is the last field of every other statement.
+            yield stmt._make(stmt[:-1] + (line_number,))
+            line_number += 1
+
+
+def _offset_frames(offset: Union[Timecode, int], rate: int) -> int:
+    if isinstance(offset, Timecode):
+        if offset.rate != rate:
+            raise ValueError(f"Offset rate {offset.rate} does not match "
+                             f"merge rate {rate}")
+        return offset.frames
+
+    return int(offset)
+
+
+def _reel_start(edit_list: EditList, rate: int) -> Optional[int]:
+    start = None
+    drop = False
+    for stmt in edit_list.event_statements:
+        if type(stmt) is StmtFCM:
+            drop = stmt.drop
+        elif type(stmt) in _EVENT_STATEMENT_TYPES:
+            frames = Timecode.parse(stmt.record_in, rate, drop).frames
+            if start is None or frames < start:
+                start = frames
+
+    return start
+
+
+def _shift(text: str, offset_frames: int, rate: int, drop: bool) -> str:
+    if offset_frames == 0:
+        return text
+
+    frames = Timecode.parse(text, rate, drop).frames + offset_frames
+    if frames < 0:
+        raise ValueError(f"Record timecode {text} is before 00:00:00:00 "
+                         f"when offset by {offset_frames} frames")
+
+    label = str(Timecode(frames, rate, drop))
+    # Keep the separator the label was written with, like ";" before the
+    # frames of a drop frame timecode.
+    return label[:8] + text[8] + label[9:]
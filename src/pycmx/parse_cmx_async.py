@@ -0,0 +1,105 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+import codecs
+from io import IncrementalNewlineDecoder
+from typing import AsyncGenerator, AsyncIterable, List, Union
+
+from .edit_list import EditList, _EventGrouper
+from .event import Event
+from .parse_cmx_statements import _parse_cmx3600_line
+
+
+async def aiter_cmx3600_statements(source: AsyncIterable[Union[bytes, str]],
+                                   tolerant: bool = False,
+                                   encoding: str = "utf-8"
+                                   ) -> AsyncGenerator[object, None]:
+    """
+    An asynchronous generator for every statement in an EDL read from an
+    asynchronous stream.
+
+    :param source: An asynchronous iterable of `bytes` or `str`, like an
+        :class:`asyncio.StreamReader` or an aiohttp response's `content`.
+        Items may be lines or chunks of any size.
+    :param tolerant: The same as
+        :func:`~pycmx.parse_cmx_events.parse_cmx3600`.
+    :param encoding: The encoding of the stream, if it yields `bytes`.
+    """
+    async for batch in _aiter_statement_batches(source, tolerant, encoding):
+        for stmt in batch:
+            yield stmt
+
+
+async def aiter_cmx3600_events(source: AsyncIterable[Union[bytes, str]],
+                               tolerant: bool = False,
+                               encoding: str = "utf-8"
+                               ) -> AsyncGenerator[Event, None]:
+    """
+    An asynchronous generator for every :class:`~pycmx.event.Event` in an
+    EDL read from an asynchronous stream. Each event is yielded as soon as
+    the first statement of the next event is read. The arguments are the
+    same as :func:`aiter_cmx3600_statements`.
+    """
+    grouper = _EventGrouper()
+    title_read = False
+
+    async for batch in _aiter_statement_batches(source, tolerant, encoding):
+        # The first statement is the title, as in EditList.
+        if not title_read and len(batch) > 0:
+            batch = batch[1:]
+            title_read = True
+
+        for event in grouper.feed(batch):
+            yield event
+
+    yield grouper.finish()
+
+
+async def aparse_cmx3600(source: AsyncIterable[Union[bytes, str]],
+                         tolerant: bool = False,
+                         encoding: str = "utf-8") -> EditList:
+    """
+    Parse a CMX 3600 EDL from an asynchronous stream. The arguments are the
+    same as :func:`aiter_cmx3600_statements`.
+    """
+    statements: List[object] = []
+    async for batch in _aiter_statement_batches(source, tolerant, encoding):
+        statements.extend(batch)
+
+    return EditList(statements)
+
+
+async def _aiter_statement_batches(source: AsyncIterable[Union[bytes, str]],
+                                   tolerant: bool, encoding: str
+                                   ) -> AsyncGenerator[List[object], None]:
+    # Yields the statements of the complete lines in each item read from
+    # source. Line endings are translated like a file opened in text mode.
+    decoder = None
+    is_bytes = False
+    pending = ""
+    line_number = 0
+
+    async for data in source:
+        if decoder is None:
+            is_bytes = isinstance(data, (bytes, bytearray))
+            decoder = IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(encoding)() if is_bytes
+                else None, translate=True)
+
+        lines = (pending + decoder.decode(data)).split("\n")
+        pending = lines.pop()
+
+        batch = [_parse_cmx3600_line(line.strip(), line_number + n, tolerant)
+                 for (n, line) in enumerate(lines)]
+        line_number += len(batch)
+        yield batch
+
+    if decoder is not None:
+        # A "\r" at the very end of the stream is only translated here.
+        lines = (pending + decoder.decode(b"" if is_bytes else "",
+                                          final=True)).split("\n")
+        if len(lines[-1]) == 0:
+            lines.pop()
+
+        yield [_parse_cmx3600_line(line.strip(), line_number + n, tolerant)
+               for (n, line) in enumerate(lines)]
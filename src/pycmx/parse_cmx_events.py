@@ -1,20 +1,91 @@
 # pycmx
 # (c) 2018-2025 Jamie Hardt
 
-from typing import TextIO
+import time
+from typing import Optional, TextIO
 
-from .parse_cmx_statements import (parse_cmx3600_statements)
+from .parse_cmx_statements import (parse_cmx3600_statements,
+                                   iter_cmx3600_statements,
+                                   iter_cmx3600_bytes_statements, Buffer)
 from .edit_list import EditList
+from .event_table import EventTable
+from .parse_stats import ParseStats
 
 
-def parse_cmx3600(f: TextIO, tolerant: bool = False) -> EditList:
+def parse_cmx3600(f: TextIO, tolerant: bool = False,
+                  streaming: bool = False, compact: bool = False,
+                  stats: Optional[ParseStats] = None,
+                  lazy: bool = False) -> EditList:
     """
     Parse a CMX 3600 EDL.
 
     :param TextIO f: a file-like object, an opened CMX 3600 .EDL file.
     :param bool tolerant: If `True`, a relaxed event line parsing method will
         be used, in the case the default method fails.
+    :param bool streaming: If `True`, `f` will be read line-by-line as the
+        returned edit list is read, instead of all at once. `f` must remain
+        open until you are finished reading the list, and the list can only
+        be read once.
+    :param bool compact: If `True`, event statements will be stored in an
+        :class:`~pycmx.event_table.EventTable`, which uses much less memory
+        for long lists. The fields of each event will be converted from the
+        table every time they are read.
+    :param stats: A :class:`~pycmx.parse_stats.ParseStats` to add counts and
+        timings to. If given, and the list isn't streaming, the events are
+        grouped before this function returns so the grouping can be timed.
+    :param bool lazy: If `True`, the fields of standard form event lines
+        will not be split out when the list is parsed, but each time they
+        are read, with :class:`~pycmx.event_table.LazyStmtEvent`. This is
+        faster for scans that read one or two fields of each edit. Lazy
+        events are not stored in the table if `compact` is also `True`.
     :returns: An :class:`pycmx.edit_list.EditList`.
     """
-    statements = parse_cmx3600_statements(f, tolerant)
-    return EditList(statements)
+    if streaming:
+        statements = iter_cmx3600_statements(f, tolerant, stats, lazy)
+        if compact:
+            return EditList(EventTable().compact(statements))
+
+        return EditList(statements)
+
+    if compact:
+        edit_list = EditList(list(EventTable().compact(
+            iter_cmx3600_statements(f, tolerant, stats, lazy))))
+    else:
+        edit_list = EditList(parse_cmx3600_statements(f, tolerant, stats,
+                                                      lazy))
+
+    if stats is not None:
+        start = time.perf_counter()
+        edit_list.events
+        stats.grouping_time += time.perf_counter() - start
+
+    return edit_list
+
+
+def parse_cmx3600_bytes(data: Buffer, tolerant: bool = False,
+                        encoding: Optional[str] = None,
+                        streaming: bool = False,
+                        compact: bool = False) -> EditList:
+    """
+    Parse a CMX 3600 EDL from a buffer, without decoding the entire buffer
+    first. Only lines with non-ASCII characters, like clip names and other
+    remarks, are decoded with `encoding`.
+
+    :param data: The EDL, as `bytes`, a `memoryview` or an `mmap.mmap`. With
+        `streaming`, the buffer must not be closed until you are finished
+        reading the list.
+    :param encoding: The encoding of the text in the EDL. If `None`, it is
+        detected with :func:`~pycmx.parse_cmx_statements.detect_encoding`.
+    :raises ValueError: if `encoding` is `None` and the encoding can't be
+        detected.
+
+    The other parameters are the same as :func:`parse_cmx3600`.
+    """
+    statements = iter_cmx3600_bytes_statements(data, tolerant, encoding)
+    if compact:
+        statements = EventTable().compact(statements)
+
+    if streaming:
+        return EditList(statements)
+
+    return EditList(list(statements))
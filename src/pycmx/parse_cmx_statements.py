@@ -1,8 +1,12 @@
 # pycmx
 # (c) 2018-2025 Jamie Hardt
 
+import codecs
 import re
-from typing import TextIO, List
+import time
+from functools import lru_cache
+from io import StringIO
+from typing import Generator, Optional, Sequence, TextIO, List, Tuple, Union
 
 from .cdl import AscSopComponents, Rgb
 
@@ -10,28 +14,228 @@ from .statements import (StmtCdlSat, StmtCdlSop, StmtCorruptRemark, StmtFrmc,
                          StmtRemark, StmtTitle, StmtUnrecognized, StmtFCM,
                          StmtAudioExt, StmtClipName, StmtEffectsName,
                          StmtEvent, StmtSourceFile, StmtSplitEdit)
-from .util import collimate
+from .event_table import LazyStmtEvent
+from .parse_stats import ParseStats
+from .util import SlicePlan
 
 
-def parse_cmx3600_statements(file: TextIO,
-                             tolerant: bool = False) -> List[object]:
+_EVENT_NUMBER_RE = re.compile(r"^(\d+)  ")
+
+_CDL_GROUP_RE = re.compile(r'\((.*?)\)')
+
+_CDL_NUMBER_RE = re.compile(r'(-?\d+(\.\d+)?)')
+
+_FRMC_RE = re.compile(r'^FRMC START:\s*(\d+)\s+FRMC END:\s*(\d+)'
+                      r'\s+FRMC DURATION:\s*(\d+)', re.IGNORECASE)
+
+_TOLERANT_EVENT_RE = re.compile(r'^\s*(\d+)\s+(.{8,128}?)\s+'
+                                r'(V|A|A2|AA|NONE|AA/V|A2/V|B)\s+'
+                                r'(C|D|W|KB|K|KO)\s+(\d*)\s+'
+                                r'(\d\d.\d\d.\d\d.\d\d)\s'
+                                r'(\d\d.\d\d.\d\d.\d\d)\s'
+                                r'(\d\d.\d\d.\d\d.\d\d)\s'
+                                r'(\d\d.\d\d.\d\d.\d\d)'
+                                )
+
+_BYTES_NON_ASCII_RE = re.compile(rb'[\x80-\xff]')
+
+_BYTES_NON_ASCII_LINE_RE = re.compile(rb'[^\r\n]*[\x80-\xff][^\r\n]*')
+
+# Encodings tried in order by detect_encoding(). Latin-1 can decode any
+# bytes, so it is always last.
+DEFAULT_ENCODINGS = ("utf-8", "shift_jis", "latin-1")
+
+# Byte order marks, and the encoding to use for a buffer that starts with
+# each. UTF-32 is tested first because its little-endian mark starts with
+# UTF-16's.
+_BOMS = ((codecs.BOM_UTF32_LE, "utf-32"), (codecs.BOM_UTF32_BE, "utf-32"),
+         (codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"),
+         (codecs.BOM_UTF16_BE, "utf-16"))
+
+# Encodings where a line break isn't a single "\r" or "\n" byte, buffers in
+# these encodings are decoded whole.
+_WIDE_ENCODINGS = ("utf-16", "utf-32")
+
+# Buffers are split into lines this many bytes at a time.
+_CHUNK_SIZE = 1 << 20
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def parse_cmx3600_statements(file: TextIO, tolerant: bool = False,
+                             stats: Optional[ParseStats] = None,
+                             lazy: bool = False) -> List[object]:
     """
     Return a list of every statement in the file argument.
+
+    :param stats: If given, counts and timings are added to it as the file
+        is parsed.
+    :param lazy: If `True`, standard form event lines are returned as
+        :class:`~pycmx.event_table.LazyStmtEvent` statements.
+    """
+    return list(iter_cmx3600_statements(file, tolerant, stats, lazy))
+
+
+def iter_cmx3600_statements(file: TextIO, tolerant: bool = False,
+                            stats: Optional[ParseStats] = None,
+                            lazy: bool = False
+                            ) -> Generator[object, None, None]:
+    """
+    A generator for every statement in the file argument. Lines are read from
+    `file` one at a time as statements are requested, so the entire file is
+    never held in memory.
+
+    :param stats: If given, counts and timings are added to it as the file
+        is parsed.
+    :param lazy: If `True`, standard form event lines are returned as
+        :class:`~pycmx.event_table.LazyStmtEvent` statements.
+    """
+    parse_line = _parse_cmx3600_line_lazy if lazy else _parse_cmx3600_line
+
+    if stats is not None:
+        yield from _iter_instrumented(file, tolerant, stats, parse_line)
+        return
+
+    for (line_number, line) in enumerate(file):
+        yield parse_line(line.strip(), line_number, tolerant)
+
+
+def _iter_instrumented(file: TextIO, tolerant: bool, stats: ParseStats,
+                       parse_line) -> Generator[object, None, None]:
+    perf_counter = time.perf_counter
+    for (line_number, line) in enumerate(file):
+        start = perf_counter()
+        stmt = parse_line(line.strip(), line_number, tolerant, stats)
+        stats._add_statement(type(stmt).__name__, perf_counter() - start)
+        yield stmt
+
+
+def iter_cmx3600_bytes_statements(data: Buffer, tolerant: bool = False,
+                                  encoding: Optional[str] = None
+                                  ) -> Generator[object, None, None]:
+    """
+    A generator for every statement in a buffer containing an EDL. Lines are
+    found in the raw buffer and decoded one at a time. Lines that are
+    entirely ASCII, which includes every event line in most lists, take a
+    fast path; other lines are decoded with `encoding`.
+
+    :param data: The EDL, as `bytes`, a `memoryview` or an `mmap.mmap`.
+    :param encoding: The encoding of the text in the EDL. If `None`, the
+        encoding is found with :func:`detect_encoding`.
+    """
+    if encoding is None:
+        encoding = detect_encoding(data)
+
+    if codecs.lookup(encoding).name.startswith(_WIDE_ENCODINGS):
+        text = bytes(data).decode(encoding)
+        yield from iter_cmx3600_statements(StringIO(text, newline=None),
+                                           tolerant)
+        return
+
+    skip = len(codecs.BOM_UTF8) \
+        if data[0:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+
+    line_number = 0
+    for chunk in _iter_buffer_chunks(data, skip):
+        if chunk.isascii():
+            lines: List[str] = _split_lines(chunk.decode("ascii"))
+        else:
+            lines = [line.decode("ascii") if line.isascii()
+                     else line.decode(encoding)
+                     for line in _split_lines(chunk)]
+
+        for line in lines:
+            yield _parse_cmx3600_line(line.strip(), line_number, tolerant)
+            line_number += 1
+
+
+def detect_encoding(data: Buffer,
+                    encodings: Sequence[str] = DEFAULT_ENCODINGS) -> str:
+    """
+    Guess the text encoding of an EDL in a buffer. A byte order mark is
+    honored if there is one, a buffer that is entirely ASCII is "ascii", and
+    otherwise the first of `encodings` that can decode every line with a
+    non-ASCII character is returned. Only those lines are decoded.
+
+    Short runs of Latin-1 text can also be valid Shift-JIS, so give the
+    encoding explicitly, or put "latin-1" earlier in `encodings`, if your
+    lists are known to be Latin-1.
+
+    :param data: The EDL, as `bytes`, a `memoryview` or an `mmap.mmap`.
+    :param encodings: The encodings to try, in order.
+    :raises ValueError: if none of `encodings` can decode the buffer.
     """
-    lines = file.readlines()
-    return [_parse_cmx3600_line(line.strip(), line_number, tolerant)
-            for (line_number, line) in enumerate(lines)]
+    for (bom, encoding) in _BOMS:
+        if data[0:len(bom)] == bom:
+            return encoding
 
+    if _BYTES_NON_ASCII_RE.search(data) is None:
+        return "ascii"
 
-def _edl_column_widths(event_field_length, source_field_length) -> List[int]:
-    return [event_field_length, 2, source_field_length, 1,
+    sample = b"\n".join(_BYTES_NON_ASCII_LINE_RE.findall(data))
+    for encoding in encodings:
+        try:
+            sample.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            pass
+
+    raise ValueError("None of the encodings " + ", ".join(encodings) +
+                     " can decode the EDL")
+
+
+def _iter_buffer_chunks(data: Buffer,
+                        start: int = 0) -> Generator[bytes, None, None]:
+    # Copies of the buffer in pieces of about _CHUNK_SIZE bytes, each ending
+    # with a whole line.
+    size = _CHUNK_SIZE
+    while start < len(data):
+        chunk = bytes(data[start:start + size])
+        if start + len(chunk) < len(data):
+            # A "\r" at the very end might be the first half of a "\r\n".
+            end = max(chunk.rfind(b"\n"), chunk.rfind(b"\r", 0, -1))
+            if end < 0:
+                size *= 2
+                continue
+
+            chunk = chunk[0:end + 1]
+
+        yield chunk
+        start += len(chunk)
+        size = _CHUNK_SIZE
+
+
+def _split_lines(chunk):
+    # Lines end with "\r\n", "\r" or "\n", the same as a file opened in text
+    # mode with universal newlines. Works on bytes or str.
+    (cr, lf) = ("\r", "\n") if isinstance(chunk, str) else (b"\r", b"\n")
+    if cr in chunk:
+        chunk = chunk.replace(cr + lf, lf).replace(cr, lf)
+
+    lines = chunk.split(lf)
+    if len(lines[-1]) == 0:
+        lines.pop()
+
+    return lines
+
+
+@lru_cache(maxsize=None)
+def _edl_column_widths(event_field_length,
+                       source_field_length) -> Tuple[int, ...]:
+    return (event_field_length, 2, source_field_length, 1,
             4, 2,  # chans
             4, 1,  # trans
             3, 1,  # trans op
             11, 1,
             11, 1,
             11, 1,
-            11]
+            11)
+
+
+@lru_cache(maxsize=None)
+def _edl_slice_plan(event_field_length, source_field_length) -> SlicePlan:
+    return SlicePlan(_edl_column_widths(event_field_length,
+                                        source_field_length))
 
 # def _edl_m2_column_widths():
 #     return [2, # "M2"
@@ -40,52 +244,79 @@ def _edl_column_widths(event_field_length, source_field_length) -> List[int]:
 
 
 def _parse_cmx3600_line(line: str, line_number: int,
-                        tolerant: bool = False) -> object:
+                        tolerant: bool = False,
+                        stats: Optional[ParseStats] = None) -> object:
     """
     Parses a single CMX EDL line.
 
     :param line: A single EDL line.
     :param line_number: The index of this line in the file.
+    :param stats: If given, event lines that don't fit the standard form are
+        counted in it.
     """
-    event_num_p = re.compile(r"^(\d+)  ")
-    line_matcher = event_num_p.match(line)
+    if len(line) == 0:
+        return _parse_unrecognized(line, line_number)
 
-    if line.startswith("TITLE:"):
-        return _parse_title(line, line_number)
-    if line.startswith("FCM:"):
-        return _parse_fcm(line, line_number)
-    if line_matcher is not None:
-        event_field_len = len(line_matcher.group(1))
+    first = line[0]
+    if first.isdigit():
+        line_matcher = _EVENT_NUMBER_RE.match(line)
+        if line_matcher is not None:
+            return _parse_event_line(line, len(line_matcher.group(1)),
+                                     line_number, tolerant, stats)
 
-        source_field_len = len(line) - (event_field_len + 65)
-
-        try:
-            return _parse_columns_for_standard_form(
-                    line, event_field_len, source_field_len, line_number)
-
-        except EventFormError:
-            if tolerant:
-                return _parse_columns_tolerant(line, line_number)
-            else:
-                return StmtUnrecognized(line, line_number)
-
-    if line.startswith("AUD"):
-        return _parse_extended_audio_channels(line, line_number)
-    if line.startswith("*"):
-        return _parse_remark(line[1:].strip(), line_number)
-    if line.startswith(">>> SOURCE"):
-        return _parse_source_umid_statement(line, line_number)
-    if line.startswith("EFFECTS NAME IS"):
-        return _parse_effects_name(line, line_number)
-    if line.startswith("SPLIT:"):
-        return _parse_split(line, line_number)
-    if line.startswith("M2"):
-        pass
-        # return _parse_motion_memory(line, line_number)
+    for (prefix, parser) in _LINE_PARSERS.get(first, ()):
+        if line.startswith(prefix):
+            return parser(line, line_number)
 
     return _parse_unrecognized(line, line_number)
 
 
+def _parse_cmx3600_line_lazy(line: str, line_number: int,
+                             tolerant: bool = False,
+                             stats: Optional[ParseStats] = None) -> object:
+    # Like _parse_cmx3600_line(), but a standard form event line is only
+    # checked, not split into fields.
+    if len(line) > 0 and line[0].isdigit():
+        line_matcher = _EVENT_NUMBER_RE.match(line)
+        if line_matcher is not None:
+            event_field_len = len(line_matcher.group(1))
+            source_field_len = len(line) - (event_field_len + 65)
+            # The same test as _parse_columns_for_standard_form().
+            if source_field_len >= 1:
+                plan = _edl_slice_plan(event_field_len, source_field_len)
+                if line[plan.slices[4]].strip() and \
+                        line[plan.slices[6]].strip():
+                    return LazyStmtEvent(line, plan, line_number)
+
+    return _parse_cmx3600_line(line, line_number, tolerant, stats)
+
+
+def _parse_event_line(line: str, event_field_len: int, line_number: int,
+                      tolerant: bool,
+                      stats: Optional[ParseStats] = None) -> object:
+    source_field_len = len(line) - (event_field_len + 65)
+
+    try:
+        return _parse_columns_for_standard_form(
+                line, event_field_len, source_field_len, line_number)
+
+    except EventFormError:
+        if stats is not None:
+            stats.event_form_errors += 1
+
+        if tolerant:
+            stmt = _parse_columns_tolerant(line, line_number)
+            if stats is not None:
+                if type(stmt) is StmtEvent:
+                    stats.tolerant_fallbacks += 1
+                else:
+                    stats.tolerant_failures += 1
+
+            return stmt
+        else:
+            return StmtUnrecognized(line, line_number)
+
+
 def _parse_title(line, line_num) -> StmtTitle:
     title = line[6:].strip()
     return StmtTitle(title=title, line_number=line_num)
@@ -110,6 +341,10 @@ def _parse_extended_audio_channels(line, line_number):
         return StmtUnrecognized(line, line_number)
 
 
+def _parse_remark_line(line, line_number) -> object:
+    return _parse_remark(line[1:].strip(), line_number)
+
+
 def _parse_remark(line, line_number) -> object:
     if line.startswith("FROM CLIP NAME:"):
         return StmtClipName(name=line[15:].strip(), affect="from",
@@ -121,10 +356,10 @@ def _parse_remark(line, line_number) -> object:
         return StmtSourceFile(filename=line[12:].strip(),
                               line_number=line_number)
     elif line.startswith("ASC_SOP"):
-        group_patterns: list[str] = re.findall(r'\((.*?)\)', line)
+        group_patterns: list[str] = _CDL_GROUP_RE.findall(line)
 
         v1: list[list[tuple[str, str]]] = \
-                [re.findall(r'(-?\d+(\.\d+)?)', a) for a in group_patterns]
+                [_CDL_NUMBER_RE.findall(a) for a in group_patterns]
 
         v: list[list[str]] = [[a[0] for a in b] for b in v1]
 
@@ -151,7 +386,7 @@ def _parse_remark(line, line_number) -> object:
                 return StmtCorruptRemark('ASC_SOP', e, line_number)
 
     elif line.startswith("ASC_SAT"):
-        value = re.findall(r'(-?\d+(\.\d+)?)', line)
+        value = _CDL_NUMBER_RE.findall(line)
 
         if len(value) != 1:
             return StmtRemark(line, line_number)
@@ -165,8 +400,7 @@ def _parse_remark(line, line_number) -> object:
                 return StmtCorruptRemark('ASC_SAT', e, line_number)
 
     elif line.startswith("FRMC"):
-        match = re.match(r'^FRMC START:\s*(\d+)\s+FRMC END:\s*(\d+)'
-                         r'\s+FRMC DURATION:\s*(\d+)', line, re.IGNORECASE)
+        match = _FRMC_RE.match(line)
 
         if match is None:
             return StmtCorruptRemark('FRMC', None, line_number)
@@ -213,13 +447,14 @@ def _parse_unrecognized(line, line_number):
 def _parse_columns_for_standard_form(line: str, event_field_length: int,
                                      source_field_length: int,
                                      line_number: int):
-    # breakpoint()
-    col_widths = _edl_column_widths(event_field_length, source_field_length)
-
-    if sum(col_widths) > len(line):
+    # A line too short for the fixed-width columns leaves no room for the
+    # source field.
+    if source_field_length < 1:
         raise EventFormError()
 
-    column_strings = collimate(line, col_widths)
+    plan = _edl_slice_plan(event_field_length, source_field_length)
+
+    column_strings = plan.split(line)
 
     channels = column_strings[4].strip()
     trans = column_strings[6].strip()
@@ -241,14 +476,7 @@ def _parse_columns_for_standard_form(line: str, event_field_length: int,
 
 
 def _parse_columns_tolerant(line: str, line_number: int):
-    pattern = re.compile(r'^\s*(\d+)\s+(.{8,128}?)\s+'
-                         r'(V|A|A2|AA|NONE|AA/V|A2/V|B)\s+'
-                         r'(C|D|W|KB|K|KO)\s+(\d*)\s+(\d\d.\d\d.\d\d.\d\d)\s'
-                         r'(\d\d.\d\d.\d\d.\d\d)\s(\d\d.\d\d.\d\d.\d\d)\s'
-                         r'(\d\d.\d\d.\d\d.\d\d)'
-                         )
-
-    match = pattern.match(line)
+    match = _TOLERANT_EVENT_RE.match(line)
     if match:
         return StmtEvent(event=int(match.group(1)), source=match.group(2),
                          channels=match.group(3), trans=match.group(4),
@@ -264,3 +492,17 @@ def _parse_source_umid_statement(line, line_number):
     # trimmed = line[3:].strip()
     # return StmtSourceUMID(name=None, umid=None, line_number=line_number)
     ...
+
+
+# Parsers for lines that are not event lines, keyed by the first character of
+# the line. Each entry is tried in order until one's prefix matches.
+_LINE_PARSERS = {
+    "T": (("TITLE:", _parse_title),),
+    "F": (("FCM:", _parse_fcm),),
+    "A": (("AUD", _parse_extended_audio_channels),),
+    "*": (("*", _parse_remark_line),),
+    ">": ((">>> SOURCE", _parse_source_umid_statement),),
+    "E": (("EFFECTS NAME IS", _parse_effects_name),),
+    "S": (("SPLIT:", _parse_split),),
+    # "M": (("M2", _parse_motion_memory),),
+}
@@ -0,0 +1,95 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from typing import Dict
+
+
+class ParseStats:
+    """
+    Counts and timings collected while a list is parsed, for finding out
+    where the time goes or why a list mis-parses. Pass an instance as the
+    `stats` argument of :func:`~pycmx.parse_cmx_events.parse_cmx3600`; it is
+    filled in as the list is read. Parsing without a `stats` object does no
+    extra work.
+
+    One object may be passed to several parses, and accumulates the totals.
+    """
+
+    __slots__ = ("lines", "statement_counts", "statement_times",
+                 "event_form_errors", "tolerant_fallbacks",
+                 "tolerant_failures", "grouping_time")
+
+    def __init__(self):
+        #: The number of lines read.
+        self.lines: int = 0
+
+        #: The number of statements of each type, keyed by the name of the
+        #: statement class, like "StmtEvent".
+        self.statement_counts: Dict[str, int] = {}
+
+        #: The time spent parsing statements of each type in seconds, keyed
+        #: like :attr:`statement_counts`.
+        self.statement_times: Dict[str, float] = {}
+
+        #: The number of event lines that didn't fit the standard column
+        #: layout.
+        self.event_form_errors: int = 0
+
+        #: The number of event lines read by the tolerant parser after they
+        #: didn't fit the standard column layout.
+        self.tolerant_fallbacks: int = 0
+
+        #: The number of event lines the tolerant parser couldn't read
+        #: either, these become :class:`~pycmx.statements.StmtUnrecognized`.
+        self.tolerant_failures: int = 0
+
+        #: The time spent grouping statements into events, in seconds. Events
+        #: of a streaming list are grouped as they are read, so this is not
+        #: measured for streaming lists.
+        self.grouping_time: float = 0.0
+
+    @property
+    def parse_time(self) -> float:
+        """
+        The total time spent parsing statements, in seconds.
+        """
+        return sum(self.statement_times.values())
+
+    @property
+    def unrecognized_rate(self) -> float:
+        """
+        The fraction of lines that were unrecognized statements or corrupt
+        remarks.
+        """
+        if self.lines == 0:
+            return 0.0
+
+        return (self.statement_counts.get("StmtUnrecognized", 0) +
+                self.statement_counts.get("StmtCorruptRemark", 0)) / \
+            self.lines
+
+    def as_dict(self) -> dict:
+        """
+        The stats as a dict, for logging or JSON.
+        """
+        return {"lines": self.lines,
+                "statement_counts": dict(self.statement_counts),
+                "statement_times": dict(self.statement_times),
+                "parse_time": self.parse_time,
+                "event_form_errors": self.event_form_errors,
+                "tolerant_fallbacks": self.tolerant_fallbacks,
+                "tolerant_failures": self.tolerant_failures,
+                "unrecognized_rate": self.unrecognized_rate,
+                "grouping_time": self.grouping_time}
+
+    def __repr__(self) -> str:
+        return (f"ParseStats(lines={self.lines}, "
+                f"parse_time={self.parse_time:.6f}, "
+                f"event_form_errors={self.event_form_errors}, "
+                f"unrecognized_rate={self.unrecognized_rate:.4f})")
+
+    def _add_statement(self, name: str, seconds: float):
+        self.lines += 1
+        self.statement_counts[name] = self.statement_counts.get(name, 0) + 1
+        self.statement_times[name] = \
+            self.statement_times.get(name, 0.0) + seconds
@@ -0,0 +1,120 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from array import array
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .channel_map import ChannelMap
+from .edit import Edit
+from .timecode import Timecode
+
+
+class RecordIndex:
+    """
+    An index of edits by their record time, for finding the edits that are
+    playing at a particular time or during a range of time. Record ranges
+    are half-open: an edit plays from its record in up to, but not
+    including, its record out.
+
+    Create a `RecordIndex` with
+    :meth:`~pycmx.edit_list.EditList.record_index()`.
+    """
+
+    def __init__(self, edits: Iterable[Edit], rate: int):
+        rows: List[Tuple[int, int, Edit]] = []
+        for edit in edits:
+            rows.append((edit.record_in_timecode(rate).frames,
+                         edit.record_out_timecode(rate).frames, edit))
+
+        rows.sort(key=lambda row: row[0])
+
+        #: The nominal frame rate of the index.
+        self.rate: int = rate
+
+        self._edits: List[Edit] = [row[2] for row in rows]
+        self._starts = array('q', (row[0] for row in rows))
+        self._ends = array('q', (row[1] for row in rows))
+        # Channel masks are kept in an array unless an edit is on a channel
+        # above A63, which doesn't fit in 64 bits.
+        masks = [e.channel_mask for e in self._edits]
+        self._channels: Union[array, List[int]] = \
+            array('Q', masks) if max(masks, default=0) >> 64 == 0 else masks
+
+        # The edits form an implicit balanced search tree, where the root of
+        # each subtree [lo, hi) is at its midpoint. Each root holds the
+        # latest record out in its subtree.
+        self._max_ends = array('q', self._ends)
+        self._build(0, len(self._edits))
+
+    def __len__(self) -> int:
+        return len(self._edits)
+
+    def edits_at(self, tc: Timecode,
+                 channels: Optional[Union[ChannelMap, int]] = None
+                 ) -> List[Edit]:
+        """
+        Get the edits playing at record time `tc`, in order of record in.
+
+        :param channels: If given, only edits on at least one of these
+            channels are returned. May be a
+            :class:`~pycmx.channel_map.ChannelMap` or a channel bitmask.
+        """
+        frame = self._frames(tc)
+        return self._query(frame, frame + 1, channels)
+
+    def edits_between(self, start: Timecode, end: Timecode,
+                      channels: Optional[Union[ChannelMap, int]] = None
+                      ) -> List[Edit]:
+        """
+        Get the edits that play at any time from record time `start` up to
+        `end`, in order of record in.
+
+        :param channels: If given, only edits on at least one of these
+            channels are returned. May be a
+            :class:`~pycmx.channel_map.ChannelMap` or a channel bitmask.
+        """
+        return self._query(self._frames(start), self._frames(end), channels)
+
+    def _frames(self, tc: Timecode) -> int:
+        if tc.rate != self.rate:
+            raise ValueError(f"Timecode rate {tc.rate} does not match index "
+                             f"rate {self.rate}")
+        return tc.frames
+
+    def _build(self, lo: int, hi: int) -> int:
+        if lo >= hi:
+            return -1
+
+        mid = (lo + hi) // 2
+        max_end = max(self._ends[mid], self._build(lo, mid),
+                      self._build(mid + 1, hi))
+        self._max_ends[mid] = max_end
+        return max_end
+
+    def _query(self, start: int, end: int,
+               channels: Optional[Union[ChannelMap, int]]) -> List[Edit]:
+        found: List[int] = []
+        self._search(0, len(self._edits), start, end, found)
+
+        if channels is None:
+            return [self._edits[i] for i in found]
+
+        mask = channels if isinstance(channels, int) else channels.bitmask
+        return [self._edits[i] for i in found if self._channels[i] & mask]
+
+    def _search(self, lo: int, hi: int, start: int, end: int,
+                found: List[int]):
+        if lo >= hi:
+            return
+
+        mid = (lo + hi) // 2
+        if self._max_ends[mid] <= start:
+            return
+
+        self._search(lo, mid, start, end, found)
+
+        if self._starts[mid] < end:
+            if self._ends[mid] > start:
+                found.append(mid)
+
+            self._search(mid + 1, hi, start, end, found)
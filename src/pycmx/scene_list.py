@@ -0,0 +1,225 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+import argparse
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import (Generator, Iterable, List, NamedTuple, Optional, Pattern,
+                    TextIO, Union)
+
+from .edit_list import EditList
+from .parse_cmx_events import parse_cmx3600
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SCENE_PATTERN = 'V?([A-Z]*[0-9]+)'
+
+_SCENE_LIST_FORMATS = ("cmx", "cols")
+
+# The extension of each output file when scene lists for many EDLs are
+# written to a directory.
+_SCENE_LIST_EXTENSIONS = {"cmx": ".edl", "cols": ".txt"}
+
+
+class Scene(NamedTuple):
+    """
+    A run of consecutive video edits from the same scene, as found by
+    :func:`iter_scenes()`.
+    """
+
+    name: str  # : The scene name
+    record_in: str  # : The record in of the first edit in the scene
+    record_out: str  # : The record out of the last edit in the scene
+
+
+def iter_scenes(edit_list: EditList,
+                pattern: Union[str, Pattern] = DEFAULT_SCENE_PATTERN
+                ) -> Generator[Scene, None, None]:
+    """
+    A generator for each scene in an edit list, in one pass over its events.
+    Consecutive video edits with the same scene name are a scene. Edits with
+    no clip name are skipped.
+
+    :param edit_list: The list to read. This may be a streaming list.
+    :param pattern: A regular expression that extracts the scene name from
+        a clip name as its first group. It is matched case-insensitively at
+        the start of the clip name, and the whole clip name is the scene
+        name if it doesn't match.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern, re.I)
+
+    name: Optional[str] = None
+    record_in: Optional[str] = None
+    record_out: Optional[str] = None
+
+    for event in edit_list.events:
+        for edit in event.edits:
+            if not edit.channel_mask & 1:
+                continue
+
+            clip_name = edit.clip_name
+            if clip_name is None:
+                continue
+
+            match = pattern.match(clip_name)
+            this_name = match[1] if match else clip_name
+
+            if this_name != name:
+                if name is not None:
+                    yield Scene(name, record_in, record_out)
+
+                name = this_name
+                record_in = edit.record_in
+
+            record_out = edit.record_out
+
+    if name is not None:
+        yield Scene(name, record_in, record_out)
+
+
+def write_scene_list(scenes: Iterable[Scene], f: TextIO,
+                     format: str = "cmx"):
+    """
+    Write scenes to a file as they are read from `scenes`.
+
+    :param format: "cmx" writes the scenes as a CMX 3600 EDL with one event
+        per scene, with the scene name as the clip name. "cols" writes
+        the record in, record out and name of each scene, separated by tabs.
+    :raises ValueError: if `format` is not valid.
+    """
+    if format == "cmx":
+        f.write("TITLE:  SCENE LIST\r\n")
+        f.write("FCM: NON-DROP FRAME\r\n")
+        for (i, scene) in enumerate(scenes):
+            f.write(f"{i:03d}  AX       V     C        00:00:00:00 "
+                    f"00:00:00:00 {scene.record_in} {scene.record_out}\r\n"
+                    f"* FROM CLIP NAME: {scene.name}\r\n")
+    elif format == "cols":
+        for scene in scenes:
+            f.write(f"{scene.record_in:<12}\t{scene.record_out:<12}\t"
+                    f"{scene.name}\n")
+    else:
+        raise ValueError(f"Invalid scene list format \"{format}\"")
+
+
+def scene_list(infile: TextIO, outfile: TextIO, out_format: str = "cmx",
+               pattern: Union[str, Pattern] = DEFAULT_SCENE_PATTERN):
+    """
+    Read the video events from a CMX EDL and write them merged into scenes.
+    The EDL is read and the scenes are written a line at a time.
+
+    The arguments are the same as :func:`iter_scenes()` and
+    :func:`write_scene_list()`.
+    """
+    edit_list = parse_cmx3600(infile, streaming=True)
+    write_scene_list(iter_scenes(edit_list, pattern), outfile, out_format)
+
+
+def _scene_list_path(in_path: str, out_path: str, out_format: str,
+                     pattern: str, encoding: Optional[str]) -> str:
+    with open(in_path, 'r', encoding=encoding) as infile, \
+            open(out_path, 'w', newline='') as outfile:
+        scene_list(infile, outfile, out_format, pattern)
+
+    return out_path
+
+
+def scene_list_cli(argv: Optional[List[str]] = None) -> int:
+    """
+    Read video events from input CMX EDLs and write events merged into
+    scenes.
+    """
+    parser = argparse.ArgumentParser(
+        description='Read video events from an input CMX EDL and output '
+        'events merged into scenes.')
+    parser.add_argument('-o', '--outfile', default=None,
+                        help='Output file, for a single input. Default is '
+                        'stdout.')
+    parser.add_argument('-d', '--outdir', default=None,
+                        help='Output directory. Required for more than one '
+                        'input, each scene list is named after its input.')
+    parser.add_argument('-f', '--format', default='cmx', type=str,
+                        help='Output format. Options are cols and cmx, cmx '
+                        'is the default.')
+    parser.add_argument('-p', '--pattern', default=DEFAULT_SCENE_PATTERN,
+                        help='RE pattern for extracting scene name from clip '
+                        f'name. The default is "{DEFAULT_SCENE_PATTERN}". '
+                        'This pattern will be matched case-insensitively.')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of parallel processes for more than one '
+                        'input. Default is the number of processors.')
+    parser.add_argument('-e', '--encoding', default=None,
+                        help='Text encoding of the input files.')
+    parser.add_argument('input_edl', nargs='*',
+                        help='Input files. Default is stdin.')
+    args = parser.parse_args(argv)
+
+    out_format = args.format
+    if out_format not in _SCENE_LIST_FORMATS:
+        log.warning(f"Format {out_format} unrecognized. Will use cmx.")
+        out_format = 'cmx'
+
+    if args.outdir is None:
+        if len(args.input_edl) > 1:
+            parser.error("an output directory (-d) is required for more "
+                         "than one input")
+
+        infile = open(args.input_edl[0], 'r', encoding=args.encoding) \
+            if len(args.input_edl) == 1 else sys.stdin
+        outfile = open(args.outfile, 'w', newline='') \
+            if args.outfile is not None else sys.stdout
+        try:
+            scene_list(infile, outfile, out_format, args.pattern)
+        finally:
+            if infile is not sys.stdin:
+                infile.close()
+            if outfile is not sys.stdout:
+                outfile.close()
+
+        return 0
+
+    jobs = []
+    for in_path in args.input_edl:
+        stem = os.path.splitext(os.path.basename(in_path))[0]
+        out_path = os.path.join(args.outdir,
+                                stem + _SCENE_LIST_EXTENSIONS[out_format])
+        jobs.append((in_path, out_path, out_format, args.pattern,
+                     args.encoding))
+
+    os.makedirs(args.outdir, exist_ok=True)
+
+    failed = False
+    if args.jobs == 1:
+        for job in jobs:
+            failed = not _run_job(job) or failed
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {executor.submit(_scene_list_path, *job): job
+                       for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log.error(f"Failed to read {futures[future][0]}: {e}")
+                    failed = True
+
+    return 1 if failed else 0
+
+
+def _run_job(job) -> bool:
+    try:
+        _scene_list_path(*job)
+        return True
+    except Exception as e:
+        log.error(f"Failed to read {job[0]}: {e}")
+        return False
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)-15s %(message)s')
+    sys.exit(scene_list_cli())
@@ -0,0 +1,82 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .edit import Edit
+from .timecode import Timecode
+
+
+class SourceEntry(NamedTuple):
+    """
+    The edits that use one source, as found in a source index created by
+    :meth:`~pycmx.edit_list.EditList.source_index()`.
+    """
+
+    edits: List[Edit]  # : Every edit using the source, in list order
+
+    #: The source ranges used by the edits, extended by the handles, with
+    #: overlapping and adjacent ranges merged. Each range is a source in
+    #: and out, sorted by source in.
+    ranges: List[Tuple[Timecode, Timecode]]
+
+
+_SOURCE_INDEX_KEYS = ("source", "source_file", "clip_name")
+
+
+def build_source_index(edits: Iterable[Edit], rate: int, handles: int = 0,
+                       key: str = "source") -> Dict[str, SourceEntry]:
+    """
+    Group `edits` by source in one pass.
+
+    :param rate: The nominal frame rate to read source timecodes at.
+    :param handles: A number of frames to add to the start and end of each
+        source range before ranges are merged.
+    :param key: The :class:`~pycmx.edit.Edit` property to group by, one of
+        "source", "source_file" or "clip_name". Edits with no value for the
+        key are skipped.
+    :raises ValueError: if `key` is not valid or an edit has an invalid
+        source timecode.
+    """
+    if key not in _SOURCE_INDEX_KEYS:
+        raise ValueError(f"Invalid source index key \"{key}\"")
+
+    edits_by_name: Dict[str, List[Edit]] = {}
+    ranges_by_name: Dict[str, List[Tuple[Timecode, Timecode]]] = {}
+
+    for edit in edits:
+        name: Optional[str] = getattr(edit, key)
+        if name is None:
+            continue
+
+        if name not in edits_by_name:
+            name = sys.intern(name)
+            edits_by_name[name] = []
+            ranges_by_name[name] = []
+
+        edits_by_name[name].append(edit)
+        ranges_by_name[name].append((edit.source_in_timecode(rate),
+                                     edit.source_out_timecode(rate)))
+
+    return {name: SourceEntry(edits=edits_by_name[name],
+                              ranges=_merge_ranges(ranges_by_name[name],
+                                                   handles))
+            for name in edits_by_name}
+
+
+def _merge_ranges(ranges: List[Tuple[Timecode, Timecode]],
+                  handles: int) -> List[Tuple[Timecode, Timecode]]:
+    ranges.sort(key=lambda r: r[0].frames)
+
+    merged: List[Tuple[Timecode, Timecode]] = []
+    for (start, end) in ranges:
+        start = start - min(handles, start.frames)
+        end = end + handles
+        if len(merged) > 0 and start.frames <= merged[-1][1].frames:
+            if end.frames > merged[-1][1].frames:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    return merged
@@ -0,0 +1,140 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from functools import total_ordering
+from typing import Tuple, Union
+
+
+@total_ordering
+class Timecode:
+    """
+    A timecode, stored as an integer count of frames from 00:00:00:00 at a
+    nominal integer frame rate. 29.97 fps video has a nominal rate of 30 and
+    59.94 fps video a nominal rate of 60.
+
+    Timecodes can be added to and subtracted from each other or from an
+    `int` number of frames, and timecodes with the same rate can be compared.
+
+    >>> tc = Timecode.parse("01:00:00:00", rate=24)
+    >>> tc.frames
+    86400
+    >>> str(tc + 25)
+    '01:00:01:01'
+    """
+
+    __slots__ = ("frames", "rate", "drop")
+
+    def __init__(self, frames: int, rate: int, drop: bool = False):
+        if rate <= 0:
+            raise ValueError(f"Invalid frame rate {rate}")
+        if drop and rate % 30 != 0:
+            raise ValueError(f"Drop frame is not possible at {rate} fps")
+
+        self.frames: int = frames  # : Frame count
+        self.rate: int = rate  # : Nominal frames per second
+        self.drop: bool = drop  # : `True` if the label is drop frame
+
+    @classmethod
+    def parse(cls, text: str, rate: int, drop: bool = False) -> "Timecode":
+        """
+        Parse a timecode label of the form "HH:MM:SS:FF". Any single
+        character may be used as a separator.
+
+        :raises ValueError: if `text` is not a valid timecode at `rate`.
+        """
+        if len(text) != 11:
+            raise ValueError(f"Invalid timecode \"{text}\"")
+
+        return cls(_label_to_frames(int(text[0:2]), int(text[3:5]),
+                                    int(text[6:8]), int(text[9:11]),
+                                    rate, drop), rate, drop)
+
+    @property
+    def components(self) -> Tuple[int, int, int, int]:
+        """
+        The hours, minutes, seconds and frames of the timecode label.
+        """
+        return _frames_to_label(abs(self.frames), self.rate, self.drop)
+
+    def __str__(self) -> str:
+        hh, mm, ss, ff = self.components
+        sign = "-" if self.frames < 0 else ""
+        return f"{sign}{hh:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
+
+    def __repr__(self) -> str:
+        return (f"Timecode(frames={self.frames}, rate={self.rate}, "
+                f"drop={self.drop})")
+
+    def __int__(self) -> int:
+        return self.frames
+
+    def __hash__(self) -> int:
+        return hash((self.frames, self.rate))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Timecode):
+            return NotImplemented
+
+        return self.frames == other.frames and self.rate == other.rate
+
+    def __lt__(self, other: "Timecode") -> bool:
+        if not isinstance(other, Timecode):
+            return NotImplemented
+
+        return self.frames < self._other_frames(other)
+
+    def __add__(self, other: Union["Timecode", int]) -> "Timecode":
+        return Timecode(self.frames + self._other_frames(other), self.rate,
+                        self.drop)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union["Timecode", int]) -> "Timecode":
+        return Timecode(self.frames - self._other_frames(other), self.rate,
+                        self.drop)
+
+    def _other_frames(self, other: Union["Timecode", int]) -> int:
+        if isinstance(other, Timecode):
+            if other.rate != self.rate:
+                raise ValueError("Timecodes have different rates "
+                                 f"({self.rate} and {other.rate})")
+            return other.frames
+        else:
+            return int(other)
+
+
+def _label_to_frames(hh: int, mm: int, ss: int, ff: int, rate: int,
+                     drop: bool) -> int:
+    if mm >= 60 or ss >= 60 or ff >= rate or min(hh, mm, ss, ff) < 0:
+        raise ValueError(f"Invalid timecode {hh}:{mm}:{ss}:{ff} at {rate} "
+                         "fps")
+
+    frames = (hh * 3600 + mm * 60 + ss) * rate + ff
+    if drop:
+        # Two frame numbers (four at 60 fps) are skipped at the start of
+        # every minute, except every tenth minute.
+        dropped = rate // 15
+        if ss == 0 and ff < dropped and mm % 10 != 0:
+            raise ValueError(f"Invalid drop frame timecode {hh}:{mm}:{ss}:{ff}")
+
+        total_minutes = hh * 60 + mm
+        frames -= dropped * (total_minutes - total_minutes // 10)
+
+    return frames
+
+
+def _frames_to_label(frames: int, rate: int,
+                     drop: bool) -> Tuple[int, int, int, int]:
+    if drop:
+        dropped = rate // 15
+        frames_per_minute = rate * 60 - dropped
+        frames_per_ten_minutes = frames_per_minute * 10 + dropped
+        tens, remainder = divmod(frames, frames_per_ten_minutes)
+        frames += dropped * 9 * tens
+        if remainder > dropped:
+            frames += dropped * ((remainder - dropped) // frames_per_minute)
+
+    seconds, ff = divmod(frames, rate)
+    minutes, ss = divmod(seconds, 60)
+    hh, mm = divmod(minutes, 60)
+    return (hh, mm, ss, ff)
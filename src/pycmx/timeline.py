@@ -0,0 +1,211 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from array import array
+from bisect import bisect_right
+from heapq import heappop, heappush
+from typing import (Dict, Generator, Iterable, List, Optional, Tuple,
+                    Union)
+
+from .edit import Edit
+from .timecode import Timecode
+
+
+class Track:
+    """
+    One channel of a :class:`Timeline`, as a run of contiguous segments
+    covering the whole timeline. Each segment is the edit playing on the
+    channel for that range of record time, or `None` for a gap, which is
+    black on the video track and silence on an audio track.
+
+    Segment boundaries are stored as sorted arrays of record frames in
+    :attr:`starts` and :attr:`ends`. Ranges are half-open: a segment plays
+    from its start up to, but not including, its end.
+    """
+
+    def __init__(self, channel: int, starts: array, ends: array,
+                 owners: array, edits: List[Edit], rate: int):
+        #: The channel of the track. 0 is video, and `n` is audio channel
+        #: `n`.
+        self.channel: int = channel
+
+        #: The record frame of the start of each segment.
+        self.starts: array = starts
+
+        #: The record frame of the end of each segment.
+        self.ends: array = ends
+
+        self._owners = owners
+        self._edits = edits
+        self._rate = rate
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def segments(self) -> Generator[Tuple[int, int, Optional[Edit]],
+                                     None, None]:
+        """
+        A generator for each segment on the track as a tuple of its start
+        frame, end frame and edit, in order.
+        """
+        for (start, end, owner) in zip(self.starts, self.ends, self._owners):
+            yield (start, end, self._edits[owner] if owner >= 0 else None)
+
+    def edit_at(self, time: Union[Timecode, int]) -> Optional[Edit]:
+        """
+        Get the edit playing on this track at a record time, or `None` if
+        the time falls in a gap or outside the timeline.
+
+        :param time: A :class:`~pycmx.timecode.Timecode` at the timeline
+            rate, or a record frame count.
+        """
+        return self._lookup(self._frames(time))
+
+    def edits_at(self, times: Iterable[Union[Timecode, int]]
+                 ) -> List[Optional[Edit]]:
+        """
+        Get the edit playing on this track at each of many record times,
+        in the same order as `times`. This is the same as calling
+        :meth:`edit_at()` for each time.
+        """
+        return [self._lookup(self._frames(time)) for time in times]
+
+    def _frames(self, time: Union[Timecode, int]) -> int:
+        if isinstance(time, int):
+            return time
+
+        if time.rate != self._rate:
+            raise ValueError(f"Timecode rate {time.rate} does not match "
+                             f"timeline rate {self._rate}")
+        return time.frames
+
+    def _lookup(self, frame: int) -> Optional[Edit]:
+        i = bisect_right(self.starts, frame) - 1
+        if i < 0 or frame >= self.ends[i]:
+            return None
+
+        owner = self._owners[i]
+        return self._edits[owner] if owner >= 0 else None
+
+
+class Timeline:
+    """
+    An edit list flattened into one :class:`Track` per channel, with the
+    edits playing on each channel resolved for every record frame. Where
+    edits overlap on a channel, as they do in a dissolve, wipe or key, the
+    edit that comes later in the edit list wins. Every track covers the
+    same range of record time, from the earliest record in to the latest
+    record out in the list, and gaps are filled with `None`.
+
+    Create a `Timeline` with :meth:`~pycmx.edit_list.EditList.timeline()`.
+    """
+
+    def __init__(self, edits: Iterable[Edit], rate: int):
+        #: The nominal frame rate of the timeline.
+        self.rate: int = rate
+
+        self._edits: List[Edit] = []
+        points: List[Tuple[int, int, int, int]] = []
+        all_channels = 0
+        for edit in edits:
+            start = edit.record_in_timecode(rate).frames
+            end = edit.record_out_timecode(rate).frames
+            if end <= start or edit.channel_mask == 0:
+                continue
+
+            order = len(self._edits)
+            self._edits.append(edit)
+            all_channels |= edit.channel_mask
+            points.append((start, 1, order, end))
+            points.append((end, 0, order, end))
+
+        points.sort()
+
+        #: The record frame of the start of the timeline.
+        self.start: int = points[0][0] if points else 0
+
+        #: The record frame of the end of the timeline.
+        self.end: int = points[-1][0] if points else 0
+
+        channels = list(_mask_channels(all_channels))
+        heaps: Dict[int, List[Tuple[int, int]]] = {c: [] for c in channels}
+        starts: Dict[int, List[int]] = {c: [self.start] for c in channels}
+        owners: Dict[int, List[int]] = {c: [-1] for c in channels}
+
+        # Sweep the record ins and outs in time order. Each channel keeps a
+        # heap of its edits that have started, latest in the list first,
+        # and edits that have ended are dropped when they reach the top.
+        i = 0
+        while i < len(points):
+            frame = points[i][0]
+            touched = 0
+            while i < len(points) and points[i][0] == frame:
+                (_, is_start, order, end) = points[i]
+                mask = self._edits[order].channel_mask
+                touched |= mask
+                if is_start:
+                    for channel in _mask_channels(mask):
+                        heappush(heaps[channel], (-order, end))
+                i += 1
+
+            for channel in _mask_channels(touched):
+                heap = heaps[channel]
+                while heap and heap[0][1] <= frame:
+                    heappop(heap)
+
+                owner = -heap[0][0] if heap else -1
+                channel_owners = owners[channel]
+                if owner == channel_owners[-1]:
+                    continue
+
+                if starts[channel][-1] == frame:
+                    channel_owners[-1] = owner
+                else:
+                    starts[channel].append(frame)
+                    channel_owners.append(owner)
+
+        self._tracks: Dict[int, Track] = {}
+        for channel in channels:
+            # Every edit has ended at the end of the timeline, so don't
+            # keep the empty gap that starts there.
+            if len(starts[channel]) > 1 and starts[channel][-1] == self.end:
+                starts[channel].pop()
+                owners[channel].pop()
+
+            track_starts = array('q', starts[channel])
+            track_ends = array('q', track_starts[1:])
+            track_ends.append(self.end)
+            self._tracks[channel] = Track(channel, track_starts, track_ends,
+                                          array('l', owners[channel]),
+                                          self._edits, rate)
+
+    @property
+    def tracks(self) -> List[Track]:
+        """
+        Every track in the timeline in channel order, video first.
+        """
+        return list(self._tracks.values())
+
+    @property
+    def video(self) -> Optional[Track]:
+        """
+        The video track, or `None` if no edit is on video.
+        """
+        return self._tracks.get(0, None)
+
+    def audio(self, channel: int) -> Optional[Track]:
+        """
+        Get the track for audio channel `channel`, counting from 1, or
+        `None` if no edit is on that channel.
+        """
+        if channel < 1:
+            return None
+
+        return self._tracks.get(channel, None)
+
+
+def _mask_channels(mask: int) -> Generator[int, None, None]:
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
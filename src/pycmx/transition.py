@@ -16,6 +16,8 @@ class Transition:
     Key = "K"
     KeyOut = "KO"
 
+    __slots__ = ("transition", "operand", "name")
+
     def __init__(self, transition, operand, name=None):
         self.transition = transition
         self.operand = operand
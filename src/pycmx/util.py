@@ -3,13 +3,47 @@
 
 # Utility functions
 
+from typing import Iterable, List, Tuple
+
+
+class SlicePlan:
+    """
+    A precomputed set of slices for splitting a sliceable into fixed-width
+    columns.
+
+    >>> SlicePlan([2,3,3,2]).split("a b1 c2345")
+    ['a ', 'b1 ', 'c23', '45']
+    """
+
+    __slots__ = ("slices", "width")
+
+    def __init__(self, column_widths: Iterable[int]):
+        slices: List[slice] = []
+        start = 0
+        for width in column_widths:
+            slices.append(slice(start, start + width))
+            start += width
+
+        self.slices: Tuple[slice, ...] = tuple(slices)
+
+        #: The sum of all the column widths.
+        self.width: int = start
+
+    def split(self, a_string) -> list:
+        """
+        Split `a_string` into columns. The len() of the returned list will
+        *always* equal the number of column widths in the plan.
+        """
+        return [a_string[s] for s in self.slices]
+
+
 def collimate(a_string, column_widths):
     """
     Split a list-type thing, like a string, into slices that are column_widths
     length.
 
     >>> collimate("a b1 c2345",[2,3,3,2])
-    ['a ','b1 ','c23','45']
+    ['a ', 'b1 ', 'c23', '45']
 
     Args:
         a_string: The string to split. This parameter can actually be anything
@@ -20,11 +54,4 @@ def collimate(a_string, column_widths):
         A list of slices. The len() of the returned list will *always* equal
         len(:column_widths:).
     """
-
-    if len(column_widths) == 0:
-        return []
-
-    width = column_widths[0]
-    element = a_string[:width]
-    rest = a_string[width:]
-    return [element] + collimate(rest, column_widths[1:])
+    return SlicePlan(column_widths).split(a_string)
@@ -0,0 +1,166 @@
+# pycmx
+# (c) 2026 Jamie Hardt
+
+from itertools import chain
+from typing import Callable, Dict, Generator, Iterable, Optional, TextIO, Union
+
+from .edit_list import EditList
+from .event_table import _EVENT_STATEMENT_TYPES, EventRow
+from .statements import (StmtCdlSat, StmtCdlSop, StmtFrmc,
+                         StmtRemark, StmtTitle, StmtUnrecognized, StmtFCM,
+                         StmtAudioExt, StmtClipName, StmtEffectsName,
+                         StmtEvent, StmtSourceFile, StmtSplitEdit)
+
+
+_SOURCE_FIELD_SIZES = {"3600": 8, "File32": 32, "File128": 128}
+
+
+def write_cmx3600(edit_list: Union[EditList, Iterable[object]], f: TextIO,
+                  format: Optional[str] = None):
+    """
+    Write an edit list to a file in CMX 3600 form. Lines are written to `f`
+    as they are formatted, so a streaming
+    :class:`~pycmx.edit_list.EditList` or a generator of statements can be
+    written without holding the whole list in memory.
+
+    Statements are written in a normalized form: whitespace and the
+    spelling of remarks may differ from the file the list was read from,
+    but reading the written file will produce the same statements. Corrupt
+    remarks are not written, because the parser doesn't keep their text.
+
+    :param edit_list: An :class:`~pycmx.edit_list.EditList`, or an iterable
+        of statements like the list returned by
+        :func:`~pycmx.parse_cmx_statements.parse_cmx3600_statements`.
+    :param TextIO f: The file to write to. Lines are terminated with "\\n",
+        open the file with `newline="\\r\\n"` to write CRLF line endings.
+    :param format: The width of the event source field: "3600", "File32"
+        or "File128". If `None`, each event is written with the source field
+        width it was read with.
+    :raises ValueError: if `format` is not valid or a source doesn't fit in
+        the source field.
+    """
+    f.writelines(f"{line}\n" for line in
+                 format_cmx3600_statements(edit_list, format))
+
+
+def format_cmx3600_statements(edit_list: Union[EditList, Iterable[object]],
+                              format: Optional[str] = None
+                              ) -> Generator[str, None, None]:
+    """
+    A generator for each line of an edit list in CMX 3600 form, without line
+    endings. The arguments are the same as :func:`write_cmx3600`.
+    """
+    if format is not None and format not in _SOURCE_FIELD_SIZES:
+        raise ValueError(f"Invalid EDL format \"{format}\"")
+
+    source_field_size = _SOURCE_FIELD_SIZES[format] \
+        if format is not None else None
+
+    if isinstance(edit_list, EditList):
+        statements: Iterable[object] = chain([edit_list.title_statement],
+                                             edit_list.event_statements)
+    else:
+        statements = edit_list
+
+    for stmt in statements:
+        if type(stmt) in _EVENT_STATEMENT_TYPES:
+            yield _format_event(stmt, source_field_size)
+        else:
+            # Statements without a formatter, like StmtCorruptRemark, which
+            # doesn't keep the text of its line, are skipped.
+            formatter = _FORMATTERS.get(type(stmt), None)
+            if formatter is not None:
+                yield formatter(stmt)
+
+
+def _format_event(stmt: Union[StmtEvent, EventRow],
+                  source_field_size: Optional[int]) -> str:
+    event = stmt.event
+    if not isinstance(event, str):
+        event = f"{event:03d}"
+
+    source = stmt.source
+    if source_field_size is None:
+        width = max(stmt.source_field_size, len(source))
+    elif len(source) > source_field_size:
+        raise ValueError(f"Source \"{source}\" is too long for a "
+                         f"{source_field_size}-character source field")
+    else:
+        width = source_field_size
+
+    return (f"{event}  {source:<{width}} {stmt.channels:<4}  "
+            f"{stmt.trans:<4} {stmt.trans_op:>3} {stmt.source_in} "
+            f"{stmt.source_out} {stmt.record_in} {stmt.record_out}")
+
+
+def _format_title(stmt: StmtTitle) -> str:
+    return f"TITLE: {stmt.title}"
+
+
+def _format_fcm(stmt: StmtFCM) -> str:
+    return "FCM: DROP FRAME" if stmt.drop else "FCM: NON-DROP FRAME"
+
+
+def _format_extended_audio_channels(stmt: StmtAudioExt) -> str:
+    return (f"AUD  {'3' if stmt.audio3 else ' '}    "
+            f"{'4' if stmt.audio4 else ''}").rstrip()
+
+
+def _format_clip_name(stmt: StmtClipName) -> str:
+    return f"* {stmt.affect.upper()} CLIP NAME:  {stmt.name}"
+
+
+def _format_source_file(stmt: StmtSourceFile) -> str:
+    return f"* SOURCE FILE: {stmt.filename}"
+
+
+def _format_cdl_sop(stmt: StmtCdlSop) -> str:
+    return f"*{stmt.line}"
+
+
+def _format_cdl_sat(stmt: StmtCdlSat) -> str:
+    # CDL values are usually written with four decimal places, more are used
+    # only if needed to represent the value exactly.
+    value = f"{stmt.value:.4f}"
+    if float(value) != stmt.value:
+        value = repr(stmt.value)
+
+    return f"*ASC_SAT {value}"
+
+
+def _format_frmc(stmt: StmtFrmc) -> str:
+    return (f"*FRMC START: {stmt.start}    FRMC END: {stmt.end}    "
+            f"FRMC DURATION: {stmt.duration}")
+
+
+def _format_remark(stmt: StmtRemark) -> str:
+    return f"* {stmt.text}"
+
+
+def _format_effects_name(stmt: StmtEffectsName) -> str:
+    return f"EFFECTS NAME IS {stmt.name}"
+
+
+def _format_split(stmt: StmtSplitEdit) -> str:
+    split_type = "VIDEO DELAY" if stmt.video else "AUDIO DELAY"
+    return f"SPLIT:    {split_type}=  {stmt.delay}"
+
+
+def _format_unrecognized(stmt: StmtUnrecognized) -> str:
+    return stmt.content
+
+
+_FORMATTERS: Dict[type, Callable[..., str]] = {
+    StmtTitle: _format_title,
+    StmtFCM: _format_fcm,
+    StmtAudioExt: _format_extended_audio_channels,
+    StmtClipName: _format_clip_name,
+    StmtSourceFile: _format_source_file,
+    StmtCdlSop: _format_cdl_sop,
+    StmtCdlSat: _format_cdl_sat,
+    StmtFrmc: _format_frmc,
+    StmtRemark: _format_remark,
+    StmtEffectsName: _format_effects_name,
+    StmtSplitEdit: _format_split,
+    StmtUnrecognized: _format_unrecognized,
+}
@@ -0,0 +1,51 @@
+from io import StringIO
+from unittest import TestCase, skipIf
+
+import pycmx
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestArrays(TestCase):
+
+    def test_to_arrays(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f)
+
+        arrays = edl.to_arrays(rate=24)
+        edits = arrays.edits
+        self.assertEqual(len(edits), sum(len(e.edits) for e in edl.events))
+
+        self.assertEqual(edits['event'][0], 1)
+        self.assertEqual(edits['record_in'][0], 86400)
+        self.assertEqual(edits['record_out'][0], 86592)
+        self.assertEqual(edits['channels'][0], 0b100)
+        self.assertEqual(edits['channels'][2], 1 << 7)
+        self.assertEqual(edits['line_number'][0], 2)
+        self.assertEqual(arrays.sources[edits['source_index'][0]], "OY_HEAD_")
+
+        dissolve = edl.event(43).edits[1]
+        row = edits[edits['line_number'] == dissolve.line_number][0]
+        self.assertEqual(row['transition'], pycmx.Transition.Dissolve)
+        self.assertEqual(row['effect_duration'],
+                         dissolve.transition.effect_duration)
+
+        durations = edits['record_out'] - edits['record_in']
+        self.assertTrue((durations >= 0).all())
+
+    def test_wide_channels(self):
+        line = "001  AX       {}   C        00:00:00:00 00:00:01:00 " \
+            "01:00:00:00 01:00:01:00"
+        text = "TITLE: T\n" + line.format('A63') + "\n"
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        self.assertEqual(edl.to_arrays(rate=24).edits['channels'][0],
+                         1 << 63)
+
+        text = "TITLE: T\n" + line.format('A70') + "\n"
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        with self.assertRaises(ValueError):
+            edl.to_arrays(rate=24)
@@ -0,0 +1,101 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import TestCase, skipIf
+
+import pycmx
+from pycmx.arrow import arrow_schema, iter_record_batches, write_parquet
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+@skipIf(pyarrow is None, "pyarrow is not installed")
+class TestArrow(TestCase):
+
+    files = ["TEST.edl", "test_edl_cdl.edl", "cdl_frmc_example02.edl"]
+
+    def _lists(self, streaming=False):
+        for fn in type(self).files:
+            with open("tests/edls/" + fn, 'r') as f:
+                yield pycmx.parse_cmx3600(f, streaming=streaming)
+
+    def test_to_arrow(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f)
+
+        table = edl.to_arrow(rate=24)
+        edits = [edit for event in edl.events for edit in event.edits]
+        self.assertEqual(table.num_rows, len(edits))
+        self.assertEqual(table.schema, arrow_schema())
+        self.assertTrue(pyarrow.types.is_dictionary(
+            table.schema.field('source').type))
+
+        rows = table.to_pylist()
+        self.assertEqual(rows[0]['event'], 1)
+        self.assertEqual(rows[0]['record_in'], 86400)
+        self.assertEqual(rows[0]['channels'], 0b100)
+        self.assertEqual(rows[0]['source'], "OY_HEAD_")
+        self.assertEqual(rows[0]['title'], edl.title)
+        for (row, edit) in zip(rows, edits):
+            self.assertEqual(row['clip_name'], edit.clip_name)
+            self.assertEqual(row['source_file'], edit.source_file)
+            self.assertEqual(row['transition'], edit.transition.kind)
+            self.assertEqual(row['line_number'], edit.line_number)
+
+    def test_cdl_frmc(self):
+        with open("tests/edls/cdl_frmc_example02.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f)
+
+        rows = edl.to_arrow(rate=24).to_pylist()
+        edits = [edit for event in edl.events for edit in event.edits]
+        for (row, edit) in zip(rows, edits):
+            sop = edit.asc_sop
+            self.assertEqual(row['sop_slope_red'],
+                             sop.slope.red if sop else None)
+            self.assertEqual(row['sop_power_blue'],
+                             sop.power.blue if sop else None)
+            self.assertEqual(row['sat'], edit.asc_sat)
+            framecounts = edit.framecounts
+            self.assertEqual(row['frmc_duration'],
+                             framecounts.duration if framecounts else None)
+
+        self.assertTrue(any(row['frmc_start'] is not None for row in rows))
+        self.assertTrue(any(row['sop_offset_green'] is not None
+                            for row in rows))
+
+    def test_batches(self):
+        total = sum(len(e.edits) for edl in self._lists()
+                    for e in edl.events)
+        batches = list(iter_record_batches(self._lists(streaming=True), 24,
+                                           batch_size=50))
+        self.assertEqual(sum(b.num_rows for b in batches), total)
+        self.assertTrue(all(b.num_rows <= 50 for b in batches))
+        self.assertEqual(batches[-1].column('list_index')[-1].as_py(),
+                         len(type(self).files) - 1)
+
+    def test_write_parquet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "edits.parquet")
+            rows = write_parquet(self._lists(streaming=True), path, 24,
+                                 batch_size=64)
+            table = pyarrow.parquet.read_table(path)
+
+        expected = pyarrow.Table.from_batches(
+            list(iter_record_batches(self._lists(), 24)))
+        self.assertEqual(rows, expected.num_rows)
+        self.assertEqual(table.to_pylist(), expected.to_pylist())
+
+    def test_wide_channels(self):
+        line = "001  AX       {}   C        00:00:00:00 00:00:01:00 " \
+            "01:00:00:00 01:00:01:00"
+        text = "TITLE: T\n" + line.format('A63') + "\n"
+        table = pycmx.parse_cmx3600(StringIO(text)).to_arrow(rate=24)
+        self.assertEqual(table.column('channels')[0].as_py(), 1 << 63)
+
+        text = "TITLE: T\n" + line.format('A70') + "\n"
+        with self.assertRaises(ValueError):
+            pycmx.parse_cmx3600(StringIO(text)).to_arrow(rate=24)
@@ -0,0 +1,83 @@
+import asyncio
+import random
+from io import StringIO
+from unittest import IsolatedAsyncioTestCase
+
+import pycmx
+from pycmx.parse_cmx_async import (aiter_cmx3600_events,
+                                   aiter_cmx3600_statements, aparse_cmx3600)
+from pycmx.parse_cmx_statements import parse_cmx3600_statements
+
+
+async def _chunks(data, sizes):
+    pos = 0
+    while pos < len(data):
+        size = sizes.randrange(1, 200)
+        yield data[pos:pos + size]
+        pos += size
+        await asyncio.sleep(0)
+
+
+class TestAsync(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            self.text = f.read()
+
+        self.expected = pycmx.parse_cmx3600(StringIO(self.text))
+
+    def _assert_events(self, events):
+        self.assertEqual(len(events), len(self.expected.events))
+        for (a, b) in zip(events, self.expected.events):
+            self.assertEqual(a.statements, b.statements)
+            self.assertEqual(a.number, b.number)
+            self.assertEqual(len(a.edits), len(b.edits))
+
+    async def test_stream_reader(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(self.text.encode("ascii"))
+        reader.feed_eof()
+
+        events = [e async for e in aiter_cmx3600_events(reader)]
+        self._assert_events(events)
+
+    async def test_events_before_eof(self):
+        lines = self.text.encode("ascii").splitlines(keepends=True)
+        reader = asyncio.StreamReader()
+        events = []
+
+        async def read():
+            async for event in aiter_cmx3600_events(reader):
+                events.append(event)
+
+        task = asyncio.ensure_future(read())
+        for line in lines[0:20]:
+            reader.feed_data(line)
+        await asyncio.sleep(0.01)
+        self.assertGreater(len(events), 0)
+
+        for line in lines[20:]:
+            reader.feed_data(line)
+        reader.feed_eof()
+        await task
+        self._assert_events(events)
+
+    async def test_chunks(self):
+        expected = parse_cmx3600_statements(StringIO(self.text))
+        for ending in ("\n", "\r\n", "\r"):
+            text = ending.join(self.text.splitlines())
+            for data in (text, text.encode("utf-8")):
+                statements = [s async for s in aiter_cmx3600_statements(
+                    _chunks(data, random.Random(1)))]
+                self.assertEqual(statements, expected)
+
+    async def test_encoding(self):
+        data = "TITLE: CAFÉ\n".encode("latin-1")
+        edl = await aparse_cmx3600(_chunks(data, random.Random(2)),
+                                   encoding="latin-1")
+        self.assertEqual(edl.title, "CAFÉ")
+
+    async def test_aparse(self):
+        edl = await aparse_cmx3600(_chunks(self.text, random.Random(3)))
+        self.assertEqual(edl.title, self.expected.title)
+        self.assertEqual(edl.event_statements, self.expected.event_statements)
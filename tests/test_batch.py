@@ -0,0 +1,79 @@
+import json
+import os
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+import pycmx
+from pycmx.batch import batch_cli, parse_many
+
+
+def _exit_worker(path, *args):
+    os._exit(1)
+
+
+class TestBatch(TestCase):
+
+    paths = ["tests/edls/TEST.edl",
+             "tests/edls/STP R1 v082517.edl",
+             "tests/edls/INS4_R1_DX_092117.edl",
+             "tests/edls/does_not_exist.edl"]
+
+    def test_parse_many(self):
+        for workers in [1, 2]:
+            results = {r.path: r for r in
+                       parse_many(type(self).paths, workers=workers)}
+            self.assertEqual(set(results), set(type(self).paths))
+
+            missing = results["tests/edls/does_not_exist.edl"]
+            self.assertIsInstance(missing.error, FileNotFoundError)
+            self.assertIsNone(missing.edit_list)
+
+            test = results["tests/edls/TEST.edl"]
+            self.assertIsNone(test.error)
+            self.assertEqual(len(test.edit_list.events), 120)
+
+    def test_summaries(self):
+        results = {r.path: r for r in
+                   parse_many(type(self).paths, workers=2, summaries=True)}
+        summary = results["tests/edls/TEST.edl"].summary
+        self.assertIsNone(results["tests/edls/TEST.edl"].edit_list)
+
+        with open("tests/edls/TEST.edl") as f:
+            edl = pycmx.parse_cmx3600(f)
+
+        self.assertEqual(summary.title, edl.title)
+        self.assertEqual(summary.event_count, 120)
+        self.assertEqual(summary.edit_count,
+                         sum(len(e.edits) for e in edl.events))
+        self.assertEqual(summary.channels, edl.channels.bitmask)
+
+    def test_broken_pool(self):
+        paths = type(self).paths[:2]
+        with patch("pycmx.batch._parse_path", _exit_worker):
+            results = list(parse_many(paths, workers=2))
+
+        self.assertEqual(set(r.path for r in results), set(paths))
+        for result in results:
+            self.assertIsInstance(result.error, BrokenProcessPool)
+            self.assertIsNone(result.edit_list)
+
+    def test_cli(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(batch_cli(["-j", "1", "tests/edls/TEST.edl"]),
+                             0)
+        record = json.loads(out.getvalue())
+        self.assertEqual(record["path"], "tests/edls/TEST.edl")
+        self.assertEqual(record["event_count"], 120)
+        self.assertEqual(record["title"], "DC7 R1_v8.2")
+
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(batch_cli(["tests/edls/does_not_exist.edl"]),
+                             1)
+        record = json.loads(out.getvalue())
+        self.assertEqual(record["path"], "tests/edls/does_not_exist.edl")
+        self.assertIn("FileNotFoundError", record["error"])
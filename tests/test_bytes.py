@@ -0,0 +1,105 @@
+import codecs
+import mmap
+from io import StringIO
+from unittest import TestCase, mock
+
+import pycmx
+from pycmx.parse_cmx_statements import detect_encoding
+
+
+class TestParseBytes(TestCase):
+
+    files = ["INS4_R1_010417.edl",
+             "STP R1 v082517.edl",
+             "ToD_R4_LOCK3.1_030618_Video.edl",
+             "TEST.edl",
+             "test_25.edl",
+             "cdl_frmc_example01.edl"]
+
+    def _assert_same(self, edl, expected):
+        self.assertEqual(edl.title_statement, expected.title_statement)
+        self.assertEqual(edl.event_statements, expected.event_statements)
+
+    def test_same_as_text(self):
+        for fn in self.files:
+            with open(f"tests/edls/{fn}", 'r') as f:
+                expected = pycmx.parse_cmx3600(f)
+
+            with open(f"tests/edls/{fn}", 'rb') as f:
+                data = f.read()
+
+            self._assert_same(pycmx.parse_cmx3600_bytes(data), expected)
+            self._assert_same(pycmx.parse_cmx3600_bytes(memoryview(data)),
+                              expected)
+
+    def test_mmap(self):
+        with open("tests/edls/adobe_dai109_test.txt", 'r',
+                  encoding='ISO-8859-1') as f:
+            expected = pycmx.parse_cmx3600(f)
+
+        with open("tests/edls/adobe_dai109_test.txt", 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertEqual(detect_encoding(m), "latin-1")
+                edl = pycmx.parse_cmx3600_bytes(m)
+                self._assert_same(edl, expected)
+                self.assertEqual(len(edl.events), 2839)
+
+    def test_detect_encoding(self):
+        text = "TITLE: {0} 1\r\n" \
+            "001  AX       V     C        00:00:00:00 00:00:01:00 " \
+            "01:00:00:00 01:00:01:00\r\n" \
+            "* FROM CLIP NAME:  {0}\r\n"
+
+        for (name, encoding, expected) in (("CAFÉ", "utf-8", "utf-8"),
+                                           ("カット", "shift_jis",
+                                            "shift_jis"),
+                                           ("niño", "latin-1", "latin-1")):
+            data = text.format(name).encode(encoding)
+            self.assertEqual(detect_encoding(data), expected)
+            edl = pycmx.parse_cmx3600_bytes(data)
+            self.assertEqual(edl.title, f"{name} 1")
+            self.assertEqual(edl.events[0].edits[0].clip_name, name)
+
+        self.assertEqual(detect_encoding(b"TITLE: A\n"), "ascii")
+        self.assertEqual(detect_encoding(b"\xff\xfeT\x00"), "utf-16")
+        with self.assertRaises(ValueError):
+            detect_encoding("TITLE: É\n".encode("latin-1"),
+                            encodings=("utf-8",))
+
+    def test_byte_order_marks(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            text = f.read()
+
+        expected = pycmx.parse_cmx3600_bytes(text.encode("ascii"))
+        for encoding in ("utf-8-sig", "utf-16", "utf-32"):
+            data = text.encode(encoding)
+            self.assertTrue(data.startswith((codecs.BOM_UTF8,
+                                             codecs.BOM_UTF16,
+                                             codecs.BOM_UTF32)))
+            self._assert_same(pycmx.parse_cmx3600_bytes(data), expected)
+
+    def test_explicit_encoding(self):
+        data = "TITLE: CAFÉ\n".encode("cp1252")
+        self.assertEqual(pycmx.parse_cmx3600_bytes(
+            data, encoding="cp1252").title, "CAFÉ")
+        with self.assertRaises(UnicodeDecodeError):
+            pycmx.parse_cmx3600_bytes(data, encoding="utf-8")
+
+    def test_streaming(self):
+        with open("tests/edls/TEST.edl", 'rb') as f:
+            data = f.read()
+
+        edl = pycmx.parse_cmx3600_bytes(data, streaming=True, compact=True)
+        self.assertEqual(len(list(edl.events)), 120)
+
+    def test_line_endings_across_chunks(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            lines = f.read().splitlines()
+
+        expected = pycmx.parse_cmx3600(StringIO("\n".join(lines)))
+        for size in (7, 64, 1000):
+            with mock.patch("pycmx.parse_cmx_statements._CHUNK_SIZE", size):
+                for ending in ("\n", "\r\n", "\r"):
+                    data = (ending.join(lines) + ending).encode("ascii")
+                    self._assert_same(pycmx.parse_cmx3600_bytes(data),
+                                      expected)
@@ -0,0 +1,113 @@
+import os
+import zlib
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from pycmx.cache import ParseCache
+
+
+class TestParseCache(TestCase):
+
+    def test_hit(self):
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+            with open("tests/edls/TEST.edl") as f:
+                first = cache.parse_cmx3600(f)
+
+            with patch("pycmx.parse_cmx_statements._parse_cmx3600_line") \
+                    as parse_line:
+                with open("tests/edls/TEST.edl") as f:
+                    second = cache.parse_cmx3600(f)
+
+                parse_line.assert_not_called()
+
+            self.assertEqual(len(second.events), 120)
+            self.assertEqual(first.event_statements, second.event_statements)
+
+            with open("tests/edls/TEST.edl") as f:
+                compact = cache.parse_cmx3600(f, compact=True)
+            self.assertEqual(compact.events[0].edits[0].record_out,
+                             "01:00:08:00")
+
+            # The tolerant flag is part of the key
+            with open("tests/edls/TEST.edl") as f:
+                cache.parse_cmx3600(f, tolerant=True)
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+            cache.clear()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_eviction(self):
+        files = ["TEST.edl", "STP R1 v082517.edl", "INS4_R1_010417.edl"]
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+            paths = []
+            for (age, fn) in enumerate(files):
+                with open("tests/edls/" + fn) as f:
+                    text = f.read()
+                    f.seek(0)
+                    cache.parse_cmx3600(f)
+
+                paths.append(cache._entry_path(text, False))
+                os.utime(paths[-1], (1000 + age, 1000 + age))
+
+            total = sum(os.path.getsize(p) for p in paths)
+            cache.max_bytes = total
+
+            # Reading TEST.edl makes it the most recently used
+            with open("tests/edls/TEST.edl") as f:
+                cache.parse_cmx3600(f)
+            with open("tests/edls/cdl_example01.edl") as f:
+                cache.parse_cmx3600(f)
+
+            self.assertTrue(os.path.exists(paths[0]))
+            self.assertFalse(os.path.exists(paths[1]))
+            self.assertLessEqual(
+                sum(e.stat().st_size for e in os.scandir(directory)),
+                cache.max_bytes)
+
+    def test_corrupt_entry(self):
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+            with open("tests/edls/TEST.edl") as f:
+                cache.parse_cmx3600(f)
+
+            (name,) = os.listdir(directory)
+            with open(os.path.join(directory, name), 'wb') as f:
+                f.write(b"garbage")
+
+            with open("tests/edls/TEST.edl") as f:
+                edl = cache.parse_cmx3600(f)
+            self.assertEqual(len(edl.events), 120)
+
+    def test_stale_entry(self):
+        # Entries pickled with classes that have since been renamed, moved
+        # or changed.
+        stale = [b"cpycmx.statements\nStmtGone\n.",
+                 b"cpycmx.gone\nStmtGone\n.",
+                 b"cpycmx.statements\nStmtTitle\n)R."]
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+            with open("tests/edls/TEST.edl") as f:
+                text = f.read()
+            path = cache._entry_path(text, False)
+
+            for data in stale:
+                with open(path, 'wb') as f:
+                    f.write(zlib.compress(data))
+
+                with open("tests/edls/TEST.edl") as f:
+                    edl = cache.parse_cmx3600(f)
+                self.assertEqual(len(edl.events), 120)
+
+    def test_definitions_in_key(self):
+        with TemporaryDirectory() as directory:
+            with open("tests/edls/TEST.edl") as f:
+                text = f.read()
+
+            path = ParseCache(directory)._entry_path(text, False)
+            with patch("pycmx.cache._definitions_hash",
+                       return_value="changed"):
+                self.assertNotEqual(
+                    ParseCache(directory)._entry_path(text, False), path)
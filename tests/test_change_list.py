@@ -0,0 +1,85 @@
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx.timecode import Timecode
+
+
+def _edl(*clips):
+    # Builds a list of cuts from (source, source in, duration) tuples, laid
+    # end to end from 01:00:00:00.
+    lines = ["TITLE: DIFF TEST\n", "FCM: NON-DROP FRAME\n"]
+    record = Timecode.parse("01:00:00:00", 24)
+    for (n, (source, source_in, duration)) in enumerate(clips):
+        start = Timecode.parse(source_in, 24)
+        lines.append(f"{n + 1:03d}  {source:<8} V     C        "
+                     f"{start} {start + duration} "
+                     f"{record} {record + duration}\n")
+        record = record + duration
+
+    return pycmx.parse_cmx3600(StringIO("".join(lines)))
+
+
+class TestDiff(TestCase):
+
+    def setUp(self):
+        self.clips = [("A001", "10:00:00:00", 48),
+                      ("A002", "11:00:00:00", 24),
+                      ("A003", "12:00:00:00", 72),
+                      ("A004", "13:00:00:00", 24)]
+
+    def test_identical(self):
+        self.assertEqual(pycmx.diff(_edl(*self.clips), _edl(*self.clips), 24),
+                         [])
+
+    def test_insert_and_delete(self):
+        new_clips = self.clips[0:1] + [("B001", "20:00:00:00", 12)] + \
+            self.clips[2:]
+        changes = pycmx.diff(_edl(*self.clips), _edl(*new_clips), 24)
+        self.assertEqual([c.kind for c in changes],
+                         ["delete", "insert", "shift", "shift"])
+        self.assertEqual(changes[0].old.source, "A002")
+        self.assertEqual(changes[1].new.source, "B001")
+        self.assertEqual(changes[2].record_in_delta, -12)
+        self.assertEqual(changes[2].record_out_delta, -12)
+
+    def test_trim(self):
+        new_clips = list(self.clips)
+        new_clips[1] = ("A002", "11:00:00:06", 30)
+        changes = pycmx.diff(_edl(*self.clips), _edl(*new_clips), 24)
+        self.assertEqual([c.kind for c in changes],
+                         ["trim", "shift", "shift"])
+        self.assertEqual(changes[0].source_in_delta, 6)
+        self.assertEqual(changes[0].source_out_delta, 12)
+        self.assertEqual(changes[0].record_in_delta, 0)
+        self.assertEqual(changes[0].record_out_delta, 6)
+        self.assertEqual(changes[1].record_in_delta, 6)
+
+    def test_move(self):
+        new_clips = [self.clips[3]] + self.clips[0:3]
+        changes = pycmx.diff(_edl(*self.clips), _edl(*new_clips), 24)
+        kinds = [c.kind for c in changes]
+        self.assertEqual(kinds.count("move"), 1)
+        self.assertEqual(kinds.count("shift"), 3)
+        move = changes[kinds.index("move")]
+        self.assertEqual(move.new.source, "A004")
+        self.assertEqual(move.record_in_delta, -144)
+
+    def test_repeated_sources(self):
+        old_clips = [("A001", "10:00:00:00", 24)] * 6
+        new_clips = old_clips[0:4]
+        changes = pycmx.diff(_edl(*old_clips), _edl(*new_clips), 24)
+        self.assertEqual([c.kind for c in changes],
+                         ["delete"] * 2)
+
+    def test_large_list(self):
+        clips = [(f"R{n % 50:03d}",
+                  str(Timecode(n * 100 + 864000, 24)), 24 + n % 5)
+                 for n in range(5000)]
+        new_clips = clips[0:2000] + clips[2100:4000] + clips[2000:2100] + \
+            clips[4000:]
+        changes = pycmx.diff(_edl(*clips), _edl(*new_clips), 24)
+        kinds = [c.kind for c in changes]
+        self.assertEqual(kinds.count("move"), 100)
+        self.assertEqual(kinds.count("insert"), 0)
+        self.assertEqual(kinds.count("delete"), 0)
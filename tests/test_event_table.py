@@ -0,0 +1,121 @@
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx.event_table import EventRow, LazyStmtEvent
+from pycmx.statements import StmtEvent
+
+
+class TestEventTable(TestCase):
+
+    files = ["INS4_R1_010417.edl",
+             "STP R1 v082517.edl",
+             "ToD_R4_LOCK3.1_030618_Video.edl",
+             "TEST.edl",
+             "test_edl_cdl.edl",
+             "cdl_frmc_example02.edl"
+             ]
+
+    fields = ['source', 'source_in', 'source_out', 'record_in',
+              'record_out', 'source_file', 'clip_name', 'line_number',
+              'asc_sop', 'framecounts']
+
+    def test_compact_matches(self):
+        for fn in type(self).files:
+            with open("tests/edls/" + fn, 'r') as f:
+                edl = pycmx.parse_cmx3600(f)
+            with open("tests/edls/" + fn, 'r') as f:
+                compact = pycmx.parse_cmx3600(f, compact=True)
+
+            self.assertEqual(compact.format, edl.format)
+            self.assertEqual(len(compact.events), len(edl.events))
+            for (e1, e2) in zip(edl.events, compact.events):
+                self.assertEqual(e1.number, e2.number)
+                self.assertEqual(len(e1.edits), len(e2.edits))
+                for (a, b) in zip(e1.edits, e2.edits):
+                    for field in type(self).fields:
+                        self.assertEqual(getattr(a, field),
+                                         getattr(b, field),
+                                         f"{field} in {fn}")
+
+                    self.assertEqual(a.channels.bitmask, b.channels.bitmask)
+                    self.assertEqual(a.transition.kind, b.transition.kind)
+                    self.assertEqual(a.transition.operand,
+                                     b.transition.operand)
+                    self.assertEqual(a._edit_statement.event,
+                                     b._edit_statement.event)
+
+    def test_rows(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, compact=True)
+
+        row = edl.events[0].edits[0]._edit_statement
+        self.assertIs(type(row), EventRow)
+        self.assertEqual(row.event, "001")
+        self.assertEqual(row.record_out, "01:00:08:00")
+        self.assertEqual(row.source_field_size, 8)
+        self.assertFalse(hasattr(row, "__dict__"))
+
+    def test_compact_wide_fields(self):
+        line = "{}  AX       A70   C        00:00:00:00 00:00:01:00 " \
+            "01:00:00:00 01:00:01:00"
+        for event in ["001", "1" * 25]:
+            text = f"TITLE: T\n{line.format(event)}\n"
+            edl = pycmx.parse_cmx3600(StringIO(text))
+            compact = pycmx.parse_cmx3600(StringIO(text), compact=True)
+            self.assertEqual(compact.event_statements[0].event, event)
+            self.assertEqual(compact.events[0].edits[0].channel_mask,
+                             edl.events[0].edits[0].channel_mask)
+            self.assertEqual(compact.events[0].edits[0].channel_mask,
+                             1 << 70)
+
+    def test_lazy_matches(self):
+        for fn in type(self).files + ["adobe_dai109_test.txt"]:
+            with open("tests/edls/" + fn, 'r', encoding='ISO-8859-1') as f:
+                edl = pycmx.parse_cmx3600(f)
+            with open("tests/edls/" + fn, 'r', encoding='ISO-8859-1') as f:
+                lazy = pycmx.parse_cmx3600(f, lazy=True)
+
+            self.assertEqual(len(lazy.event_statements),
+                             len(edl.event_statements))
+            for (a, b) in zip(edl.event_statements, lazy.event_statements):
+                if type(a) is StmtEvent:
+                    self.assertIs(type(b), LazyStmtEvent)
+                    for field in a._fields:
+                        self.assertEqual(getattr(a, field),
+                                         getattr(b, field),
+                                         f"{field} in {fn}")
+                else:
+                    self.assertEqual(a, b)
+
+            self.assertEqual([e.number for e in lazy.events],
+                             [e.number for e in edl.events])
+
+    def test_lazy_tolerant(self):
+        line = "001  AX123456 V     C             00:00:00:00 00:00:01:00 " \
+            "01:00:00:00 01:00:01:00"
+        edl = pycmx.parse_cmx3600(StringIO(f"TITLE: T\n{line}\n"),
+                                  lazy=True, tolerant=True)
+        stmt = edl.event_statements[0]
+        self.assertIs(type(stmt), StmtEvent)
+        self.assertEqual(stmt.source, "AX123456")
+
+    def test_lazy_truncated(self):
+        line = "002  AX       V     C        00:00:00:00 00:00:01:00 " \
+            "01:00:00:00 01:00:01:00"
+        lines = ["002  TRUNCATED LINE", "002  AX       V     C", line[:-8],
+                 "002  AX          C        00:00:00:00 00:00:01:00 "
+                 "01:00:00:00 01:00:01:00", line]
+        text = "TITLE: T\n" + "\n".join(lines) + "\n"
+        for tolerant in [False, True]:
+            eager = pycmx.parse_cmx3600(StringIO(text), tolerant=tolerant)
+            lazy = pycmx.parse_cmx3600(StringIO(text), lazy=True,
+                                       tolerant=tolerant)
+            self.assertEqual([type(s).__name__ for s in
+                              eager.event_statements],
+                             ["StmtUnrecognized"] * 4 + ["StmtEvent"])
+            self.assertEqual([type(s).__name__ for s in
+                              lazy.event_statements],
+                             ["StmtUnrecognized"] * 4 + ["LazyStmtEvent"])
+            self.assertEqual(lazy.event_statements[:4],
+                             eager.event_statements[:4])
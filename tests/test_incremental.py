@@ -0,0 +1,124 @@
+import random
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx.incremental import IncrementalParser
+
+
+class TestIncremental(TestCase):
+
+    def setUp(self):
+        with open("tests/edls/TEST.edl") as f:
+            self.text = f.read()
+
+        self.lines = StringIO(self.text).readlines()
+
+    def _assert_same(self, edl, text):
+        expected = pycmx.parse_cmx3600(StringIO(text))
+        self.assertEqual(edl.title_statement, expected.title_statement)
+        self.assertEqual(edl.event_statements, expected.event_statements)
+        self.assertEqual(len(edl.events), len(expected.events))
+        for (a, b) in zip(edl.events, expected.events):
+            self.assertEqual(a.statements, b.statements)
+
+    def test_change_in_place(self):
+        parser = IncrementalParser()
+        first = parser.update(self.text)
+        self.assertEqual(parser.lines_parsed, len(self.lines))
+        first_events = first.events
+
+        lines = list(self.lines)
+        lines[6] = lines[6].replace("01:04:24:06", "01:04:24:05")
+        text = "".join(lines)
+        second = parser.update(text)
+
+        self.assertEqual(parser.lines_parsed, 1)
+        self._assert_same(second, text)
+        self.assertIs(second.events[0], first_events[0])
+        self.assertIsNot(second.events[1], first_events[1])
+        self.assertIs(second.events[50], first_events[50])
+        self.assertEqual(second.events[1].edits[0].record_out, "01:04:24:05")
+
+    def test_insert_and_delete(self):
+        parser = IncrementalParser()
+        first = parser.update(self.text)
+        first_events = first.events
+
+        lines = list(self.lines)
+        lines.insert(5, "* A NEW REMARK\r\n")
+        text = "".join(lines)
+        second = parser.update(text)
+        self.assertEqual(parser.lines_parsed, 1)
+        self._assert_same(second, text)
+        self.assertIs(second.events[0].statements[0],
+                      first_events[0].statements[0])
+        self.assertEqual(second.events[50].edits[0].line_number,
+                         first_events[50].edits[0].line_number + 1)
+
+        del lines[10:14]
+        text = "".join(lines)
+        parser.update(text)
+        self.assertEqual(parser.lines_parsed, 0)
+        self._assert_same(parser.edit_list, text)
+
+        third = parser.update(self.text)
+        self._assert_same(third, self.text)
+
+    def test_untitled(self):
+        # Without a title line the first event line is read as the title,
+        # so a change to the first line has to regroup every event.
+        lines = ["006  AX       V     C        00:00:00:00 00:00:01:00 "
+                 "01:00:00:00 01:00:01:00\n",
+                 "* FROM CLIP NAME: CLIP\n",
+                 "003  AX       V     C        00:00:00:00 00:00:01:00 "
+                 "01:00:01:00 01:00:02:00\n",
+                 "002  AX       V     C        00:00:00:00 00:00:01:00 "
+                 "01:00:02:00 01:00:03:00\n",
+                 "* FROM CLIP NAME: CLIP\n",
+                 "007  AX       V     C        00:00:00:00 00:00:01:00 "
+                 "01:00:03:00 01:00:04:00\n",
+                 "004  AX       V     C        00:00:00:00 00:00:01:00 "
+                 "01:00:04:00 01:00:05:00\n"]
+        parser = IncrementalParser()
+        parser.update("".join(lines)).events
+
+        text = "".join(lines[3:])
+        edl = parser.update(text)
+        self._assert_same(edl, text)
+        self.assertEqual([[s.line_number for s in e.statements]
+                          for e in edl.events], [[1, 2], [3]])
+
+    def test_random_changes(self):
+        self._random_changes(list(self.lines), random.Random(1))
+
+    def test_random_changes_untitled(self):
+        lines = [line for line in self.lines if
+                 not line.startswith("TITLE:")]
+        self._random_changes(lines, random.Random(2))
+
+    def _random_changes(self, lines, rng):
+        parser = IncrementalParser()
+        parser.update("".join(lines)).events
+        replacements = ["FCM: DROP FRAME\r\n", "FCM: NON-DROP FRAME\r\n",
+                        "* REMARK\r\n", "\r\n"] + self.lines[2:40]
+
+        for _ in range(60):
+            # Changes at the start replace or shift the title.
+            position = rng.choice([0, rng.randrange(0, len(lines))])
+            action = rng.choice(["insert", "delete", "replace"])
+            count = rng.randint(1, 4)
+            new_lines = [rng.choice(replacements) for _ in range(count)]
+            if action == "insert":
+                lines[position:position] = new_lines
+            elif action == "delete" and len(lines) > count:
+                del lines[position:position + count]
+            else:
+                lines[position:position + count] = new_lines
+
+            text = "".join(lines)
+            edl = parser.update(text)
+            self._assert_same(edl, text)
+            expected = pycmx.parse_cmx3600(StringIO(text))
+            self.assertEqual([e.drop_frame for e in edl.events],
+                             [e.drop_frame for e in expected.events])
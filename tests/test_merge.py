@@ -0,0 +1,118 @@
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx import Timecode
+from pycmx.merge import iter_merged_statements
+from pycmx.write_cmx_statements import write_cmx3600
+
+
+def _reel(title, record_in, fcm="NON-DROP FRAME", events=2):
+    lines = [f"TITLE: {title}", f"FCM: {fcm}"]
+    sep = ";" if fcm == "DROP FRAME" else ":"
+    tc = Timecode.parse(record_in, 30, fcm == "DROP FRAME")
+    for i in range(events):
+        record_out = tc + 30
+        lines.append(f"{i + 1:03d}  {title:<8} V     C        "
+                     f"00:00:00:00 00:00:01:00 "
+                     f"{str(tc)[:8]}{sep}{str(tc)[9:]} "
+                     f"{str(record_out)[:8]}{sep}{str(record_out)[9:]}")
+        lines.append(f"* FROM CLIP NAME: {title} {i}")
+        tc = record_out
+    return pycmx.parse_cmx3600(StringIO("\n".join(lines) + "\n"))
+
+
+class TestMerge(TestCase):
+
+    def test_record_order(self):
+        reels = [_reel("R2", "02:00:00:00"), _reel("R1", "01:00:00:00"),
+                 _reel("R3", "03:00:00:00")]
+        merged = pycmx.merge(reels, 30)
+        self.assertEqual(merged.title, "R1")
+        self.assertEqual([e.number for e in merged.events], list(range(1, 7)))
+        self.assertEqual([e.edits[0].source for e in merged.events],
+                         ["R1", "R1", "R2", "R2", "R3", "R3"])
+        self.assertEqual([e.edits[0].clip_name for e in merged.events][:3],
+                         ["R1 0", "R1 1", "R2 0"])
+
+        statements = [merged.title_statement] + merged.event_statements
+        self.assertEqual([s.line_number for s in statements],
+                         list(range(len(statements))))
+
+    def test_offsets(self):
+        reels = [_reel("R1", "01:00:00:00"), _reel("R2", "01:00:00:00")]
+        merged = pycmx.merge(reels, 30, offsets=[
+            0, Timecode.parse("00:20:00:00", 30)], title="SHOW")
+        self.assertEqual(merged.title, "SHOW")
+        self.assertEqual([e.edits[0].record_in for e in merged.events],
+                         ["01:00:00:00", "01:00:01:00",
+                          "01:20:00:00", "01:20:01:00"])
+
+        # Reels are ordered after their offsets are applied.
+        merged = pycmx.merge(reels, 30, offsets=[3600 * 30, 0])
+        self.assertEqual([e.edits[0].source for e in merged.events],
+                         ["R2", "R2", "R1", "R1"])
+        self.assertEqual(merged.events[2].edits[0].record_out,
+                         "02:00:01:00")
+
+        with self.assertRaises(ValueError):
+            pycmx.merge(reels, 30, offsets=[0])
+        with self.assertRaises(ValueError):
+            pycmx.merge(reels, 30, offsets=[0, -3601 * 30])
+
+    def test_drop_frame(self):
+        reels = [_reel("R1", "00:59:59:00", "DROP FRAME"),
+                 _reel("R2", "02:00:00:00")]
+        merged = pycmx.merge(reels, 30, offsets=[2, 0])
+        edits = [e.edits[0] for e in merged.events]
+        self.assertEqual([e.record_in for e in edits],
+                         ["00:59:59;02", "01:00:00;02",
+                          "02:00:00:00", "02:00:01:00"])
+        self.assertTrue(edits[0].drop_frame)
+        self.assertFalse(edits[2].drop_frame)
+
+        out = StringIO()
+        write_cmx3600(iter_merged_statements(reels, 30), out)
+        written = pycmx.parse_cmx3600(StringIO(out.getvalue()))
+        self.assertEqual([e.edits[0].drop_frame for e in written.events],
+                         [True, True, False, False])
+
+    def test_streaming(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f)
+
+        reels = [edl] * 50
+        offsets = [i * 3600 * 24 for i in range(50)]
+        merged = pycmx.merge(reels, 24, offsets=offsets, streaming=True)
+        self.assertTrue(merged.streaming)
+        count = 0
+        for (i, event) in enumerate(merged.events):
+            self.assertEqual(event.number, i + 1)
+            count += 1
+        self.assertEqual(count, len(edl.events) * 50)
+
+        with self.assertRaises(TypeError):
+            with open("tests/edls/TEST.edl", 'r') as f:
+                pycmx.merge([pycmx.parse_cmx3600(f, streaming=True)], 24)
+
+    def test_source_lines(self):
+        text = ("TITLE: R1\n"
+                "001  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n"
+                "\n"
+                ">>> SOURCE AX AX 060a2b340101010101010f00-13-00-00-00-"
+                "{00000511-6f6e-53f5-060e2b347f7f2a80}\n"
+                "* FROM CLIP NAME: CLIP\n")
+        reel = pycmx.parse_cmx3600(StringIO(text))
+        self.assertIn(None, reel.event_statements)
+
+        # Blank lines are kept, ">>> SOURCE" lines are parsed to None and
+        # left out.
+        merged = pycmx.merge([reel], 30)
+        self.assertNotIn(None, merged.event_statements)
+        self.assertEqual([type(s).__name__ for s in merged.event_statements],
+                         ["StmtEvent", "StmtUnrecognized", "StmtClipName"])
+        self.assertEqual(merged.event_statements[1].content, "")
+        self.assertEqual([s.line_number for s in merged.event_statements],
+                         [1, 2, 3])
+        self.assertEqual(merged.events[0].edits[0].clip_name, "CLIP")
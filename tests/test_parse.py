@@ -1,6 +1,11 @@
+from io import StringIO
 from unittest import TestCase
 
 import pycmx
+from pycmx.channel_map import ChannelMap
+from pycmx.edit_list import EditList
+from pycmx.parse_cmx_statements import parse_cmx3600_statements
+from pycmx.statements import StmtEvent, StmtUnrecognized
 
 
 class TestParse(TestCase):
@@ -71,6 +76,41 @@ class TestParse(TestCase):
             self.assertTrue(events[2].edits[0].channels.get_audio_channel(7))
             self.assertTrue(events[2].edits[0].channels.audio)
 
+    def test_channel_map_defaults(self):
+        # Default-constructed maps used to share one audio channel set.
+        first = ChannelMap()
+        first.a3 = True
+        second = ChannelMap()
+        self.assertTrue(first.a3)
+        self.assertFalse(second.a3)
+        self.assertFalse(second.audio)
+
+    def test_channel_mask(self):
+        for fn in self.files:
+            with open(f"tests/edls/{fn}", 'r') as f:
+                edl = pycmx.parse_cmx3600(f)
+
+            union = pycmx.channel_map.ChannelMap()
+            for event in edl.events:
+                event_union = pycmx.channel_map.ChannelMap()
+                for edit in event.edits:
+                    expected = pycmx.channel_map.ChannelMap()
+                    expected._append_event(edit._edit_statement.channels)
+                    if edit._audio_ext is not None:
+                        expected._append_ext(edit._audio_ext)
+
+                    self.assertEqual(edit.channel_mask, expected.bitmask)
+                    self.assertEqual(edit.channels.bitmask, expected.bitmask)
+                    event_union = event_union | expected
+
+                self.assertEqual(event.channel_mask, event_union.bitmask)
+                union = union | event_union
+
+            self.assertEqual(edl.channel_mask, union.bitmask)
+            self.assertEqual(set(edl.channels.channels),
+                             set(union.channels))
+            self.assertEqual(edl.channels.video, union.video)
+
     def test_multi_edit_events(self):
         with open("tests/edls/TEST.edl", 'r') as f:
             edl = pycmx.parse_cmx3600(f)
@@ -176,3 +216,160 @@ class TestParse(TestCase):
                     self.assertEqual(frmc.start, 1001)
                     self.assertEqual(frmc.end, 1486)
                     self.assertEqual(frmc.duration, 486)
+
+    def test_streaming(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            expected = [e.number for e in pycmx.parse_cmx3600(f).events]
+
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, streaming=True)
+            self.assertTrue(edl.streaming)
+            self.assertEqual(edl.title, "DC7 R1_v8.2")
+            events = edl.events
+            first = next(events)
+            self.assertEqual(first.number, 1)
+            self.assertFalse(f.closed)
+            self.assertGreater(len(f.read()), 0,
+                               "streaming parse read the entire file")
+
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, streaming=True)
+            self.assertEqual([e.number for e in edl.events], expected)
+
+    def test_sequence_statements(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            statements = parse_cmx3600_statements(f)
+
+        expected = [e.number for e in EditList(statements).events]
+        # Tuples used to be read as a stream, which could only be read once.
+        for edl in [EditList(tuple(statements)),
+                    EditList(statements)]:
+            self.assertFalse(edl.streaming)
+            self.assertEqual([e.number for e in edl.events], expected)
+            self.assertEqual(edl.format, "3600")
+            self.assertEqual([e.number for e in edl.events], expected)
+
+        self.assertTrue(EditList(iter(statements)).streaming)
+
+    def test_streaming_metadata(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            expected = [e.number for e in pycmx.parse_cmx3600(f).events]
+
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, streaming=True)
+            self.assertEqual(edl.format, "3600")
+            self.assertEqual(edl.format, "3600")
+            self.assertEqual([e.number for e in edl.events], expected)
+
+            with self.assertRaises(TypeError):
+                edl.events
+            self.assertEqual(edl.format, "3600")
+
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, streaming=True)
+            next(edl.events)
+            with self.assertRaises(TypeError):
+                edl.format
+
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, streaming=True)
+            for caller in ["unrecognized_statements", "sources",
+                           "channel_mask", "channels"]:
+                with self.assertRaises(TypeError, msg=caller):
+                    getattr(edl, caller)
+
+            self.assertEqual([e.number for e in edl.events], expected)
+
+    def test_event_statement_pairing(self):
+        # The last event statement of an event with more than one statement
+        # used to be dropped, so an event after an FCM line lost its edit
+        # and a dissolve lost its incoming edit.
+        text = ("TITLE: PAIRING\n"
+                "FCM: NON-DROP FRAME\n"
+                "001  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n"
+                "002  AX       V     C        00:00:01:00 00:00:01:00 "
+                "01:00:01:00 01:00:01:00\n"
+                "002  BX       V     D    012 00:00:00:00 00:00:01:00 "
+                "01:00:01:00 01:00:02:00\n"
+                "003  CX       A     C        00:00:00:00 00:00:01:00 "
+                "01:00:02:00 01:00:03:00\n"
+                "AUD  3\n")
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        self.assertEqual([len(e.edits) for e in edl.events], [1, 2, 1])
+        self.assertEqual([e.source for e in edl.event(2).edits],
+                         ["AX", "BX"])
+        self.assertTrue(edl.event(3).edits[0].channels.get_audio_channel(3))
+
+    def test_truncated_event_lines(self):
+        line = ("001  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00")
+        statements = parse_cmx3600_statements(StringIO(f"TITLE: T\n{line}\n"))
+        self.assertEqual(statements[1],
+                         StmtEvent(event="001", source="AX", channels="V",
+                                   trans="C", trans_op="",
+                                   source_in="00:00:00:00",
+                                   source_out="00:00:01:00",
+                                   record_in="01:00:00:00",
+                                   record_out="01:00:01:00",
+                                   source_field_size=8, line_number=1))
+
+        # Lines without room for the source field used to be split into
+        # events with shifted fields, like a record out of ":00:00 00:0".
+        for length in [len(line) - 7, len(line) - 8, 60, 40, 18, 7]:
+            text = f"TITLE: T\n{line[:length]}\n"
+            statements = parse_cmx3600_statements(StringIO(text))
+            self.assertIs(type(statements[1]), StmtUnrecognized, length)
+
+            statements = parse_cmx3600_statements(StringIO(text),
+                                                  tolerant=True)
+            self.assertIsNot(type(statements[1]), StmtEvent, length)
+
+        tolerant = ("001  AX123456 V     C             00:00:00:00 "
+                    "00:00:01:00 01:00:00:00 01:00:01:00")
+        stmt = parse_cmx3600_statements(
+            StringIO(f"TITLE: T\n{tolerant[:-4]}\n"), tolerant=True)[1]
+        self.assertIs(type(stmt), StmtUnrecognized)
+
+    def test_unrecognized_statements(self):
+        text = ("TITLE: UNRECOGNIZED\n"
+                "001  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n"
+                "* FROM CLIP NAME: CLIP\n"
+                "* FRMC NOT FRAME COUNTS\n"
+                "JUNK\n")
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        # Statements other than StmtUnrecognized used to raise TypeError.
+        self.assertEqual([type(s).__name__ for s in
+                          edl.unrecognized_statements],
+                         ["StmtCorruptRemark", "StmtUnrecognized"])
+
+    def test_empty(self):
+        for streaming in [False, True]:
+            with self.assertRaises(ValueError):
+                pycmx.parse_cmx3600(StringIO(""), streaming=streaming)
+
+    def test_edits_cached(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f)
+            for event in edl.events:
+                edits = event.edits
+                self.assertIs(event.edits, edits)
+                self.assertEqual(
+                    [id(e) for e in edits], [id(e) for e in event.edits])
+
+    def test_event_table(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f)
+            self.assertEqual(len(edl.events), 120)
+            self.assertIs(edl.events, edl.events)
+            self.assertIs(edl.event(43), edl.events[42])
+            self.assertEqual(edl.event(43).number, 43)
+            self.assertIsNone(edl.event(1000))
+            self.assertEqual([e.number for e in edl.events[10:13]],
+                             [11, 12, 13])
+
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, streaming=True)
+            with self.assertRaises(TypeError):
+                edl.event(1)
@@ -0,0 +1,61 @@
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx.parse_stats import ParseStats
+
+
+class TestParseStats(TestCase):
+
+    def test_counts(self):
+        stats = ParseStats()
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, stats=stats)
+
+        statements = [edl.title_statement] + list(edl.event_statements)
+        self.assertEqual(stats.lines, len(statements))
+        self.assertEqual(sum(stats.statement_counts.values()), stats.lines)
+        for name in set(type(s).__name__ for s in statements):
+            self.assertEqual(stats.statement_counts[name],
+                             sum(1 for s in statements
+                                 if type(s).__name__ == name))
+            self.assertGreaterEqual(stats.statement_times[name], 0.0)
+
+        self.assertEqual(stats.event_form_errors, 0)
+        self.assertGreater(stats.grouping_time, 0.0)
+        self.assertEqual(stats.as_dict()["lines"], stats.lines)
+
+    def test_tolerant_fallbacks(self):
+        text = ("TITLE: TOLERANT\n"
+                "001  AX123456 V     C             00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n"
+                "002  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:01:00 01:00:02:00\n"
+                "003  NOT AN EVENT\n"
+                "JUNK\n")
+
+        stats = ParseStats()
+        pycmx.parse_cmx3600(StringIO(text), stats=stats)
+        self.assertEqual(stats.event_form_errors, 2)
+        self.assertEqual(stats.tolerant_fallbacks, 0)
+        self.assertEqual(stats.statement_counts["StmtUnrecognized"], 3)
+        self.assertAlmostEqual(stats.unrecognized_rate, 3 / 5)
+
+        stats = ParseStats()
+        pycmx.parse_cmx3600(StringIO(text), tolerant=True, stats=stats)
+        self.assertEqual(stats.event_form_errors, 2)
+        self.assertEqual(stats.tolerant_fallbacks, 1)
+        self.assertEqual(stats.tolerant_failures, 1)
+        self.assertEqual(stats.statement_counts["StmtEvent"], 2)
+
+    def test_streaming(self):
+        stats = ParseStats()
+        with open("tests/edls/TEST.edl", 'r') as f:
+            edl = pycmx.parse_cmx3600(f, streaming=True, stats=stats)
+            # Only the title is read before the events are.
+            self.assertEqual(stats.lines, 1)
+            events = list(edl.events)
+
+        self.assertEqual(len(events), 120)
+        self.assertGreater(stats.lines, 0)
+        self.assertEqual(stats.grouping_time, 0.0)
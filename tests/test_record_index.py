@@ -0,0 +1,71 @@
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx import Timecode
+from pycmx.channel_map import ChannelMap
+
+
+class TestRecordIndex(TestCase):
+
+    def setUp(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            self.edl = pycmx.parse_cmx3600(f)
+
+        self.edits = [edit for event in self.edl.events
+                      for edit in event.edits]
+
+    def _scan(self, start, end):
+        found = [e for e in self.edits
+                 if e.record_in_timecode(24) < end and
+                 e.record_out_timecode(24) > start]
+        return sorted(found, key=lambda e: e.record_in_timecode(24).frames)
+
+    def test_edits_at(self):
+        tc = Timecode.parse("01:08:56:10", rate=24)
+        found = self.edl.edits_at(tc)
+        self.assertEqual(set(map(id, found)),
+                         set(map(id, self._scan(tc, tc + 1))))
+        self.assertIn(self.edl.event(43).edits[1], found)
+        self.assertNotIn(self.edl.event(43).edits[0], found)
+
+        self.assertEqual(self.edl.edits_at(Timecode.parse("23:00:00:00", 24)),
+                         [])
+
+    def test_edits_between(self):
+        start = Timecode.parse("01:00:00:00", rate=24)
+        for length in [1, 24, 24 * 60, 24 * 60 * 30]:
+            for offset in range(0, 24 * 60 * 20, 24 * 37):
+                a = start + offset
+                b = a + length
+                self.assertEqual(
+                    set(map(id, self.edl.edits_between(a, b))),
+                    set(map(id, self._scan(a, b))))
+
+    def test_channels(self):
+        a = Timecode.parse("01:00:00:00", rate=24)
+        b = Timecode.parse("01:30:00:00", rate=24)
+        a7 = ChannelMap()
+        a7.set_audio_channel(7, True)
+
+        found = self.edl.edits_between(a, b, channels=a7)
+        self.assertGreater(len(found), 0)
+        for edit in found:
+            self.assertTrue(edit.channels.get_audio_channel(7))
+
+        self.assertIs(self.edl.record_index(24), self.edl.record_index(24))
+        with self.assertRaises(ValueError):
+            self.edl.record_index(24).edits_at(Timecode(0, 25))
+
+    def test_wide_channels(self):
+        text = ("TITLE: WIDE\n"
+                "001  AX       A70   C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n"
+                "002  BX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n")
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        tc = Timecode.parse("01:00:00:00", rate=24)
+        self.assertEqual([e.source for e in edl.edits_at(tc, 1 << 70)],
+                         ["AX"])
+        self.assertEqual([e.source for e in edl.edits_at(tc, 1)], ["BX"])
+        self.assertEqual(len(edl.edits_at(tc)), 2)
@@ -0,0 +1,108 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx.scene_list import (Scene, iter_scenes, scene_list, scene_list_cli,
+                              write_scene_list)
+
+
+class TestSceneList(TestCase):
+
+    path = "tests/edls/STP R1 v082517.edl"
+
+    def test_scenes(self):
+        with open(self.path) as f:
+            edl = pycmx.parse_cmx3600(f)
+
+        scenes = list(iter_scenes(edl))
+        self.assertGreater(len(scenes), 0)
+        for (a, b) in zip(scenes, scenes[1:]):
+            self.assertNotEqual(a.name, b.name)
+            self.assertLessEqual(a.record_out, b.record_in)
+
+        video_edits = [edit for event in edl.events for edit in event.edits
+                       if edit.channels.video and edit.clip_name is not None]
+        self.assertEqual(scenes[0].record_in, video_edits[0].record_in)
+        self.assertEqual(scenes[-1].record_out, video_edits[-1].record_out)
+
+    def test_pattern(self):
+        text = ("TITLE: SCENES\n"
+                "001  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n"
+                "* FROM CLIP NAME:  V12A-1\n"
+                "002  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:01:00 01:00:02:00\n"
+                "* FROM CLIP NAME:  v12b-3\n"
+                "003  AX       A     C        00:00:00:00 00:00:01:00 "
+                "01:00:02:00 01:00:03:00\n"
+                "* FROM CLIP NAME:  AUDIO\n"
+                "004  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:03:00 01:00:04:00\n"
+                "* FROM CLIP NAME:  TITLES\n")
+
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        self.assertEqual(list(iter_scenes(edl)),
+                         [Scene("12", "01:00:00:00", "01:00:02:00"),
+                          Scene("TITLES", "01:00:03:00", "01:00:04:00")])
+
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        self.assertEqual([s.name for s in iter_scenes(edl, r"v(\d+[a-z])")],
+                         ["12A", "12b", "TITLES"])
+
+    def test_write(self):
+        scenes = [Scene("12", "01:00:00:00", "01:00:02:00")]
+        out = StringIO()
+        write_scene_list(scenes, out, "cols")
+        self.assertEqual(out.getvalue(),
+                         "01:00:00:00 \t01:00:02:00 \t12\n")
+
+        out = StringIO()
+        write_scene_list(scenes, out, "cmx")
+        edl = pycmx.parse_cmx3600(StringIO(out.getvalue()))
+        self.assertEqual(edl.title, "SCENE LIST")
+        self.assertEqual(len(edl.events), 1)
+        self.assertEqual(edl.events[0].edits[0].clip_name, "12")
+
+        with self.assertRaises(ValueError):
+            write_scene_list(scenes, StringIO(), "xml")
+
+    def test_cmx_written_once(self):
+        out = StringIO()
+        with open(self.path) as f:
+            scene_list(f, out, "cmx")
+
+        self.assertEqual(out.getvalue().count("TITLE:"), 1)
+
+    def test_cli_cmx_written_once(self):
+        # "-f cmx" used to write the list twice, the second time after
+        # warning that the format was unrecognized.
+        with tempfile.TemporaryDirectory() as directory:
+            out_path = os.path.join(directory, "scenes.edl")
+            self.assertEqual(scene_list_cli(["-f", "cmx", "-o", out_path,
+                                             self.path]), 0)
+            with open(out_path) as f:
+                written = f.read()
+
+        with open(self.path) as f:
+            scenes = list(iter_scenes(pycmx.parse_cmx3600(f)))
+
+        self.assertEqual(written.count("TITLE:"), 1)
+        edl = pycmx.parse_cmx3600(StringIO(written))
+        self.assertEqual([e.edits[0].clip_name for e in edl.events],
+                         [s.name for s in scenes])
+
+    def test_cli_many(self):
+        paths = [self.path, "tests/edls/TEST.edl"]
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(scene_list_cli(["-j", "1", "-d", directory,
+                                             "-f", "cols"] + paths), 0)
+            for path in paths:
+                stem = os.path.splitext(os.path.basename(path))[0]
+                out_path = os.path.join(directory, stem + ".txt")
+                expected = StringIO()
+                with open(path) as f:
+                    scene_list(f, expected, "cols")
+                with open(out_path) as f:
+                    self.assertEqual(f.read(), expected.getvalue())
@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+import pycmx
+
+
+class TestSourceIndex(TestCase):
+
+    def setUp(self):
+        with open("tests/edls/STP R1 v082517.edl", 'r') as f:
+            self.edl = pycmx.parse_cmx3600(f)
+
+        self.edits = [edit for event in self.edl.events
+                      for edit in event.edits]
+
+    def test_group_by_source(self):
+        index = self.edl.source_index(24)
+        self.assertIs(index, self.edl.source_index(24))
+        self.assertEqual(sum(len(e.edits) for e in index.values()),
+                         len(self.edits))
+
+        for (name, entry) in index.items():
+            for edit in entry.edits:
+                self.assertEqual(edit.source, name)
+
+            for (a, b) in zip(entry.ranges, entry.ranges[1:]):
+                self.assertLess(a[1], b[0])
+
+            for edit in entry.edits:
+                source_in = edit.source_in_timecode(24)
+                source_out = edit.source_out_timecode(24)
+                self.assertTrue(any(r[0] <= source_in and source_out <= r[1]
+                                    for r in entry.ranges))
+
+    def test_handles(self):
+        plain = self.edl.source_index(24)
+        with_handles = self.edl.source_index(24, handles=48)
+        for (name, entry) in with_handles.items():
+            self.assertLessEqual(len(entry.ranges), len(plain[name].ranges))
+            self.assertEqual(entry.ranges[0][0].frames,
+                             max(0, plain[name].ranges[0][0].frames - 48))
+
+    def test_keys(self):
+        index = self.edl.source_index(24, key="clip_name")
+        self.assertIn("FKI_LEADER_HEAD_1920X1080.MOV", index)
+
+        with self.assertRaises(ValueError):
+            self.edl.source_index(24, key="record_in")
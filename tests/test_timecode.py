@@ -0,0 +1,69 @@
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx import Timecode
+
+
+class TestTimecode(TestCase):
+
+    def test_parse_format(self):
+        tc = Timecode.parse("01:00:08:00", rate=24)
+        self.assertEqual(tc.frames, 86592)
+        self.assertEqual(str(tc), "01:00:08:00")
+        self.assertEqual(tc.components, (1, 0, 8, 0))
+        self.assertEqual(str(Timecode(-25, 25)), "-00:00:01:00")
+
+        with self.assertRaises(ValueError):
+            Timecode.parse("01:00:08:24", rate=24)
+        with self.assertRaises(ValueError):
+            Timecode.parse("01:00:08", rate=24)
+        with self.assertRaises(ValueError):
+            Timecode(0, 24, drop=True)
+
+    def test_drop_frame(self):
+        tc = Timecode.parse("00:01:00;02", rate=30, drop=True)
+        self.assertEqual(tc.frames, 1800)
+        self.assertEqual(str(tc - 1), "00:00:59:29")
+        self.assertEqual(Timecode.parse("00:10:00:00", 30, True).frames,
+                         17982)
+        self.assertEqual(Timecode.parse("01:00:00:00", 30, True).frames,
+                         107892)
+        self.assertEqual(str(Timecode(107892, 30, True)), "01:00:00:00")
+
+        with self.assertRaises(ValueError):
+            Timecode.parse("00:01:00:00", rate=30, drop=True)
+
+    def test_arithmetic(self):
+        a = Timecode.parse("01:00:00:00", rate=25)
+        b = Timecode.parse("01:00:01:00", rate=25)
+        self.assertEqual((b - a).frames, 25)
+        self.assertEqual(a + 25, b)
+        self.assertEqual(25 + a, b)
+        self.assertTrue(a < b)
+        self.assertTrue(b >= a)
+        self.assertEqual(len({a, a + 0, b}), 2)
+
+        with self.assertRaises(ValueError):
+            a < Timecode(0, 24)
+
+    def test_edit_timecodes(self):
+        edl_text = ("TITLE: DF TEST\n"
+                    "FCM: DROP FRAME\n"
+                    "001  AX       V     C        "
+                    "00:00:00:00 00:01:00:02 01:00:00:00 01:01:00:02\n"
+                    "FCM: NON-DROP FRAME\n"
+                    "002  AX       V     C        "
+                    "00:00:00:00 00:01:00:02 01:00:00:00 01:01:00:02\n")
+
+        edl = pycmx.parse_cmx3600(StringIO(edl_text))
+        df_edit = edl.events[0].edits[0]
+        ndf_edit = edl.events[1].edits[0]
+
+        self.assertTrue(df_edit.drop_frame)
+        self.assertFalse(ndf_edit.drop_frame)
+        self.assertEqual(df_edit.source_out_timecode(30).frames, 1800)
+        self.assertEqual(ndf_edit.source_out_timecode(30).frames, 1802)
+        self.assertEqual((df_edit.record_out_timecode(30) -
+                          df_edit.record_in_timecode(30)).frames, 1800)
+        self.assertEqual(ndf_edit.source_in_timecode(24).frames, 0)
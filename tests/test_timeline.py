@@ -0,0 +1,82 @@
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx import Timecode
+
+
+class TestTimeline(TestCase):
+
+    def setUp(self):
+        with open("tests/edls/TEST.edl", 'r') as f:
+            self.edl = pycmx.parse_cmx3600(f)
+
+        self.edits = [edit for event in self.edl.events
+                      for edit in event.edits]
+
+    def _scan(self, channel, frame):
+        found = None
+        for edit in self.edits:
+            if edit.channel_mask & (1 << channel) and \
+                    edit.record_in_timecode(24).frames <= frame < \
+                    edit.record_out_timecode(24).frames:
+                found = edit
+        return found
+
+    def test_matches_scan(self):
+        timeline = self.edl.timeline(24)
+        self.assertIs(self.edl.timeline(24), timeline)
+        mask = 0
+        for edit in self.edits:
+            mask |= edit.channel_mask
+        self.assertEqual([t.channel for t in timeline.tracks],
+                         [c for c in range(mask.bit_length())
+                          if mask & (1 << c)])
+
+        frames = range(timeline.start - 2, timeline.end + 2, 7)
+        for track in timeline.tracks:
+            self.assertEqual(track.starts[0], timeline.start)
+            self.assertEqual(track.ends[-1], timeline.end)
+            self.assertEqual(list(track.starts[1:]), list(track.ends[:-1]))
+
+            found = track.edits_at(frames)
+            for (frame, edit) in zip(frames, found):
+                self.assertIs(edit, self._scan(track.channel, frame))
+
+    def test_dissolve(self):
+        event = self.edl.event(6)
+        (from_edit, to_edit) = event.edits
+        tc = Timecode.parse(to_edit.record_in, 24)
+        track = self.edl.timeline(24).audio(1)
+        self.assertIs(track.edit_at(tc), to_edit)
+        self.assertIs(track.edit_at(tc - 1), self._scan(1, tc.frames - 1))
+        with self.assertRaises(ValueError):
+            track.edit_at(Timecode.parse(to_edit.record_in, 25))
+
+    def test_gaps(self):
+        text = ("TITLE: GAPS\n"
+                "001  AX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:00:00 01:00:01:00\n"
+                "002  AX       A     C        00:00:00:00 00:00:03:00 "
+                "01:00:00:00 01:00:03:00\n"
+                "003  BX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:02:00 01:00:03:00\n"
+                "004  CX       V     C        00:00:00:00 00:00:01:00 "
+                "01:00:02:12 01:00:02:18\n")
+        edl = pycmx.parse_cmx3600(StringIO(text))
+        timeline = edl.timeline(24)
+        start = 24 * 60 * 60
+        self.assertEqual((timeline.start, timeline.end),
+                         (start, start + 72))
+        self.assertIsNone(timeline.audio(2))
+        self.assertEqual(len(timeline.audio(1)), 1)
+
+        segments = [(s - start, e - start, edit and edit.source)
+                    for (s, e, edit) in timeline.video.segments()]
+        self.assertEqual(segments, [(0, 24, "AX"), (24, 48, None),
+                                    (48, 60, "BX"), (60, 66, "CX"),
+                                    (66, 72, "BX")])
+
+        empty = pycmx.parse_cmx3600(StringIO("TITLE: EMPTY\n")).timeline(24)
+        self.assertEqual(empty.tracks, [])
+        self.assertIsNone(empty.video)
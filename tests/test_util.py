@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from pycmx.util import SlicePlan, collimate
+from pycmx.parse_cmx_statements import _edl_column_widths, _edl_slice_plan
+
+
+class TestSlicePlan(TestCase):
+
+    def test_split(self):
+        plan = SlicePlan([2, 3, 3, 2])
+        self.assertEqual(plan.width, 10)
+        self.assertEqual(plan.split("a b1 c2345"), ['a ', 'b1 ', 'c23', '45'])
+        self.assertEqual(plan.split("a b"), ['a ', 'b', '', ''])
+        self.assertEqual(collimate("a b1 c2345", [2, 3, 3, 2]),
+                         ['a ', 'b1 ', 'c23', '45'])
+
+    def test_edl_layouts(self):
+        for source_len in [8, 32, 128]:
+            for event_len in [3, 4, 6]:
+                line = "1" * event_len + "  " + "S" * source_len + \
+                    " V     C        00:00:00:00 00:00:01:00 " \
+                    "01:00:00:00 01:00:01:00"
+                plan = _edl_slice_plan(event_len, source_len)
+                self.assertIs(plan, _edl_slice_plan(event_len, source_len))
+                self.assertEqual(
+                    plan.width, sum(_edl_column_widths(event_len,
+                                                       source_len)))
+                self.assertEqual(plan.width, len(line))
+                columns = plan.split(line)
+                self.assertEqual(columns[0], "1" * event_len)
+                self.assertEqual(columns[2], "S" * source_len)
+                self.assertEqual(columns[4].strip(), "V")
+                self.assertEqual(columns[16], "01:00:01:00")
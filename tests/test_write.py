@@ -0,0 +1,70 @@
+import glob
+from io import StringIO
+from unittest import TestCase
+
+import pycmx
+from pycmx.parse_cmx_statements import parse_cmx3600_statements
+from pycmx.statements import StmtCorruptRemark, StmtEvent
+from pycmx.write_cmx_statements import (format_cmx3600_statements,
+                                        write_cmx3600)
+
+
+def _comparable(statements):
+    retval = []
+    for s in statements:
+        if s is None or type(s) is StmtCorruptRemark:
+            continue
+
+        fields = s._asdict()
+        del fields['line_number']
+        if type(s) is StmtEvent:
+            fields['event'] = int(fields['event'])
+        retval.append((type(s), fields))
+
+    return retval
+
+
+class TestWrite(TestCase):
+
+    def test_round_trip(self):
+        for path in sorted(glob.glob("tests/edls/*")):
+            for tolerant in [False, True]:
+                with open(path, 'r', encoding='ISO-8859-1') as f:
+                    statements = parse_cmx3600_statements(f, tolerant)
+
+                out = StringIO()
+                write_cmx3600(statements, out)
+                out.seek(0)
+                written = parse_cmx3600_statements(out, tolerant)
+
+                self.assertEqual(_comparable(statements),
+                                 _comparable(written), path)
+
+    def test_identical_lines(self):
+        with open("tests/edls/ISSUE_19_unusual01.edl") as f:
+            lines = [line.rstrip() for line in f]
+            f.seek(0)
+            edl = pycmx.parse_cmx3600(f)
+
+        self.assertEqual(list(format_cmx3600_statements(edl)), lines)
+
+    def test_formats(self):
+        with open("tests/edls/TEST.edl") as f:
+            edl = pycmx.parse_cmx3600(f, compact=True)
+
+        out = StringIO()
+        write_cmx3600(edl, out, format="File128")
+        out.seek(0)
+        wide = pycmx.parse_cmx3600(out)
+        self.assertEqual(wide.format, "File128")
+        self.assertEqual(len(wide.events), 120)
+        self.assertEqual(wide.events[0].edits[0].clip_name,
+                         "HEAD LEADER MONO")
+
+        with open("tests/edls/STP R1 v082517.edl") as f:
+            edl = pycmx.parse_cmx3600(f)
+
+        with self.assertRaises(ValueError):
+            write_cmx3600(edl, StringIO(), format="3600")
+        with self.assertRaises(ValueError):
+            write_cmx3600(edl, StringIO(), format="File64")